@@ -0,0 +1,34 @@
+"""add_symbol_validations_table
+
+Revision ID: a2c5e8f1d4b7
+Revises: f1b3d6a9c2e5
+Create Date: 2026-10-19 15:12:38.604217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c5e8f1d4b7'
+down_revision: Union[str, None] = 'f1b3d6a9c2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('symbol_validations',
+    sa.Column('symbol', sa.String(), nullable=False),
+    sa.Column('is_valid', sa.Boolean(), nullable=False),
+    sa.Column('detail', sa.Text(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('symbol')
+    )
+    op.create_index(op.f('ix_symbol_validations_expires_at'), 'symbol_validations', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_symbol_validations_expires_at'), table_name='symbol_validations')
+    op.drop_table('symbol_validations')
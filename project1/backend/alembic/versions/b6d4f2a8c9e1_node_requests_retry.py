@@ -0,0 +1,28 @@
+"""node_requests_retry
+
+Revision ID: b6d4f2a8c9e1
+Revises: a2c5e8f1d4b7
+Create Date: 2026-10-19 18:42:10.318554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d4f2a8c9e1'
+down_revision: Union[str, None] = 'a2c5e8f1d4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('node_requests', sa.Column('retry_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('node_requests', sa.Column('retry_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('node_requests', 'retry_at')
+    op.drop_column('node_requests', 'retry_count')
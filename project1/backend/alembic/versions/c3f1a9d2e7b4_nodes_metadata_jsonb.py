@@ -0,0 +1,58 @@
+"""nodes.metadata_json as JSONB with GIN index
+
+Revision ID: c3f1a9d2e7b4
+Revises: 8a9518267406
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a9d2e7b4'
+down_revision: Union[str, None] = '8a9518267406'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as text already, so only PostgreSQL needs a type change
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('nodes', 'metadata_json', server_default=None)
+    op.alter_column(
+        'nodes',
+        'metadata_json',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using="COALESCE(NULLIF(metadata_json, ''), '{}')::jsonb",
+    )
+    op.alter_column('nodes', 'metadata_json', server_default=sa.text("'{}'::jsonb"))
+    op.create_index(
+        'ix_nodes_metadata_json_gin',
+        'nodes',
+        ['metadata_json'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_nodes_metadata_json_gin', table_name='nodes', postgresql_using='gin')
+    op.alter_column('nodes', 'metadata_json', server_default=None)
+    op.alter_column(
+        'nodes',
+        'metadata_json',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='metadata_json::text',
+    )
+    op.alter_column('nodes', 'metadata_json', server_default='{}')
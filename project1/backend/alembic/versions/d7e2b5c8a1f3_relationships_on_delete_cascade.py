@@ -0,0 +1,55 @@
+"""relationships foreign keys ON DELETE CASCADE
+
+Revision ID: d7e2b5c8a1f3
+Revises: c3f1a9d2e7b4
+Create Date: 2026-10-19 10:02:17.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e2b5c8a1f3'
+down_revision: Union[str, None] = 'c3f1a9d2e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_COLUMNS = ('source_id', 'target_id')
+INDEXED_COLUMNS = ('id', 'source_id', 'target_id', 'type')
+
+
+def _relationships_table(ondelete: Union[str, None]) -> sa.Table:
+    """Table definition used to rebuild `relationships` on SQLite (no ALTER CONSTRAINT)."""
+    return sa.Table(
+        'relationships',
+        sa.MetaData(),
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('source_id', sa.String(), sa.ForeignKey('nodes.id', ondelete=ondelete), nullable=False),
+        sa.Column('target_id', sa.String(), sa.ForeignKey('nodes.id', ondelete=ondelete), nullable=False),
+        sa.Column('type', sa.String(), nullable=True),
+        sa.Column('strength', sa.Float(), nullable=True),
+        sa.Column('created_datetime', sa.DateTime(), nullable=True),
+    )
+
+
+def _set_ondelete(ondelete: Union[str, None]) -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table('relationships', recreate='always', copy_from=_relationships_table(ondelete)) as batch_op:
+            for column in INDEXED_COLUMNS:
+                batch_op.create_index(f'ix_relationships_{column}', [column], unique=False)
+        return
+    for column in FK_COLUMNS:
+        name = f'relationships_{column}_fkey'
+        op.drop_constraint(name, 'relationships', type_='foreignkey')
+        op.create_foreign_key(name, 'relationships', 'nodes', [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _set_ondelete('CASCADE')
+
+
+def downgrade() -> None:
+    _set_ondelete(None)
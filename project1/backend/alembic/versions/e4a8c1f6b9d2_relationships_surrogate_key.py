@@ -0,0 +1,76 @@
+"""relationships integer surrogate key with unique (source_id, target_id, type)
+
+Revision ID: e4a8c1f6b9d2
+Revises: d7e2b5c8a1f3
+Create Date: 2026-10-19 11:26:48.904311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8c1f6b9d2'
+down_revision: Union[str, None] = 'd7e2b5c8a1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXED_COLUMNS = ('source_id', 'target_id', 'type')
+
+
+def _create_relationships_table(name: str, id_column: sa.Column, *constraints) -> None:
+    op.create_table(name,
+    id_column,
+    sa.Column('source_id', sa.String(), nullable=False),
+    sa.Column('target_id', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False, server_default='works_with'),
+    sa.Column('strength', sa.Float(), nullable=True),
+    sa.Column('created_datetime', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['source_id'], ['nodes.id'], name='relationships_source_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['target_id'], ['nodes.id'], name='relationships_target_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    *constraints,
+    )
+
+
+def _swap_in(name: str) -> None:
+    for column in INDEXED_COLUMNS:
+        op.drop_index(f'ix_relationships_{column}', table_name='relationships')
+    op.drop_table('relationships')
+    op.rename_table(name, 'relationships')
+    for column in INDEXED_COLUMNS:
+        op.create_index(f'ix_relationships_{column}', 'relationships', [column], unique=False)
+
+
+def upgrade() -> None:
+    _create_relationships_table(
+        'relationships_new',
+        sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+        sa.UniqueConstraint('source_id', 'target_id', 'type', name='uq_relationships_source_target_type'),
+    )
+    # Keep one edge per (source, target, type); legacy rows may have NULL type
+    op.execute(
+        "INSERT INTO relationships_new (source_id, target_id, type, strength, created_datetime) "
+        "SELECT source_id, target_id, COALESCE(type, 'works_with'), strength, created_datetime "
+        "FROM relationships WHERE id IN ("
+        "SELECT MIN(id) FROM relationships GROUP BY source_id, target_id, COALESCE(type, 'works_with'))"
+    )
+    op.drop_index('ix_relationships_id', table_name='relationships')
+    _swap_in('relationships_new')
+
+
+def downgrade() -> None:
+    _create_relationships_table(
+        'relationships_old',
+        sa.Column('id', sa.String(), nullable=False),
+    )
+    # Restore the previous "{source_id}_{target_id}_{type}" string IDs
+    op.execute(
+        "INSERT INTO relationships_old (id, source_id, target_id, type, strength, created_datetime) "
+        "SELECT source_id || '_' || target_id || '_' || type, source_id, target_id, type, strength, created_datetime "
+        "FROM relationships"
+    )
+    _swap_in('relationships_old')
+    op.create_index('ix_relationships_id', 'relationships', ['id'], unique=False)
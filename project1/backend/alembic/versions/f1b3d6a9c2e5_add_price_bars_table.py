@@ -0,0 +1,36 @@
+"""add_price_bars_table
+
+Revision ID: f1b3d6a9c2e5
+Revises: e4a8c1f6b9d2
+Create Date: 2026-10-19 13:40:05.271883
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b3d6a9c2e5'
+down_revision: Union[str, None] = 'e4a8c1f6b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('price_bars',
+    sa.Column('symbol', sa.String(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('open', sa.Float(), nullable=True),
+    sa.Column('high', sa.Float(), nullable=True),
+    sa.Column('low', sa.Float(), nullable=True),
+    sa.Column('close', sa.Float(), nullable=False),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('symbol', 'date')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('price_bars')
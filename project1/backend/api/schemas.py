@@ -21,6 +21,7 @@ class GraphNodePayload(BaseModel):
     position: Dict[str, float] | None = None
     color: str | None = None
     data: Dict[str, Any] = Field(default_factory=dict)  # data.type should indicate node type (e.g., "company")
+    sparkline: str | None = None  # Base64 little-endian float32 closes, ~30 points (include=sparkline)
 
 
 class GraphEdgePayload(BaseModel):
@@ -28,6 +29,7 @@ class GraphEdgePayload(BaseModel):
     source: str
     target: str
     strength: float | None = None
+    correlation: float | None = None  # Daily-return correlation of the endpoints (include=correlation)
 
 
 class GraphResponse(BaseModel):
@@ -106,10 +108,21 @@ class MessageResponse(BaseModel):
     message: str
 
 
+class NodeBulkDeleteRequest(BaseModel):
+    """Request schema for deleting many nodes (and their edges) at once."""
+    ids: List[str] = Field(..., min_length=1, max_length=5000)
+
+
+class NodeBulkDeleteResponse(BaseModel):
+    deleted: List[str]
+    not_found: List[str]
+
+
 # Node Request Schemas
 class NodeRequestStatus(str, Enum):
     """Status enum for node requests."""
     PENDING = "pending"
+    PROCESSING = "processing"  # Claimed by an approval worker
     APPROVED = "approved"
     REJECTED = "rejected"
 
@@ -141,6 +154,26 @@ class NodeRequestResponse(BaseModel):
     updated_at: datetime | None = None
 
 
+class NodeRequestAcceptedResponse(BaseModel):
+    """Response for a queued node creation (202); poll GET /api/node-requests/{request_id}."""
+    request_id: int
+    status: NodeRequestStatus
+
+
+class NodeRequestBatchCreateRequest(BaseModel):
+    """Request schema for submitting many node requests at once (e.g. a watchlist)."""
+    requests: List[NodeCreateRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class NodeRequestBatchResponse(BaseModel):
+    """Decided requests, in submission order; duplicate node IDs were submitted once."""
+    results: List[NodeRequestResponse]
+    approved: int
+    rejected: int
+    pending: int  # left to the approval queue (symbol could not be validated now)
+    duplicates: List[str]
+
+
 class StockPoint(BaseModel):
     """A single data point in a stock price series."""
     dateLabel: str
@@ -149,7 +182,7 @@ class StockPoint(BaseModel):
 
 class ChartDataPoint(BaseModel):
     """A single data point for lightweight-charts."""
-    time: str  # Format: 'YYYY-MM-DD'
+    time: str | int  # 'YYYY-MM-DD' for daily bars, UNIX seconds for intraday bars
     value: float
 
 
@@ -167,5 +200,39 @@ class StockDataResponse(BaseModel):
     low: float
     series: List[StockPoint]  # For backward compatibility
     chart_data: List[ChartDataPoint]  # For lightweight-charts
+    range: str = "3M"  # Chart range actually served, e.g. '1D', '3M', '5Y'
+    interval: str = "1d"  # Bar interval of the chart, e.g. '5m', '1d', '1wk'
+
+
+class CompactQuote(BaseModel):
+    """Compact quote returned by the batch stock endpoints."""
+    symbol: str
+    price: float
+    previous_close: float | None = None
+    change: float
+    change_percent: float
+    volume: int | None = None
+    as_of: str  # Date of the latest bar, 'YYYY-MM-DD'
+    history: List[ChartDataPoint] | None = None  # Only with include_history=true
+
+
+class BatchQuoteResponse(BaseModel):
+    """Response schema for batch quotes."""
+    quotes: Dict[str, CompactQuote]
+    missing: List[str]  # Requested symbols without data
+
+
+class SymbolAnalytics(BaseModel):
+    """Return statistics of one company over the analytics window."""
+    volatility: float | None = None  # Annualized standard deviation of daily returns
+    beta: float | None = None  # Against AnalyticsResponse.benchmark
+    observations: int  # Daily returns available
 
 
+class AnalyticsResponse(BaseModel):
+    """Return analytics across all company nodes, recomputed once per trading day."""
+    as_of: str  # Trading day, 'YYYY-MM-DD'
+    benchmark: str  # Benchmark symbol for beta, or 'EQUAL_WEIGHT'
+    symbols: List[str]
+    metrics: Dict[str, SymbolAnalytics]
+    correlation: List[List[float | None]]  # Row/column order of `symbols`
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+KNOWN_USERS_MAX_ENTRIES = 10_000
+
+
+class KnownUsers:
+    """
+    Bounded LRU set of user IDs whose `users` row is known to exist.
+
+    Rows are never deleted by the app, so membership does not expire; an
+    evicted ID only costs one idempotent insert on its next request.
+    """
+
+    def __init__(self, max_entries: int = KNOWN_USERS_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._lock:
+            if user_id not in self._ids:
+                return False
+            self._ids.move_to_end(user_id)
+            return True
+
+    def add(self, user_id: str) -> None:
+        with self._lock:
+            self._ids[user_id] = None
+            self._ids.move_to_end(user_id)
+            while len(self._ids) > self._max_entries:
+                self._ids.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+
+known_users = KnownUsers()
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.auth.known_users import known_users
+from backend.auth.token_cache import verified_tokens
+from backend.database import get_session_factory
 from backend.repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
@@ -17,20 +19,47 @@ logger = logging.getLogger(__name__)
 # Security scheme for extracting Bearer token
 security = HTTPBearer()
 
+# Read once at import (the .env file is loaded by backend.database)
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+
+
+def _verify_token(token: str) -> dict:
+    """
+    Verified claims of `token`. Tokens seen before are answered from the
+    verified-token cache until their `exp`; others are fully verified.
+    """
+    claims = verified_tokens.get(token)
+    if claims is not None:
+        return claims
+    # Decode and verify JWT token using the JWT Secret
+    # Verify signature and expiration, but skip audience and issuer verification
+    claims = jwt.decode(
+        token,
+        SUPABASE_JWT_SECRET,
+        algorithms=["HS256"],
+        options={
+            "verify_signature": True,
+            "verify_exp": True,
+            "verify_aud": False,
+            "verify_iss": False,
+        }
+    )
+    verified_tokens.put(token, claims)
+    return claims
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
 ) -> dict:
     """
     Verify JWT token and return user information.
-    Automatically creates user record in database on first login.
+    Automatically creates user record in database on first login; only then is
+    a database session opened (and closed straight after the insert).
     """
     token = credentials.credentials
     
-    # Get JWT Secret from environment variables
-    jwt_secret = os.getenv("SUPABASE_JWT_SECRET")
-    if not jwt_secret:
+    if not SUPABASE_JWT_SECRET:
         logger.error("SUPABASE_JWT_SECRET not configured")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -38,19 +67,7 @@ def get_current_user(
         )
     
     try:
-        # Decode and verify JWT token using the JWT Secret
-        # Verify signature and expiration, but skip audience and issuer verification
-        payload = jwt.decode(
-            token,
-            jwt_secret,
-            algorithms=["HS256"],
-            options={
-                "verify_signature": True,
-                "verify_exp": True,
-                "verify_aud": False,
-                "verify_iss": False,
-            }
-        )
+        payload = _verify_token(token)
         
         user_id = payload.get("sub")
         user_email = payload.get("email") or ""
@@ -62,10 +79,12 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Sync user to database (create if first login)
+        # Sync user to database (create if first login); known users skip the table entirely
         try:
-            user_repo = UserRepository(db)
-            user_repo.get_or_create_user(user_id, user_email)
+            if user_id not in known_users:
+                with session_factory() as db:
+                    UserRepository(db).ensure_user(user_id, user_email)
+                known_users.add(user_id)
         except Exception as e:
             logger.error(f"Failed to sync user to database: {str(e)}", exc_info=True)
             # Don't fail authentication if user sync fails, but log the error
@@ -100,13 +119,13 @@ def get_current_user(
 
 def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
 ) -> Optional[dict]:
     """
     Optionally verify JWT token and return user information.
     
     This dependency can be used when authentication is optional.
-    Returns None if no token is provided.
+    Returns None if no token is provided (without touching the database).
     
     Example:
         @app.get("/api/optional-auth")
@@ -119,7 +138,7 @@ def get_optional_user(
         return None
     
     try:
-        return get_current_user(credentials, db)
+        return get_current_user(credentials, session_factory)
     except HTTPException:
         return None
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from backend.database.config import get_db, init_db
+from backend.database.config import get_db, get_read_db, get_session_factory, init_db
 from backend.database.models import NodeModel, RelationshipModel
 
-__all__ = ["get_db", "init_db", "NodeModel", "RelationshipModel"]
+__all__ = ["get_db", "get_read_db", "get_session_factory", "init_db", "NodeModel", "RelationshipModel"]
 
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, List
 from urllib.parse import quote_plus
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
+from backend.database.routing import ReadRouter, request_client_key
+
 # Load environment variables from .env file
 # Try loading from backend directory first, then project root
 env_path = Path(__file__).parent.parent / ".env"
@@ -139,13 +142,77 @@ if is_postgresql:
 # Create engine with appropriate settings
 engine = create_engine(DATABASE_URL, **engine_kwargs)
 
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Connect hook: SQLite ignores foreign keys (and ON DELETE CASCADE) unless enabled per connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if "sqlite" in DATABASE_URL:
+    event.listen(engine, "connect", enable_sqlite_foreign_keys)
+
+
+def get_replica_urls() -> List[str]:
+    """Optional read replicas, comma-separated in DATABASE_REPLICA_URLS."""
+    raw = os.getenv("DATABASE_REPLICA_URLS", "")
+    return [url.strip() for url in raw.split(",") if url.strip()]
+
+
+# Read replicas share the primary's connection/pool settings
+replica_engines = [create_engine(url, **engine_kwargs) for url in get_replica_urls()]
+if replica_engines:
+    logger.info(f"✓ Routing read-only endpoints across {len(replica_engines)} replica(s)")
+
+read_router = ReadRouter(
+    engine,
+    replica_engines,
+    sticky_seconds=float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5")),
+)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency for getting database session."""
-    db = SessionLocal()
+@event.listens_for(SessionLocal, "after_commit")
+def _mark_client_write(session: Session) -> None:
+    # Runs at commit time, i.e. before the response reaches the client
+    read_router.mark_write(session.info.get("client_key"))
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Dependency for code that only sometimes needs the database (e.g. auth).
+
+    Callers open a short-lived session only when they actually query, so
+    requests that never do hold no session or pooled connection.
+    """
+    return SessionLocal
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency for getting a primary (read-write) database session.
+
+    Sessions are lazy: a pooled connection is checked out on the first query,
+    not when the dependency runs.
+    """
+    db = SessionLocal(info={"client_key": request_client_key(request)})
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency for read-only endpoints.
+
+    Uses a replica when DATABASE_REPLICA_URLS is set, except shortly after the
+    same client wrote through get_db (read-your-writes).
+    """
+    db = SessionLocal(bind=read_router.engine_for_read(request_client_key(request)))
     try:
         yield db
     finally:
@@ -4,7 +4,22 @@ import json
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -14,6 +29,9 @@ from backend.domain.node_schema import NODE_FIELDS
 
 Base = declarative_base()
 
+# Node metadata: native JSONB on PostgreSQL (GIN-indexable), JSON on SQLite.
+MetadataJSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class NodeModel(Base):
     """
@@ -32,25 +50,37 @@ class NodeModel(Base):
     description = Column(Text, nullable=False)
     sector = Column(String, nullable=True, index=True)
     color = Column(String, nullable=True)
-    metadata_json = Column(Text, nullable=False, default="{}")
+    metadata_json = Column(MetadataJSON, nullable=False, default=dict)
+
+    # GIN index for containment (@>) metadata filters; PostgreSQL only
+    __table_args__ = (
+        Index(
+            "ix_nodes_metadata_json_gin",
+            "metadata_json",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Relationships
+    # passive_deletes: edges are removed by the database (ON DELETE CASCADE),
+    # so deleting a node never loads its edge collections
     source_relationships = relationship(
         "RelationshipModel",
         foreign_keys="RelationshipModel.source_id",
         back_populates="source_node",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     target_relationships = relationship(
         "RelationshipModel",
         foreign_keys="RelationshipModel.target_id",
         back_populates="target_node",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
-        metadata = json.loads(self.metadata_json) if self.metadata_json else {}
         return {
             "id": self.id,
             "type": self.type,
@@ -58,19 +88,27 @@ class NodeModel(Base):
             "description": self.description,
             "sector": self.sector,
             "color": self.color,
-            "metadata": metadata,
+            "metadata": self.metadata_json or {},
         }
 
 
 class RelationshipModel(Base):
-    """SQLAlchemy model for Relationship entity."""
+    """
+    SQLAlchemy model for Relationship entity.
+
+    Identity is (source_id, target_id, type), enforced by a composite unique index;
+    `id` is a compact integer surrogate key.
+    """
 
     __tablename__ = "relationships"
+    __table_args__ = (
+        UniqueConstraint("source_id", "target_id", "type", name="uq_relationships_source_target_type"),
+    )
 
-    id = Column(String, primary_key=True, index=True)
-    source_id = Column(String, ForeignKey("nodes.id"), nullable=False, index=True)
-    target_id = Column(String, ForeignKey("nodes.id"), nullable=False, index=True)
-    type = Column(String, nullable=True, index=True, default='works_with')  # e.g., "owns", "partners_with", "competes_with"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_id = Column(String, ForeignKey("nodes.id", ondelete="CASCADE"), nullable=False, index=True)
+    target_id = Column(String, ForeignKey("nodes.id", ondelete="CASCADE"), nullable=False, index=True)
+    type = Column(String, nullable=False, index=True, default='works_with', server_default='works_with')  # e.g., "owns", "partners_with", "competes_with"
     strength = Column(Float, nullable=True)
     created_datetime = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))
 
@@ -81,7 +119,7 @@ class RelationshipModel(Base):
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         result: Dict[str, Any] = {
-            "id": self.id,
+            "id": str(self.id),
             "source_id": self.source_id,
             "target_id": self.target_id,
             "type": self.type,
@@ -123,7 +161,7 @@ class NodeRequestModel(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     requestor_id = Column(String, nullable=False, index=True)
-    status = Column(String, nullable=False, index=True, default="pending")  # 'pending', 'approved', 'rejected'
+    status = Column(String, nullable=False, index=True, default="pending")  # 'pending', 'processing', 'approved', 'rejected'
     node_id = Column(String, nullable=False, index=True)
     node_type = Column(String, nullable=False, index=True)
     label = Column(String, nullable=False)
@@ -136,6 +174,9 @@ class NodeRequestModel(Base):
     rejection_reason = Column(Text, nullable=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    # Requests the provider could not validate go back to 'pending' and are not claimed before retry_at
+    retry_count = Column(Integer, nullable=False, default=0, server_default='0')
+    retry_at = Column(DateTime, nullable=True)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
@@ -156,4 +197,30 @@ class NodeRequestModel(Base):
             "rejection_reason": self.rejection_reason,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
\ No newline at end of file
+        }
+
+
+class PriceBarModel(Base):
+    """SQLAlchemy model for a daily OHLC bar in the local price history store."""
+
+    __tablename__ = "price_bars"
+
+    symbol = Column(String, primary_key=True)
+    date = Column(Date, primary_key=True)
+    open = Column(Float, nullable=True)
+    high = Column(Float, nullable=True)
+    low = Column(Float, nullable=True)
+    close = Column(Float, nullable=False)
+    volume = Column(BigInteger, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+
+class SymbolValidationModel(Base):
+    """SQLAlchemy model for a cached ticker validation result (approval workflow)."""
+
+    __tablename__ = "symbol_validations"
+
+    symbol = Column(String, primary_key=True)
+    is_valid = Column(Boolean, nullable=False)
+    detail = Column(Text, nullable=True)  # Company name when valid, rejection reason otherwise
+    expires_at = Column(DateTime, nullable=False, index=True)  # Naive UTC
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from fastapi import Request
+from sqlalchemy.engine import Engine
+
+
+def request_client_key(request: Request) -> Optional[str]:
+    """Identify the client for stickiness: bearer token if present, else remote address."""
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+    return request.client.host if request.client else None
+
+
+class ReadRouter:
+    """
+    Chooses the engine for read-only sessions.
+
+    Reads go to a random replica unless the client wrote recently, in which case
+    they stay on the primary for `sticky_seconds` (read-your-writes). Stickiness
+    is tracked per process; with several workers a client may still hit a
+    replica from another worker inside the window.
+    """
+
+    # Prune expired stickiness entries once the map grows past this size
+    _PRUNE_THRESHOLD = 1024
+
+    def __init__(self, primary: Engine, replicas: Sequence[Engine] = (), sticky_seconds: float = 5.0) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.sticky_seconds = sticky_seconds
+        self._recent_writes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark_write(self, client_key: Optional[str]) -> None:
+        """Pin the client's reads to the primary for the stickiness window."""
+        if not self.replicas or not client_key:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._recent_writes[client_key] = now + self.sticky_seconds
+            if len(self._recent_writes) > self._PRUNE_THRESHOLD:
+                self._recent_writes = {
+                    key: until for key, until in self._recent_writes.items() if until > now
+                }
+
+    def engine_for_read(self, client_key: Optional[str]) -> Engine:
+        if not self.replicas:
+            return self.primary
+        if client_key:
+            until = self._recent_writes.get(client_key)
+            if until is not None and until > time.monotonic():
+                return self.primary
+        return random.choice(self.replicas)
@@ -6,14 +6,14 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from backend.auth import get_current_user
-from backend.database import get_db, init_db
+from backend.database import get_db, get_read_db, init_db
 from backend.repositories import DatabaseGraphRepository, GraphRepositoryProtocol
 from backend.repositories.user_repository import UserRepository
 from backend.services import GraphService, GraphServiceProtocol
 
 
-def get_graph_repository(db: Session = Depends(get_db)) -> GraphRepositoryProtocol:
-    """Get database repository instance."""
+def get_graph_repository(db: Session = Depends(get_read_db)) -> GraphRepositoryProtocol:
+    """Get read-only database repository instance (replica-routed)."""
     return DatabaseGraphRepository(db)
 
 
@@ -34,10 +34,15 @@ def get_graph_service() -> GraphServiceProtocol:
     return GraphService(MockGraphRepository())
 
 
-def get_graph_service_from_db(db: Session = Depends(get_db)) -> GraphServiceProtocol:
-    """Get graph service instance with database repository."""
+def get_graph_service_from_db(db: Session = Depends(get_read_db)) -> GraphServiceProtocol:
+    """
+    Get graph service instance with a read-only (replica-routed) database repository.
+
+    The session is closed after each service call, returning its connection to
+    the pool while the endpoint goes on to serialize or await market data.
+    """
     repository = DatabaseGraphRepository(db)
-    return GraphService(repository)
+    return GraphService(repository, release=db.close)
 
 
 # Optional: Authenticated versions of dependencies
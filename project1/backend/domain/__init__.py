@@ -1,6 +1,7 @@
 """Domain models for the node relationship graph."""
 
-from .models import Node, NodeDetail, GraphSnapshot, Relationship, User, NodeRequest
+from .filters import MetadataFilter, parse_metadata_filter
+from .models import Node, NodeDetail, GraphSnapshot, Relationship, User, NodeRequest, PriceBar, IntradayBar, Quote, SymbolInfo
 from .node_schema import NODE_FIELDS, NODE_FIELD_NAMES, get_field_by_name
 from .schema_utils import (
     validate_schema_consistency,
@@ -16,6 +17,12 @@ __all__ = [
     "Relationship",
     "User",
     "NodeRequest",
+    "PriceBar",
+    "IntradayBar",
+    "Quote",
+    "SymbolInfo",
+    "MetadataFilter",
+    "parse_metadata_filter",
     "NODE_FIELDS",
     "NODE_FIELD_NAMES",
     "get_field_by_name",
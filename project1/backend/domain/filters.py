@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal, Mapping, Union
+
+MetadataOperator = Literal["eq", "ne", "gt", "gte", "lt", "lte"]
+METADATA_OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte")
+
+
+@dataclass(frozen=True)
+class MetadataFilter:
+    """
+    A single predicate on a node metadata key, e.g. ``marketCap > 500``.
+
+    Parsed from query strings of the form ``key:op:value`` (``marketCap:gt:500``).
+    Repositories push these into SQL; ``matches`` is the in-memory equivalent.
+    """
+
+    key: str
+    op: MetadataOperator
+    value: Union[float, str]
+
+    @property
+    def is_numeric(self) -> bool:
+        return isinstance(self.value, float)
+
+    def matches(self, metadata: Mapping[str, object]) -> bool:
+        """
+        Evaluate the filter against a metadata mapping. Missing keys never match,
+        and numeric filters only match numbers (not numeric strings or booleans).
+        """
+        if self.key not in metadata or metadata[self.key] is None:
+            return False
+        raw = metadata[self.key]
+        if self.is_numeric:
+            if isinstance(raw, bool) or not isinstance(raw, (int, float)):
+                return False
+            actual: Union[float, str] = float(raw)
+        else:
+            actual = str(raw)
+        expected = self.value
+        if self.op == "eq":
+            return actual == expected
+        if self.op == "ne":
+            return actual != expected
+        if self.op == "gt":
+            return actual > expected  # type: ignore[operator]
+        if self.op == "gte":
+            return actual >= expected  # type: ignore[operator]
+        if self.op == "lt":
+            return actual < expected  # type: ignore[operator]
+        return actual <= expected  # type: ignore[operator]
+
+
+def parse_metadata_filter(expression: str) -> MetadataFilter:
+    """
+    Parse ``key:op:value`` into a MetadataFilter.
+
+    Values that parse as numbers are compared numerically, everything else as text.
+    Raises ValueError for malformed expressions.
+    """
+    parts = expression.split(":", 2)
+    if len(parts) != 3 or not parts[0] or parts[2] == "":
+        raise ValueError(f"Invalid metadata filter '{expression}', expected 'key:op:value'")
+    key, op, raw_value = parts
+    op = op.lower()
+    if op not in METADATA_OPERATORS:
+        raise ValueError(
+            f"Invalid metadata filter operator '{op}', expected one of {', '.join(METADATA_OPERATORS)}"
+        )
+    value: Union[float, str]
+    try:
+        value = float(raw_value)
+    except ValueError:
+        if op not in ("eq", "ne"):
+            raise ValueError(f"Metadata filter '{expression}' needs a numeric value for '{op}'")
+        value = raw_value
+    return MetadataFilter(key=key, op=op, value=value)  # type: ignore[arg-type]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Iterable, List, Literal, Mapping, Optional, Tuple
 
 # ⚠️ 重要：Node 字段定义应该与 node_schema.py 保持一致！
@@ -14,9 +14,9 @@ MutableScalarMap = Dict[str, object]
 
 @dataclass(frozen=True)
 class Relationship:
-    """A directional edge between two nodes."""
+    """A directional edge between two nodes, unique per (source_id, target_id, type)."""
 
-    id: str
+    id: str  # Surrogate key (integer in the database, exposed as a string)
     source_id: str
     target_id: str
     type: str  # e.g., "owns", "partners_with", "competes_with", etc.
@@ -120,13 +120,64 @@ class User:
     updated_at: Optional[datetime] = None
 
 
+@dataclass(frozen=True)
+class PriceBar:
+    """One daily OHLC bar (market-data providers and the local price history store)."""
+
+    symbol: str
+    date: date
+    close: float
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class IntradayBar:
+    """One intraday OHLC bar; `timestamp` is the timezone-aware bar start."""
+
+    symbol: str
+    timestamp: datetime
+    close: float
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Quote:
+    """Latest quote for a symbol as reported by a market-data provider."""
+
+    symbol: str
+    current_price: float
+    previous_close: Optional[float] = None
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: Optional[int] = None
+    week_52_high: Optional[float] = None
+    week_52_low: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """Listing data used to validate symbols (exchange code, quote type, company name)."""
+
+    symbol: str
+    exchange: str
+    quote_type: Optional[str] = None
+    name: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class NodeRequest:
     """Node creation request entity that requires approval."""
 
     id: int
     requestor_id: str
-    status: Literal["pending", "approved", "rejected"]
+    status: Literal["pending", "processing", "approved", "rejected"]
     node_id: str
     node_type: str
     label: str
@@ -139,6 +190,8 @@ class NodeRequest:
     rejection_reason: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    retry_count: int = 0
+    retry_at: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, object]:
         """Convert to dictionary for serialization."""
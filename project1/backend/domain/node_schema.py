@@ -23,7 +23,7 @@ SQLALCHEMY_TYPE_MAP = {
     Optional[float]: "Float",
     bool: "Boolean",
     Optional[bool]: "Boolean",
-    Dict[str, Any]: "Text",  # JSON stored as Text
+    Dict[str, Any]: "JSON",  # JSONB on PostgreSQL, JSON on SQLite
 }
 
 
@@ -115,7 +115,7 @@ NODE_FIELDS: List[NodeFieldDefinition] = [
 
 # 计算字段（不存储在数据库，但存在于 Domain Model）
 COMPUTED_FIELDS = {
-    "metadata": Dict[str, Any],  # 存储在 metadata_json
+    "metadata": Dict[str, Any],  # 存储在 metadata_json (JSONB / JSON)
     "position": Optional[Tuple[float, float, float]],  # 动态计算
 }
 
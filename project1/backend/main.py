@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
+from collections import Counter
+from dataclasses import replace
+from typing import Callable, List, Sequence, TypeVar
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 
 # Configure logging
 logging.basicConfig(
@@ -14,8 +24,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from backend.api.schemas import (
+    AnalyticsResponse,
+    BatchQuoteResponse,
+    NodeBulkDeleteRequest,
+    NodeBulkDeleteResponse,
     NodeCreateRequest,
     NodeDetailResponse,
+    NodeRequestAcceptedResponse,
+    NodeRequestBatchCreateRequest,
+    NodeRequestBatchResponse,
     NodeRequestCreateRequest,
     NodeRequestResponse,
     NodeUpdateRequest,
@@ -38,21 +55,54 @@ from backend.dependencies import (
     # get_authenticated_graph_service,
     get_user_repository,
 )
-from backend.domain import Node, NodeRequest, Relationship
-from backend.repositories import DatabaseGraphRepository, GraphRepositoryProtocol
-from backend.services import GraphServiceProtocol, approve_node_request
-from backend.services.stock_data import get_stock_data
+from backend.domain import MetadataFilter, Node, NodeRequest, Relationship, parse_metadata_filter
+from backend.repositories import DatabaseGraphRepository, GraphRepositoryProtocol, NodeNotFoundError, RelationshipExistsError
+from backend.services import GraphServiceProtocol
+from backend.market_data import MarketDataBusyError, MarketDataUnavailableError
+from backend.services.analytics import ANALYTICS_TIMEOUT_SECONDS, get_market_analytics
+from backend.services.approval import approve_node_requests_batch
+from backend.services.approval_queue import ANONYMOUS_REQUESTOR, ApprovalWorkerPool
+from backend.services.market_executor import run_market_data
+from backend.services.page_views import company_page_views
+from backend.services.quote_scheduler import QUOTE_REFRESH_ENABLED, QuoteRefreshScheduler
+from backend.services.quote_stream import quote_stream_hub
+from backend.services.sparklines import get_sparklines
+from backend.services.stock_data import (
+    CHART_RANGES,
+    DEFAULT_CHART_POINTS,
+    DEFAULT_CHART_RANGE,
+    MAX_BATCH_SYMBOLS,
+    MAX_CHART_POINTS,
+    get_batch_quotes,
+    get_stock_data,
+    normalize_symbols,
+    resolve_chart_params,
+)
 # Optional: Import auth dependency when protecting endpoints
 from backend.auth import get_current_user, get_optional_user
+from backend.timing import ServerTimingMiddleware, stage
 
 app = FastAPI(title="Project For Fun API")
 
+quote_refresh_scheduler = QuoteRefreshScheduler()
+approval_workers = ApprovalWorkerPool()
+
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
     logger.info("🚀 Starting up backend server...")
     init_db()
     logger.info("✓ Database initialized")
+    approval_workers.start()
+    if QUOTE_REFRESH_ENABLED:
+        quote_refresh_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await quote_refresh_scheduler.stop()
+    await approval_workers.stop()
 
 # CORS middleware to allow requests from Next.js frontend
 app.add_middleware(
@@ -61,7 +111,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*", "Authorization"],  # Include Authorization header for JWT tokens
+    expose_headers=["Server-Timing"],
 )
+# Per-stage durations and DB query counts in a Server-Timing header; slow requests are logged
+app.add_middleware(ServerTimingMiddleware)
 
 
 @app.get("/")
@@ -74,42 +127,126 @@ async def health_check():
     return HealthCheckResponse(status="ok", message="Backend is running")
 
 
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model once, timed as the 'serialize' stage.
+
+    FastAPI does not re-validate Response objects, so the model is not dumped
+    and validated a second time against the route's response_model.
+    """
+    with stage("serialize"):
+        return Response(model.model_dump_json(), media_type="application/json")
+
+
+def _parse_metadata_filters(expressions: Sequence[str]) -> List[MetadataFilter]:
+    """Parse `metadata=key:op:value` query parameters, mapping syntax errors to 400."""
+    try:
+        return [parse_metadata_filter(expression) for expression in expressions]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+METADATA_FILTER_DESCRIPTION = "Metadata filter as key:op:value (op: eq, ne, gt, gte, lt, lte), e.g. marketCap:gt:500"
+
+
+NODE_INCLUDE_OPTIONS = ("correlation", "sparkline")
+
+
+def _parse_include(values: Sequence[str], allowed: Sequence[str]) -> set[str]:
+    """Parse `include=a,b` / repeated `include` parameters, mapping unknown options to 400."""
+    requested = {item.strip().lower() for value in values for item in value.split(",") if item.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include option(s): {', '.join(sorted(unknown))}. Expected: {', '.join(allowed)}",
+        )
+    return requested
+
+
 @app.get("/api/nodes", response_model=GraphResponse)
-async def get_nodes(service: GraphServiceProtocol = Depends(get_graph_service_from_db)):
+async def get_nodes(
+    metadata: List[str] = Query([], description=METADATA_FILTER_DESCRIPTION),
+    include: List[str] = Query([], description="Optional extras, comma-separated: correlation (edge annotations), sparkline (company price trends)"),
+    service: GraphServiceProtocol = Depends(get_graph_service_from_db),
+):
     """Get all nodes and edges for the graph."""
-    snapshot = service.get_graph_snapshot()
-    return GraphResponse(nodes=snapshot.to_node_payload(), edges=snapshot.to_edge_payload())
+    extras = _parse_include(include, NODE_INCLUDE_OPTIONS)
+    with stage("service"):
+        snapshot = service.get_graph_snapshot(_parse_metadata_filters(metadata))
+    with stage("payload"):
+        nodes = snapshot.to_node_payload()
+        edges = snapshot.to_edge_payload()
+    if "sparkline" in extras:
+        with stage("sparklines"):
+            nodes = await _attach_sparklines(nodes)
+    if "correlation" in extras:
+        with stage("correlation"):
+            edges = await _annotate_correlations(edges)
+    with stage("serialize"):
+        response = GraphResponse(nodes=nodes, edges=edges)
+    return _json_response(response)
+
+
+async def _attach_sparklines(nodes: List[dict]) -> List[dict]:
+    """Add each company node's packed sparkline (None for nodes without stored history)."""
+    try:
+        sparklines = await run_in_threadpool(get_sparklines)
+    except Exception as e:
+        logger.warning(f"Skipping sparklines: {e}")
+        return nodes
+    return [{**node, "sparkline": sparklines.get(node["id"])} for node in nodes]
+
+
+async def _annotate_correlations(edges: List[dict]) -> List[dict]:
+    """Add each edge's return correlation; the graph is still served if analytics are unavailable."""
+    try:
+        analytics = await run_market_data(get_market_analytics)
+    except Exception as e:
+        logger.warning(f"Skipping correlation annotations: {e}")
+        return edges
+    return [
+        {**edge, "correlation": analytics.correlation_between(edge["source"], edge["target"])}
+        for edge in edges
+    ]
 
 
 @app.get("/api/nodes/{node_id}", response_model=NodeDetailResponse)
 async def get_node(node_id: str, service: GraphServiceProtocol = Depends(get_graph_service_from_db)):
     """Get detailed information about a specific node."""
-    detail = service.get_node_detail(node_id)
+    with stage("service"):
+        detail = service.get_node_detail(node_id)
     if not detail:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    return NodeDetailResponse(id=detail.id, data=dict(detail.data))
+    with stage("serialize"):
+        response = NodeDetailResponse(id=detail.id, data=dict(detail.data))
+    return _json_response(response)
 
 
 @app.get("/api/search", response_model=SearchResponse)
 async def search_nodes(
     query: str = Query("", min_length=1, description="Search term matching node label/description"),
     limit: int = Query(5, ge=1, le=20),
+    metadata: List[str] = Query([], description=METADATA_FILTER_DESCRIPTION),
     service: GraphServiceProtocol = Depends(get_graph_service_from_db),
 ):
     """Search for nodes matching a query string."""
-    matches = service.search_nodes(query, limit=limit)
-    hits = [
-        SearchHit(
-            id=node.id,
-            label=node.label,
-            type=node.type,
-            sector=node.sector,
-            score=node.metadata.get("score") if isinstance(node.metadata, dict) else None,
-        )
-        for node in matches
-    ]
-    return SearchResponse(query=query, results=hits)
+    with stage("service"):
+        matches = service.search_nodes(query, limit=limit, metadata_filters=_parse_metadata_filters(metadata))
+    with stage("serialize"):
+        hits = [
+            SearchHit(
+                id=node.id,
+                label=node.label,
+                type=node.type,
+                sector=node.sector,
+                score=node.metadata.get("score") if isinstance(node.metadata, dict) else None,
+            )
+            for node in matches
+        ]
+        response = SearchResponse(query=query, results=hits)
+    return _json_response(response)
 
 
 @app.get("/api/hello")
@@ -118,23 +255,26 @@ async def hello():
 
 
 # CRUD endpoints for Nodes
-@app.post("/api/nodes", status_code=201)
+@app.post("/api/nodes", status_code=202, response_model=NodeRequestAcceptedResponse)
 async def create_node(
     node_data: NodeCreateRequest,
+    response: Response,
     user: dict | None = Depends(get_optional_user),
     repository: DatabaseGraphRepository = Depends(get_database_repository),
 ):
     """
-    Create a new node through approval workflow.
+    Create a new node through the approval workflow.
     
-    Creates a node_request first, then automatically approves/rejects based on:
-    - Approved: authenticated user AND type == 'company'
+    Stores a pending node_request and returns 202 with its ID right away; approval
+    workers validate the symbol and create the node in the background. Poll
+    GET /api/node-requests/{request_id} for the outcome:
+    - Approved: authenticated user AND type == 'company' AND a listed NASDAQ stock
     - Rejected: all other cases
     """
     from datetime import datetime, timezone
     
     # Get requestor_id from user or use placeholder for unauthenticated users
-    requestor_id = user.get("id") if user else "anonymous"
+    requestor_id = user.get("id") if user else ANONYMOUS_REQUESTOR
     
     # Create NodeRequest with pending status
     node_request = NodeRequest(
@@ -155,39 +295,80 @@ async def create_node(
         updated_at=datetime.now(timezone.utc),
     )
     
-    # Save the request
+    if user is None:
+        # Decided without validation: record the rejection and answer directly
+        rejected_request = repository.create_node_request(
+            replace(node_request, status="rejected", rejection_reason="User must be authenticated to create nodes")
+        )
+        raise HTTPException(status_code=401, detail=rejected_request.rejection_reason)
+
+    # Save the request; approval runs on the worker pool
     created_request = repository.create_node_request(node_request)
-    
-    # Process approval
-    status, rejection_reason, created_node = approve_node_request(
-        created_request, user, repository
-    )
-    
-    # Update request status
-    approver_id = user.get("id") if user else None
-    updated_request = repository.update_node_request_status(
-        created_request.id,
-        status,
-        approver_id=approver_id,
-        rejection_reason=rejection_reason,
+    approval_workers.notify()
+    response.headers["Location"] = f"/api/node-requests/{created_request.id}"
+    return NodeRequestAcceptedResponse(request_id=created_request.id, status=created_request.status)
+
+
+@app.post("/api/node-requests:batch", response_model=NodeRequestBatchResponse)
+async def create_node_requests_batch(
+    batch: NodeRequestBatchCreateRequest,
+    user: dict = Depends(get_current_user),
+    repository: DatabaseGraphRepository = Depends(get_database_repository),
+):
+    """
+    Submit many node requests (e.g. a watchlist) and decide them synchronously.
+
+    Symbols are deduplicated, checked against existing nodes in one query and
+    validated together; requests and approved nodes are stored in one transaction.
+    Symbols the provider cannot validate right now stay pending for the approval queue.
+    """
+    from datetime import datetime, timezone
+
+    now = datetime.now(timezone.utc)
+    node_requests = [
+        NodeRequest(
+            id=0,
+            requestor_id=user["id"],
+            status="pending",
+            node_id=item.id,
+            node_type=item.type,
+            label=item.label,
+            description=item.description,
+            sector=item.sector,
+            color=item.color,
+            metadata=item.metadata,
+            created_at=now,
+            updated_at=now,
+        )
+        for item in batch.requests
+    ]
+    try:
+        decided, duplicates = await run_in_threadpool(approve_node_requests_batch, node_requests, user, repository)
+    except IntegrityError:
+        # A node in the batch was created concurrently; nothing was written
+        raise HTTPException(status_code=409, detail="Some nodes were created concurrently, please resubmit")
+    counts = Counter(node_request.status for node_request in decided)
+    if counts["pending"]:
+        approval_workers.notify()
+    return NodeRequestBatchResponse(
+        results=[NodeRequestResponse(**node_request.to_dict()) for node_request in decided],
+        approved=counts["approved"],
+        rejected=counts["rejected"],
+        pending=counts["pending"],
+        duplicates=duplicates,
     )
-    
-    if status == "approved" and created_node:
-        # Return node detail if approved
-        return NodeDetailResponse(id=created_node.id, data=dict(created_node.to_detail().data))
-    else:
-        # Return error with rejection reason
-        # Use 401 for authentication errors, 400 for other rejections
-        if user is None:
-            raise HTTPException(
-                status_code=401,
-                detail=rejection_reason or "User must be authenticated to create nodes",
-            )
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=rejection_reason or "Node creation request was rejected",
-            )
+
+
+@app.get("/api/node-requests/{request_id}", response_model=NodeRequestResponse)
+async def get_node_request(
+    request_id: int,
+    repository: DatabaseGraphRepository = Depends(get_database_repository),
+):
+    """Status of a node creation request (pending, processing, approved or rejected)."""
+    node_request = repository.get_node_request(request_id)
+    if node_request is None:
+        raise HTTPException(status_code=404, detail="Node request not found")
+    return NodeRequestResponse(**node_request.to_dict())
 
 
 @app.put("/api/nodes/{node_id}", response_model=NodeDetailResponse)
@@ -232,35 +413,34 @@ async def delete_node(
     return MessageResponse(message=f"Node {node_id} deleted successfully")
 
 
+@app.post("/api/nodes:batchDelete", response_model=NodeBulkDeleteResponse)
+async def delete_nodes(
+    request: NodeBulkDeleteRequest,
+    repository: DatabaseGraphRepository = Depends(get_database_repository),
+):
+    """Delete many nodes and all of their relationships in set-based statements."""
+    deleted = repository.delete_nodes(request.ids)
+    deleted_ids = set(deleted)
+    not_found = [node_id for node_id in dict.fromkeys(request.ids) if node_id not in deleted_ids]
+    return NodeBulkDeleteResponse(deleted=deleted, not_found=not_found)
+
+
 # CRUD endpoints for Relationships
 @app.post("/api/relationships", response_model=dict, status_code=201)
 async def create_relationship(
     relationship_data: RelationshipCreateRequest,
     repository: DatabaseGraphRepository = Depends(get_database_repository),
 ):
-    """Create a new relationship. ID is auto-generated based on source_id, target_id, and type."""
+    """
+    Create a new relationship. ID is a database-assigned surrogate key.
+
+    Uniqueness of (source_id, target_id, type) and existence of both nodes are
+    enforced by the database in a single INSERT.
+    """
     from datetime import datetime, timezone
-    
-    # Generate unique ID based on properties: source_id + target_id + type
-    # Format: {source_id}_{target_id}_{type}
-    relationship_id = f"{relationship_data.source_id}_{relationship_data.target_id}_{relationship_data.type}"
-    
-    # Check if relationship already exists
-    existing = repository.get_relationship(relationship_id)
-    if existing:
-        raise HTTPException(status_code=400, detail=f"Relationship already exists with ID: {relationship_id}")
-    
-    # Verify source and target nodes exist
-    source_node = repository.get_node(relationship_data.source_id)
-    if not source_node:
-        raise HTTPException(status_code=404, detail=f"Source node not found: {relationship_data.source_id}")
-    
-    target_node = repository.get_node(relationship_data.target_id)
-    if not target_node:
-        raise HTTPException(status_code=404, detail=f"Target node not found: {relationship_data.target_id}")
-    
+
     relationship = Relationship(
-        id=relationship_id,
+        id="",  # Assigned by the database
         source_id=relationship_data.source_id,
         target_id=relationship_data.target_id,
         type=relationship_data.type,
@@ -268,7 +448,19 @@ async def create_relationship(
         created_datetime=datetime.now(timezone.utc),
     )
 
-    created = repository.create_relationship(relationship)
+    try:
+        created = repository.create_relationship(relationship)
+    except NodeNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if created is None:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Relationship already exists: {relationship_data.source_id} -> "
+                f"{relationship_data.target_id} ({relationship_data.type})"
+            ),
+        )
+
     result = {
         "id": created.id,
         "source_id": created.source_id,
@@ -301,7 +493,12 @@ async def update_relationship(
         from datetime import datetime
         updates["created_datetime"] = datetime.fromisoformat(relationship_data.created_datetime.replace('Z', '+00:00'))
 
-    updated = repository.update_relationship(relationship_id, **updates)
+    try:
+        updated = repository.update_relationship(relationship_id, **updates)
+    except NodeNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RelationshipExistsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated:
         raise HTTPException(status_code=404, detail="Relationship not found")
 
@@ -348,13 +545,49 @@ async def get_current_user_info(
     return user  # Fallback to auth info if not in DB yet
 
 
+T = TypeVar("T")
+
+
+async def _market_call(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run blocking market-data code on the bounded executor, mapping overload/timeouts to 503/504."""
+    try:
+        return await run_market_data(fn, *args, **kwargs)
+    except MarketDataBusyError as e:
+        headers = {"Retry-After": str(math.ceil(e.retry_after))} if e.retry_after else None
+        raise HTTPException(status_code=503, detail=str(e), headers=headers)
+    except MarketDataUnavailableError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+
 @app.get("/api/nodes/{node_id}/stock", response_model=StockDataResponse)
-async def get_stock_data_for_node(node_id: str):
+async def get_stock_data_for_node(
+    node_id: str,
+    chart_range: str = Query(
+        DEFAULT_CHART_RANGE,
+        alias="range",
+        description=f"Chart range: {', '.join(CHART_RANGES)}",
+    ),
+    interval: str | None = Query(
+        None,
+        description="Bar interval: 1m, 5m, 15m, 30m, 1h (intraday), 1d, 1wk, 1mo. Defaults to 5m for 1D, 30m for 5D, else 1d.",
+    ),
+    points: int = Query(
+        DEFAULT_CHART_POINTS,
+        ge=10,
+        le=MAX_CHART_POINTS,
+        description="Maximum chart points; longer series are downsampled (LTTB)",
+    ),
+):
     """
     Get real stock data for a node (stock symbol).
     Returns current price, day change, 52-week range, and historical series.
     """
-    stock_data = get_stock_data(node_id)
+    try:
+        chart_range, interval = resolve_chart_params(chart_range, interval)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    company_page_views.record(node_id.strip().upper())
+    stock_data = await _market_call(get_stock_data, node_id, chart_range, interval, points)
     if not stock_data:
         raise HTTPException(
             status_code=404,
@@ -363,3 +596,93 @@ async def get_stock_data_for_node(node_id: str):
     
     return StockDataResponse(**stock_data)
 
+
+async def _batch_quote_response(symbols: Sequence[str], include_history: bool, history_days: int) -> BatchQuoteResponse:
+    results = await _market_call(
+        get_batch_quotes, symbols, include_history=include_history, history_days=history_days
+    )
+    return BatchQuoteResponse(
+        quotes={symbol: quote for symbol, quote in results.items() if quote is not None},
+        missing=[symbol for symbol, quote in results.items() if quote is None],
+    )
+
+
+@app.get("/api/stocks", response_model=BatchQuoteResponse)
+async def get_stock_quotes(
+    symbols: str = Query(..., min_length=1, description=f"Comma-separated symbols (max {MAX_BATCH_SYMBOLS})"),
+    include_history: bool = Query(False, description="Attach daily closes from the local history store"),
+    history_days: int = Query(30, ge=1, le=365),
+):
+    """
+    Get compact quotes for many symbols at once.
+    All uncached symbols are fetched with a single multi-ticker download.
+    """
+    requested = [symbol for symbol in symbols.split(",") if symbol.strip()]
+    if len(requested) > MAX_BATCH_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SYMBOLS} symbols per request")
+    return await _batch_quote_response(requested, include_history, history_days)
+
+
+# Comment line sent on idle quote streams so proxies keep the connection open
+QUOTE_STREAM_KEEPALIVE_SECONDS = 15
+
+
+@app.get("/api/stocks/{symbol}/stream")
+async def stream_stock_quotes(symbol: str, request: Request):
+    """
+    Server-Sent Events stream of live quotes for one symbol.
+
+    Sends a `quote` event (CompactQuote JSON) whenever the price changes; all
+    viewers of a symbol share one upstream poller.
+    """
+    symbols = normalize_symbols([symbol])
+    if not symbols:
+        raise HTTPException(status_code=400, detail="Symbol must be a non-empty string")
+    symbol = symbols[0]
+    company_page_views.record(symbol)
+
+    async def events():
+        async with quote_stream_hub.subscribe(symbol) as queue:
+            while not await request.is_disconnected():
+                try:
+                    tick = await asyncio.wait_for(queue.get(), timeout=QUOTE_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: quote\ndata: {json.dumps(tick)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/analytics", response_model=AnalyticsResponse)
+async def get_analytics():
+    """
+    Volatility, beta and pairwise daily-return correlations across all company nodes.
+    Computed from the local price history store once per trading day.
+    """
+    # The first computation of the day may back-fill history for new companies
+    analytics = await _market_call(get_market_analytics, timeout=ANALYTICS_TIMEOUT_SECONDS)
+    return AnalyticsResponse(
+        as_of=analytics.as_of.isoformat(),
+        benchmark=analytics.benchmark,
+        symbols=analytics.symbols,
+        metrics=analytics.metrics(),
+        correlation=analytics.correlation_rows(),
+    )
+
+
+@app.get("/api/stocks/graph", response_model=BatchQuoteResponse)
+async def get_graph_stock_quotes(
+    include_history: bool = Query(False, description="Attach daily closes from the local history store"),
+    history_days: int = Query(30, ge=1, le=365),
+    service: GraphServiceProtocol = Depends(get_graph_service_from_db),
+):
+    """Get compact quotes for every company node in the graph."""
+    with stage("service"):
+        snapshot = service.get_graph_snapshot()
+    symbols = [node.id for node in snapshot.nodes]
+    return await _batch_quote_response(symbols, include_history, history_days)
@@ -0,0 +1,32 @@
+"""Market-data providers (live yfinance, recorded fixtures) behind one interface."""
+
+from .base import MarketDataProvider
+from .config import get_market_data_provider, set_market_data_provider
+from .errors import (
+    MarketDataBusyError,
+    MarketDataCircuitOpenError,
+    MarketDataRateLimitedError,
+    MarketDataTimeoutError,
+    MarketDataUnavailableError,
+)
+from .fixture_provider import FixtureProvider
+from .guard import CircuitBreaker, GuardedProvider, TokenBucket
+from .symbol_directory import SymbolDirectory, get_symbol_directory, set_symbol_directory
+
+__all__ = [
+    "MarketDataProvider",
+    "FixtureProvider",
+    "GuardedProvider",
+    "TokenBucket",
+    "CircuitBreaker",
+    "MarketDataUnavailableError",
+    "MarketDataBusyError",
+    "MarketDataRateLimitedError",
+    "MarketDataCircuitOpenError",
+    "MarketDataTimeoutError",
+    "get_market_data_provider",
+    "set_market_data_provider",
+    "SymbolDirectory",
+    "get_symbol_directory",
+    "set_symbol_directory",
+]
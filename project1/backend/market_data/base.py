@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Optional, Protocol, Sequence
+
+from backend.domain import IntradayBar, PriceBar, Quote, SymbolInfo
+
+
+class MarketDataProvider(Protocol):
+    """
+    Source of market data used by the stock and approval services.
+
+    Methods return None / empty results for unknown symbols and raise on
+    transport errors (timeouts, rate limits), so callers can tell "no data"
+    from "try again later".
+    """
+
+    name: str
+
+    def get_quote(self, symbol: str) -> Optional[Quote]:
+        ...
+
+    def get_history(self, symbol: str, start: date, end: Optional[date] = None) -> List[PriceBar]:
+        """Daily bars from `start` to `end` (inclusive; defaults to today), oldest first."""
+        ...
+
+    def get_intraday_history(self, symbol: str, start: date, interval: str) -> List[IntradayBar]:
+        """Intraday bars (`interval` such as "5m", "1h") from the `start` session onwards, oldest first."""
+        ...
+
+    def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        ...
+
+    def get_batch_symbol_info(self, symbols: Sequence[str]) -> Dict[str, SymbolInfo]:
+        """Listing data for many symbols in one provider call; unknown symbols are omitted."""
+        ...
+
+    def get_batch_history(self, symbols: Sequence[str], start: date) -> Dict[str, List[PriceBar]]:
+        """
+        Recent daily bars for many symbols in one upstream call (backs batch quotes).
+
+        Symbols without data are omitted from the result.
+        """
+        ...
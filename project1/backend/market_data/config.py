@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from backend.market_data.base import MarketDataProvider
+from backend.market_data.guard import CircuitBreaker, GuardedProvider, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# "yfinance" (default, live) or "fixture" (replay MARKET_DATA_FIXTURE_PATH, no network)
+MARKET_DATA_PROVIDER = os.getenv("MARKET_DATA_PROVIDER", "yfinance").strip().lower()
+MARKET_DATA_FIXTURE_PATH = os.getenv("MARKET_DATA_FIXTURE_PATH")
+
+# Blocking provider calls run on a bounded pool (see services/market_executor.py)
+MARKET_DATA_MAX_WORKERS = int(os.getenv("MARKET_DATA_MAX_WORKERS", "8"))
+# Calls admitted at once (running + queued); beyond this callers fail fast
+MARKET_DATA_MAX_PENDING = int(os.getenv("MARKET_DATA_MAX_PENDING", str(MARKET_DATA_MAX_WORKERS * 4)))
+# Per-call timeout; slower upstream calls also count as failures for the circuit breaker
+MARKET_DATA_TIMEOUT_SECONDS = float(os.getenv("MARKET_DATA_TIMEOUT_SECONDS", "10"))
+
+# Upstream budget shared by every live market-data call in this process
+# (one token ~ one Yahoo HTTP request)
+MARKET_DATA_RATE_PER_SECOND = float(os.getenv("MARKET_DATA_RATE_PER_SECOND", "2"))
+MARKET_DATA_RATE_BURST = float(os.getenv("MARKET_DATA_RATE_BURST", "20"))
+# How long a call may wait for tokens before failing fast
+MARKET_DATA_RATE_MAX_WAIT_SECONDS = float(os.getenv("MARKET_DATA_RATE_MAX_WAIT_SECONDS", "1"))
+# Consecutive 429s/timeouts that open the circuit, and how long it stays open before a probe
+MARKET_DATA_CIRCUIT_FAILURES = int(os.getenv("MARKET_DATA_CIRCUIT_FAILURES", "5"))
+MARKET_DATA_CIRCUIT_RESET_SECONDS = float(os.getenv("MARKET_DATA_CIRCUIT_RESET_SECONDS", "30"))
+
+_provider: Optional[MarketDataProvider] = None
+_provider_lock = threading.Lock()
+
+
+def _create_provider() -> MarketDataProvider:
+    if MARKET_DATA_PROVIDER == "fixture":
+        from backend.market_data.fixture_provider import FixtureProvider
+
+        if not MARKET_DATA_FIXTURE_PATH:
+            raise ValueError("MARKET_DATA_FIXTURE_PATH must be set when MARKET_DATA_PROVIDER=fixture")
+        provider = FixtureProvider.from_file(MARKET_DATA_FIXTURE_PATH)
+        logger.info(f"Market data: replaying {len(provider.symbols)} symbols from {MARKET_DATA_FIXTURE_PATH}")
+        return provider
+    if MARKET_DATA_PROVIDER == "yfinance":
+        from backend.market_data.yfinance_provider import YFinanceProvider
+
+        return GuardedProvider(
+            YFinanceProvider(),
+            TokenBucket(MARKET_DATA_RATE_PER_SECOND, MARKET_DATA_RATE_BURST),
+            CircuitBreaker(MARKET_DATA_CIRCUIT_FAILURES, MARKET_DATA_CIRCUIT_RESET_SECONDS),
+            max_wait=MARKET_DATA_RATE_MAX_WAIT_SECONDS,
+            slow_call_seconds=MARKET_DATA_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unknown MARKET_DATA_PROVIDER: {MARKET_DATA_PROVIDER!r}")
+
+
+def get_market_data_provider() -> MarketDataProvider:
+    """The process-wide market-data provider, created from the environment on first use."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _create_provider()
+    return _provider
+
+
+def set_market_data_provider(provider: Optional[MarketDataProvider]) -> None:
+    """Swap the provider (tests, benchmarks); None re-reads the environment on next use."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+class MarketDataUnavailableError(Exception):
+    """Market data could not be obtained in time; callers should degrade gracefully."""
+
+
+class MarketDataBusyError(MarketDataUnavailableError):
+    """Market data is temporarily refused (overload, quota or open circuit); retry later."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MarketDataRateLimitedError(MarketDataBusyError):
+    """The local request budget for the upstream provider is exhausted."""
+
+
+class MarketDataCircuitOpenError(MarketDataBusyError):
+    """The upstream provider is failing (429s/timeouts); calls are short-circuited."""
+
+
+class MarketDataTimeoutError(MarketDataUnavailableError):
+    """A market-data call exceeded its timeout (the worker thread may still finish it)."""
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from backend.domain import IntradayBar, PriceBar, Quote, SymbolInfo
+from backend.market_data.base import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_VERSION = 1
+
+
+class FixtureProvider:
+    """
+    Deterministic, in-memory provider that replays recorded market data.
+
+    Used for benchmarks, load tests and CI: no network, no rate limits, and the
+    same answers on every run. Fixtures are JSON files written by `save` (see
+    `scripts/record_market_fixture.py`):
+
+        {"version": 1, "symbols": {"AAPL": {"info": {...}, "quote": {...}, "bars": [...],
+                                            "intraday": {"5m": [...]}}}}
+
+    Symbols missing from the fixture behave like unknown symbols upstream.
+    """
+
+    name = "fixture"
+
+    def __init__(
+        self,
+        quotes: Optional[Dict[str, Quote]] = None,
+        infos: Optional[Dict[str, SymbolInfo]] = None,
+        bars: Optional[Dict[str, List[PriceBar]]] = None,
+        intraday: Optional[Dict[str, Dict[str, List[IntradayBar]]]] = None,
+    ) -> None:
+        self._quotes: Dict[str, Quote] = dict(quotes or {})
+        self._infos: Dict[str, SymbolInfo] = dict(infos or {})
+        self._bars: Dict[str, List[PriceBar]] = {}
+        # Parallel sorted date lists so history slices are two bisects
+        self._bar_dates: Dict[str, List[date]] = {}
+        for symbol, symbol_bars in (bars or {}).items():
+            self._set_bars(symbol, symbol_bars)
+        # symbol -> interval -> bars sorted by timestamp
+        self._intraday: Dict[str, Dict[str, List[IntradayBar]]] = {
+            symbol: {interval: sorted(bars, key=lambda bar: bar.timestamp) for interval, bars in by_interval.items()}
+            for symbol, by_interval in (intraday or {}).items()
+        }
+
+    def _set_bars(self, symbol: str, bars: Iterable[PriceBar]) -> None:
+        ordered = sorted(bars, key=lambda bar: bar.date)
+        self._bars[symbol] = ordered
+        self._bar_dates[symbol] = [bar.date for bar in ordered]
+
+    @property
+    def symbols(self) -> List[str]:
+        return sorted(set(self._quotes) | set(self._infos) | set(self._bars) | set(self._intraday))
+
+    def get_quote(self, symbol: str) -> Optional[Quote]:
+        return self._quotes.get(symbol)
+
+    def get_history(self, symbol: str, start: date, end: Optional[date] = None) -> List[PriceBar]:
+        bars = self._bars.get(symbol)
+        if not bars:
+            return []
+        dates = self._bar_dates[symbol]
+        lo = bisect_left(dates, start)
+        hi = bisect_right(dates, end) if end is not None else len(dates)
+        return bars[lo:hi]
+
+    def get_intraday_history(self, symbol: str, start: date, interval: str) -> List[IntradayBar]:
+        bars = self._intraday.get(symbol, {}).get(interval, [])
+        return [bar for bar in bars if bar.timestamp.date() >= start]
+
+    def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        return self._infos.get(symbol)
+
+    def get_batch_symbol_info(self, symbols: Sequence[str]) -> Dict[str, SymbolInfo]:
+        return {symbol: self._infos[symbol] for symbol in symbols if symbol in self._infos}
+
+    def get_batch_history(self, symbols: Sequence[str], start: date) -> Dict[str, List[PriceBar]]:
+        results: Dict[str, List[PriceBar]] = {}
+        for symbol in symbols:
+            bars = self.get_history(symbol, start)
+            if bars:
+                results[symbol] = bars
+        return results
+
+    # -- recording / serialization ------------------------------------------------
+
+    @classmethod
+    def record(
+        cls,
+        source: MarketDataProvider,
+        symbols: Iterable[str],
+        start: date,
+        intraday_start: Optional[date] = None,
+        intraday_intervals: Sequence[str] = (),
+    ) -> "FixtureProvider":
+        """Capture quotes, symbol info, daily bars since `start` and optional intraday bars from another provider."""
+        fixture = cls()
+        for symbol in symbols:
+            try:
+                quote = source.get_quote(symbol)
+                info = source.get_symbol_info(symbol)
+                bars = source.get_history(symbol, start)
+                intraday = {
+                    interval: source.get_intraday_history(symbol, intraday_start or start, interval)
+                    for interval in intraday_intervals
+                }
+            except Exception as e:
+                logger.warning(f"Skipping '{symbol}' while recording fixture: {e}")
+                continue
+            if quote is not None:
+                fixture._quotes[symbol] = quote
+            if info is not None:
+                fixture._infos[symbol] = info
+            if bars:
+                fixture._set_bars(symbol, bars)
+            intraday = {interval: interval_bars for interval, interval_bars in intraday.items() if interval_bars}
+            if intraday:
+                fixture._intraday[symbol] = intraday
+        return fixture
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "FixtureProvider":
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        return cls.from_dict(payload)
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> "FixtureProvider":
+        version = payload.get("version")
+        if version != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported market data fixture version: {version!r}")
+        quotes: Dict[str, Quote] = {}
+        infos: Dict[str, SymbolInfo] = {}
+        bars: Dict[str, List[PriceBar]] = {}
+        intraday: Dict[str, Dict[str, List[IntradayBar]]] = {}
+        for symbol, entry in payload.get("symbols", {}).items():
+            if entry.get("quote"):
+                quotes[symbol] = Quote(symbol=symbol, **entry["quote"])
+            if entry.get("info"):
+                infos[symbol] = SymbolInfo(symbol=symbol, **entry["info"])
+            if entry.get("bars"):
+                bars[symbol] = [
+                    PriceBar(symbol=symbol, **{**bar, "date": date.fromisoformat(bar["date"])})
+                    for bar in entry["bars"]
+                ]
+            if entry.get("intraday"):
+                intraday[symbol] = {
+                    interval: [
+                        IntradayBar(symbol=symbol, **{**bar, "timestamp": datetime.fromisoformat(bar["timestamp"])})
+                        for bar in interval_bars
+                    ]
+                    for interval, interval_bars in entry["intraday"].items()
+                }
+        return cls(quotes=quotes, infos=infos, bars=bars, intraday=intraday)
+
+    def to_dict(self) -> Dict:
+        symbols: Dict[str, Dict] = {}
+        for symbol in self.symbols:
+            entry: Dict = {}
+            if symbol in self._quotes:
+                entry["quote"] = _without_symbol(asdict(self._quotes[symbol]))
+            if symbol in self._infos:
+                entry["info"] = _without_symbol(asdict(self._infos[symbol]))
+            if self._bars.get(symbol):
+                entry["bars"] = [
+                    {**_without_symbol(asdict(bar)), "date": bar.date.isoformat()} for bar in self._bars[symbol]
+                ]
+            if self._intraday.get(symbol):
+                entry["intraday"] = {
+                    interval: [
+                        {**_without_symbol(asdict(bar)), "timestamp": bar.timestamp.isoformat()} for bar in bars
+                    ]
+                    for interval, bars in self._intraday[symbol].items()
+                }
+            symbols[symbol] = entry
+        return {"version": FIXTURE_VERSION, "symbols": symbols}
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+
+def _without_symbol(fields: Dict) -> Dict:
+    fields.pop("symbol", None)
+    return fields
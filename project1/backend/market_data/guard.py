@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from backend.domain import IntradayBar, PriceBar, Quote, SymbolInfo
+from backend.market_data.base import MarketDataProvider
+from backend.market_data.errors import (
+    MarketDataCircuitOpenError,
+    MarketDataRateLimitedError,
+    MarketDataTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`.
+
+    `acquire` waits up to `max_wait` seconds for tokens and returns False if the
+    budget would still be exceeded, so callers fail fast instead of queueing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float, max_wait: float) -> Optional[float]:
+        """Take `tokens` (possibly going into debt); returns the wait needed, or None if over `max_wait`."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: float = 1.0, max_wait: float = 0.0) -> bool:
+        wait = self._reserve(min(tokens, self.capacity), max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures; open -> half-open
+    after `reset_timeout` seconds, letting a single probe call through. A
+    successful probe closes the circuit, a failed one re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def retry_after(self) -> float:
+        with self._lock:
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (claims the probe slot when half-open)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Market data circuit closed: upstream probe succeeded")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"Market data circuit open for {self.reset_timeout:.0f}s after {self._failures} failures"
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def record_neutral(self) -> None:
+        """A call finished without telling us anything about upstream health (e.g. bad symbol)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                # The probe got an answer, so upstream is reachable again
+                self._state = self.CLOSED
+                self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a probe slot claimed by `allow` when the call never went upstream."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+def is_timeout_error(e: BaseException) -> bool:
+    return isinstance(e, TimeoutError) or "Timeout" in type(e).__name__
+
+
+def is_rate_limit_error(e: BaseException) -> bool:
+    message = str(e)
+    return "429" in message or "Too Many Requests" in message or "RateLimit" in type(e).__name__
+
+
+class GuardedProvider:
+    """
+    Wraps a provider with a shared token bucket and circuit breaker.
+
+    Each method costs roughly the number of upstream HTTP requests it makes.
+    Upstream 429s and timeouts are re-raised as MarketDataRateLimitedError /
+    MarketDataTimeoutError and count towards opening the circuit. Calls slower than `slow_call_seconds` count as timeouts even if they succeed.
+    """
+
+    CALL_COSTS: Dict[str, float] = {
+        "get_quote": 3.0,  # fast_info + info + 1d history
+        "get_history": 1.0,
+        "get_intraday_history": 1.0,
+        "get_symbol_info": 2.0,  # fast_info + info
+        "get_batch_symbol_info": 2.0,  # per symbol
+        "get_batch_history": 1.0,  # one multi-ticker download
+    }
+
+    def __init__(
+        self,
+        provider: MarketDataProvider,
+        bucket: TokenBucket,
+        breaker: CircuitBreaker,
+        max_wait: float = 1.0,
+        slow_call_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.name = provider.name
+        self.bucket = bucket
+        self.breaker = breaker
+        self.max_wait = max_wait
+        self.slow_call_seconds = slow_call_seconds
+        self._clock = clock
+
+    def _call(self, method: str, fn: Callable[[], T], count: int = 1) -> T:
+        if not self.breaker.allow():
+            raise MarketDataCircuitOpenError(
+                "Market data provider is unavailable, please try again later.",
+                retry_after=self.breaker.retry_after(),
+            )
+        if not self.bucket.acquire(self.CALL_COSTS.get(method, 1.0) * count, max_wait=self.max_wait):
+            # Nothing was sent upstream; give a half-open probe slot back
+            self.breaker.release_probe()
+            raise MarketDataRateLimitedError(
+                "Market data request budget exhausted, please try again later.",
+                retry_after=1.0 / self.bucket.rate,
+            )
+        started = self._clock()
+        try:
+            result = fn()
+        except Exception as e:
+            # 429s and timeouts mean "back off" (as opposed to bad input); surface them
+            # as unavailability so callers serve cached data instead of "not found"
+            if is_rate_limit_error(e):
+                self.breaker.record_failure()
+                raise MarketDataRateLimitedError(
+                    "Market data provider is rate limiting us, please try again later.",
+                    retry_after=self.breaker.retry_after() or None,
+                ) from e
+            if is_timeout_error(e):
+                self.breaker.record_failure()
+                raise MarketDataTimeoutError("Market data request timed out, please try again later.") from e
+            self.breaker.record_neutral()
+            raise
+        if self.slow_call_seconds is not None and self._clock() - started > self.slow_call_seconds:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    def get_quote(self, symbol: str) -> Optional[Quote]:
+        return self._call("get_quote", lambda: self.provider.get_quote(symbol))
+
+    def get_history(self, symbol: str, start: date, end: Optional[date] = None) -> List[PriceBar]:
+        return self._call("get_history", lambda: self.provider.get_history(symbol, start, end))
+
+    def get_intraday_history(self, symbol: str, start: date, interval: str) -> List[IntradayBar]:
+        return self._call(
+            "get_intraday_history", lambda: self.provider.get_intraday_history(symbol, start, interval)
+        )
+
+    def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        return self._call("get_symbol_info", lambda: self.provider.get_symbol_info(symbol))
+
+    def get_batch_symbol_info(self, symbols: Sequence[str]) -> Dict[str, SymbolInfo]:
+        return self._call(
+            "get_batch_symbol_info", lambda: self.provider.get_batch_symbol_info(symbols), count=len(symbols)
+        )
+
+    def get_batch_history(self, symbols: Sequence[str], start: date) -> Dict[str, List[PriceBar]]:
+        return self._call("get_batch_history", lambda: self.provider.get_batch_history(symbols, start))
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+from urllib.request import urlopen
+
+from backend.domain import SymbolInfo
+
+logger = logging.getLogger(__name__)
+
+DIRECTORY_VERSION = 2
+
+# Daily symbol directory files published by Nasdaq Trader (pipe-delimited)
+NASDAQ_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
+OTHER_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
+
+# otherlisted.txt exchange codes
+OTHER_EXCHANGES = {
+    "A": "NYSE American",
+    "N": "NYSE",
+    "P": "NYSE Arca",
+    "Z": "Cboe BZX",
+    "V": "IEX",
+}
+NASDAQ_EXCHANGE = "NASDAQ"
+
+SYMBOL_DIRECTORY_PATH = os.getenv(
+    "SYMBOL_DIRECTORY_PATH", str(Path(__file__).parent.parent / "data" / "symbol_directory.json")
+)
+# How often a running process checks whether the directory file was rebuilt
+SYMBOL_DIRECTORY_CHECK_SECONDS = 60.0
+
+
+def _parse_listing_file(text: str) -> Iterable[Dict[str, str]]:
+    """Rows of a Nasdaq Trader symbol directory file as dicts (footer and blank lines skipped)."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return []
+    header = lines[0].split("|")
+    return [
+        dict(zip(header, line.split("|")))
+        for line in lines[1:]
+        if not line.startswith("File Creation Time")
+    ]
+
+
+# Security class wording -> quote type for issues that are not common shares (first match wins)
+_SECURITY_CLASS_TYPES = (
+    (re.compile(r"\bwarrants?\b", re.IGNORECASE), "WARRANT"),
+    (re.compile(r"\brights?\b", re.IGNORECASE), "RIGHT"),
+    (re.compile(r"\bunits?\b", re.IGNORECASE), "UNIT"),
+    (re.compile(r"\bpreferred\b|\bpfd\b", re.IGNORECASE), "PREFERRED"),
+    (re.compile(r"\bnotes?\b|\bdebentures?\b|\bbonds?\b", re.IGNORECASE), "DEBT"),
+)
+
+
+def _classify_listing(security_name: str, is_etf: bool) -> Tuple[str, str]:
+    """
+    (quote type, company name) for a listing row.
+
+    Nasdaq names read "<company> - <security class>" (e.g. "Apple Inc. -
+    Common Stock"); the class decides the type and is dropped from the name.
+    Names without the separator are classified as a whole and kept as is.
+    """
+    company, separator, security_class = security_name.rpartition(" - ")
+    if not separator:
+        company = security_class = security_name
+    if is_etf:
+        return "ETF", company.strip()
+    for pattern, quote_type in _SECURITY_CLASS_TYPES:
+        if pattern.search(security_class):
+            return quote_type, company.strip()
+    return "EQUITY", company.strip()
+
+
+class SymbolDirectory:
+    """
+    Offline listing directory: symbol -> exchange, security type (EQUITY, ETF,
+    WARRANT, RIGHT, UNIT, PREFERRED, DEBT) and company name, held in a dict
+    for O(1) lookups.
+
+    Built from the Nasdaq Trader `nasdaqlisted.txt` / `otherlisted.txt` files and
+    stored as JSON; `save` replaces the file atomically so readers never see a
+    partial directory.
+    """
+
+    def __init__(self, listings: Optional[Dict[str, SymbolInfo]] = None, generated_at: Optional[str] = None) -> None:
+        self._listings: Dict[str, SymbolInfo] = dict(listings or {})
+        self.generated_at = generated_at
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def lookup(self, symbol: str) -> Optional[SymbolInfo]:
+        return self._listings.get(symbol.strip().upper())
+
+    @classmethod
+    def from_listing_files(cls, nasdaq_listed: str, other_listed: str = "") -> "SymbolDirectory":
+        """Build from the raw listing files; test issues are skipped."""
+        listings: Dict[str, SymbolInfo] = {}
+        for row in _parse_listing_file(other_listed):
+            if row.get("Test Issue") == "Y":
+                continue
+            symbol = row.get("ACT Symbol", "").strip().upper()
+            exchange = OTHER_EXCHANGES.get(row.get("Exchange", ""), row.get("Exchange", ""))
+            if symbol:
+                quote_type, name = _classify_listing(row.get("Security Name", ""), row.get("ETF") == "Y")
+                listings[symbol] = SymbolInfo(symbol, exchange, quote_type, name)
+        # NASDAQ listings win if a symbol appears in both files
+        for row in _parse_listing_file(nasdaq_listed):
+            if row.get("Test Issue") == "Y":
+                continue
+            symbol = row.get("Symbol", "").strip().upper()
+            if symbol:
+                quote_type, name = _classify_listing(row.get("Security Name", ""), row.get("ETF") == "Y")
+                listings[symbol] = SymbolInfo(symbol, NASDAQ_EXCHANGE, quote_type, name)
+        return cls(listings, generated_at=datetime.now(timezone.utc).isoformat())
+
+    @classmethod
+    def download(cls, timeout: float = 30.0) -> "SymbolDirectory":
+        """Fetch and parse the current Nasdaq Trader listing files."""
+        texts = []
+        for url in (NASDAQ_LISTED_URL, OTHER_LISTED_URL):
+            with urlopen(url, timeout=timeout) as response:
+                texts.append(response.read().decode("utf-8", errors="replace"))
+        return cls.from_listing_files(*texts)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "SymbolDirectory":
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("version") != DIRECTORY_VERSION:
+            raise ValueError(f"Unsupported symbol directory version: {payload.get('version')}")
+        listings = {
+            symbol: SymbolInfo(symbol, exchange, security_type, name)
+            for symbol, (exchange, security_type, name) in payload["symbols"].items()
+        }
+        return cls(listings, generated_at=payload.get("generated_at"))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write to a temporary file next to `path` and rename it into place (atomic)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": DIRECTORY_VERSION,
+            "generated_at": self.generated_at,
+            "symbols": {
+                symbol: [info.exchange, info.quote_type, info.name]
+                for symbol, info in sorted(self._listings.items())
+            },
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+_directory: Optional[SymbolDirectory] = None
+_directory_mtime: Optional[float] = None
+_next_check = 0.0
+_directory_lock = threading.Lock()
+
+
+def get_symbol_directory() -> Optional[SymbolDirectory]:
+    """
+    The directory stored at SYMBOL_DIRECTORY_PATH, or None if it has not been built.
+
+    The file is re-read when a refresh replaces it (checked at most every
+    SYMBOL_DIRECTORY_CHECK_SECONDS); the swap is a single reference assignment.
+    """
+    global _directory, _directory_mtime, _next_check
+    now = time.monotonic()
+    if now < _next_check:
+        return _directory
+    with _directory_lock:
+        if now < _next_check:
+            return _directory
+        _next_check = now + SYMBOL_DIRECTORY_CHECK_SECONDS
+        try:
+            mtime = os.stat(SYMBOL_DIRECTORY_PATH).st_mtime
+        except FileNotFoundError:
+            return _directory
+        if mtime != _directory_mtime:
+            try:
+                _directory = SymbolDirectory.from_file(SYMBOL_DIRECTORY_PATH)
+                _directory_mtime = mtime
+                logger.info(f"Symbol directory: {len(_directory)} listings from {SYMBOL_DIRECTORY_PATH}")
+            except Exception as e:
+                logger.error(f"Failed to load symbol directory {SYMBOL_DIRECTORY_PATH}: {e}")
+        return _directory
+
+
+def set_symbol_directory(directory: Optional[SymbolDirectory]) -> None:
+    """Override the directory (tests); None re-reads SYMBOL_DIRECTORY_PATH on next use."""
+    global _directory, _directory_mtime, _next_check
+    with _directory_lock:
+        _directory = directory
+        _directory_mtime = None
+        _next_check = float("inf") if directory is not None else 0.0
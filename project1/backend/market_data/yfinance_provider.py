@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+import yfinance as yf
+
+from backend.domain import IntradayBar, PriceBar, Quote, SymbolInfo
+
+logger = logging.getLogger(__name__)
+
+
+class YFinanceProvider:
+    """Market data from Yahoo Finance via yfinance (network-bound, rate limited upstream)."""
+
+    name = "yfinance"
+
+    def get_quote(self, symbol: str) -> Optional[Quote]:
+        ticker = yf.Ticker(symbol)
+
+        # Get current price and previous close
+        fast_info = ticker.fast_info
+        current_price = fast_info.get('lastPrice') or fast_info.get('regularMarketPrice')
+        if current_price is None:
+            return None
+        previous_close = fast_info.get('previousClose')
+
+        # Get 52-week range
+        info = ticker.info
+        week_52_high = info.get('fiftyTwoWeekHigh') or info.get('52WeekHigh')
+        week_52_low = info.get('fiftyTwoWeekLow') or info.get('52WeekLow')
+
+        # Get today's OHLC data
+        today_data = ticker.history(period='1d', interval='1d')
+        if not today_data.empty:
+            open_price = float(today_data['Open'].iloc[-1])
+            high_price = float(today_data['High'].iloc[-1])
+            low_price = float(today_data['Low'].iloc[-1])
+            volume = int(today_data['Volume'].iloc[-1])
+        else:
+            # Fallback to fast_info if history is not available
+            open_price = fast_info.get('open') or current_price
+            high_price = fast_info.get('dayHigh') or current_price
+            low_price = fast_info.get('dayLow') or current_price
+            volume = fast_info.get('volume') or 0
+
+        return Quote(
+            symbol=symbol,
+            current_price=float(current_price),
+            previous_close=float(previous_close) if previous_close else None,
+            open=float(open_price),
+            high=float(high_price),
+            low=float(low_price),
+            volume=int(volume),
+            week_52_high=float(week_52_high) if week_52_high else None,
+            week_52_low=float(week_52_low) if week_52_low else None,
+        )
+
+    def get_history(self, symbol: str, start: date, end: Optional[date] = None) -> List[PriceBar]:
+        end = (end or date.today()) + timedelta(days=1)  # yfinance `end` is exclusive
+        hist = yf.Ticker(symbol).history(start=start, end=end, interval="1d")
+        if hist.empty:
+            return []
+        return frame_to_bars(symbol, hist)
+
+    def get_intraday_history(self, symbol: str, start: date, interval: str) -> List[IntradayBar]:
+        hist = yf.Ticker(symbol).history(start=start, end=date.today() + timedelta(days=1), interval=interval)
+        if hist.empty:
+            return []
+        hist = hist.dropna(subset=["Close"])
+        volumes = hist["Volume"].fillna(0).astype("int64") if "Volume" in hist else [None] * len(hist)
+        return [
+            IntradayBar(
+                symbol=symbol,
+                timestamp=timestamp.to_pydatetime(),
+                open=float(open_price),
+                high=float(high_price),
+                low=float(low_price),
+                close=float(close_price),
+                volume=int(volume) if volume is not None else None,
+            )
+            for timestamp, open_price, high_price, low_price, close_price, volume in zip(
+                hist.index, hist["Open"], hist["High"], hist["Low"], hist["Close"], volumes
+            )
+        ]
+
+    def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        # `fast_info` avoids the heavier quoteSummary call (and '429 Too Many Requests')
+        # for symbols that get rejected on exchange alone
+        ticker = yf.Ticker(symbol)
+        try:
+            exchange = (ticker.fast_info.get('exchange') or '').upper()
+            quote_type = (ticker.fast_info.get('quoteType') or '').upper()
+        except KeyError as e:
+            # yfinance internal error when data is missing (e.g. 'currentTradingPeriod')
+            logger.warning(f"yfinance data missing for '{symbol}': {e}")
+            return None
+        if not exchange:
+            return None
+        info = ticker.info
+        name = info.get('longName') or info.get('shortName')
+        return SymbolInfo(symbol=symbol, exchange=exchange, quote_type=quote_type or None, name=name)
+
+    def get_batch_symbol_info(self, symbols: Sequence[str]) -> Dict[str, SymbolInfo]:
+        # yfinance has no multi-symbol listing lookup; one call still shares a
+        # session and is budgeted as a whole by the guard
+        results: Dict[str, SymbolInfo] = {}
+        for symbol in symbols:
+            info = self.get_symbol_info(symbol)
+            if info is not None:
+                results[symbol] = info
+        return results
+
+    def get_batch_history(self, symbols: Sequence[str], start: date) -> Dict[str, List[PriceBar]]:
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        data = yf.download(
+            tickers=symbols,
+            start=start,
+            end=date.today() + timedelta(days=1),
+            interval='1d',
+            group_by='ticker',
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        results: Dict[str, List[PriceBar]] = {}
+        for symbol in symbols:
+            frame = _split_download(data, symbol, multiple=len(symbols) > 1)
+            if frame is not None and not frame.empty:
+                results[symbol] = frame_to_bars(symbol, frame)
+        return results
+
+
+def frame_to_bars(symbol: str, frame: pd.DataFrame) -> List[PriceBar]:
+    """Convert a yfinance OHLCV frame (DatetimeIndex) to PriceBars, skipping rows without a close."""
+    frame = frame.dropna(subset=["Close"])
+    volumes = frame["Volume"].fillna(0).astype("int64") if "Volume" in frame else [None] * len(frame)
+    return [
+        PriceBar(
+            symbol=symbol,
+            date=timestamp.date(),
+            open=float(open_price),
+            high=float(high_price),
+            low=float(low_price),
+            close=float(close_price),
+            volume=int(volume) if volume is not None else None,
+        )
+        for timestamp, open_price, high_price, low_price, close_price, volume in zip(
+            frame.index, frame["Open"], frame["High"], frame["Low"], frame["Close"], volumes
+        )
+    ]
+
+
+def _split_download(data: pd.DataFrame, symbol: str, multiple: bool) -> Optional[pd.DataFrame]:
+    """Extract one symbol's OHLCV frame from a (possibly multi-ticker) download."""
+    if data is None or data.empty:
+        return None
+    if isinstance(data.columns, pd.MultiIndex):
+        if symbol not in data.columns.get_level_values(0):
+            return None
+        frame = data[symbol]
+    elif multiple:
+        return None
+    else:
+        frame = data
+    return frame.dropna(subset=['Close'])
@@ -1,9 +1,9 @@
 """Repository implementations for the graph domain."""
 
 from .base import GraphRepositoryProtocol
-from .database_repository import DatabaseGraphRepository
+from .database_repository import DatabaseGraphRepository, NodeNotFoundError, RelationshipExistsError
 from .mock_graph import MockGraphRepository
 
-__all__ = ["GraphRepositoryProtocol", "MockGraphRepository", "DatabaseGraphRepository"]
+__all__ = ["GraphRepositoryProtocol", "MockGraphRepository", "DatabaseGraphRepository", "NodeNotFoundError", "RelationshipExistsError"]
 
 
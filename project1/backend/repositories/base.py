@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Protocol
+from typing import Iterable, Optional, Protocol, Sequence
 
-from backend.domain import Node, GraphSnapshot, Relationship
+from backend.domain import MetadataFilter, Node, GraphSnapshot, Relationship
 
 
 class GraphRepositoryProtocol(Protocol):
     """Repository contract for loading graph data."""
 
-    def get_graph_snapshot(self) -> GraphSnapshot:
+    def get_graph_snapshot(self, metadata_filters: Sequence[MetadataFilter] = ()) -> GraphSnapshot:
         ...
 
-    def list_nodes(self) -> Iterable[Node]:
+    def list_nodes(self, metadata_filters: Sequence[MetadataFilter] = ()) -> Iterable[Node]:
         ...
 
     def list_relationships(self) -> Iterable[Relationship]:
@@ -1,18 +1,92 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, Optional
-
+import operator
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import case, delete, func, or_, select, type_coerce, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.database.models import NodeModel, NodeRequestModel, RelationshipModel
-from backend.domain import Node, NodeRequest, GraphSnapshot, Relationship
+from backend.domain import MetadataFilter, Node, NodeRequest, GraphSnapshot, Relationship
 from backend.repositories.base import GraphRepositoryProtocol
+from backend.timing import stage
 
 # ⚠️ 重要：字段映射应该与 node_schema.py 保持一致！
 # 修改字段时，请确保这里的映射与 schema 定义一致
 from backend.domain.node_schema import NODE_FIELDS
 
+_NODES = NodeModel.__table__
+_RELATIONSHIPS = RelationshipModel.__table__
+
+# Column projections for the read-heavy paths (snapshot/search). Selecting plain
+# columns through Core skips ORM hydration and identity-map bookkeeping.
+_NODE_FIELD_NAMES = tuple(field_def.name for field_def in NODE_FIELDS)
+_NODE_COLUMNS = tuple(_NODES.c[name] for name in _NODE_FIELD_NAMES) + (
+    _NODES.c.metadata_json,
+)
+_RELATIONSHIP_COLUMNS = (
+    _RELATIONSHIPS.c.id,
+    _RELATIONSHIPS.c.source_id,
+    _RELATIONSHIPS.c.target_id,
+    _RELATIONSHIPS.c.type,
+    _RELATIONSHIPS.c.strength,
+    _RELATIONSHIPS.c.created_datetime,
+)
+
+# Keep IN (...) lists well below SQLite/PostgreSQL bind parameter limits
+_BULK_CHUNK_SIZE = 500
+
+_RELATIONSHIP_IDENTITY = ("source_id", "target_id", "type")
+
+_METADATA_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class NodeNotFoundError(LookupError):
+    """Raised when a write references a node that does not exist (FK violation)."""
+
+    def __init__(self, node_id: str, role: str = "Node") -> None:
+        super().__init__(f"{role} node not found: {node_id}")
+        self.node_id = node_id
+        self.role = role
+
+
+class RelationshipExistsError(ValueError):
+    """Raised when an update would duplicate another edge's (source_id, target_id, type)."""
+
+    def __init__(self, source_id: str, target_id: str, relationship_type: Optional[str]) -> None:
+        super().__init__(f"Relationship already exists: {source_id} -> {target_id} ({relationship_type})")
+
+
+def _is_foreign_key_violation(error: IntegrityError) -> bool:
+    """SQLSTATE 23503 on PostgreSQL; SQLite only reports it in the message."""
+    return getattr(error.orig, "pgcode", None) == "23503" or "FOREIGN KEY constraint failed" in str(error.orig)
+
+
+def _is_unique_violation(error: IntegrityError) -> bool:
+    """SQLSTATE 23505 on PostgreSQL; SQLite only reports it in the message."""
+    return getattr(error.orig, "pgcode", None) == "23505" or "UNIQUE constraint failed" in str(error.orig)
+
+
+def _parse_relationship_id(relationship_id: str) -> Optional[int]:
+    """Relationship IDs are integer surrogate keys exposed as strings."""
+    try:
+        return int(relationship_id)
+    except (TypeError, ValueError):
+        return None
+
 
 class DatabaseGraphRepository(GraphRepositoryProtocol):
     """Repository implementation using SQLAlchemy database."""
@@ -20,32 +94,54 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
     def __init__(self, db: Session) -> None:
         self._db = db
 
-    def get_graph_snapshot(self) -> GraphSnapshot:
-        """Get complete graph snapshot."""
-        nodes = self.list_nodes()
+    def get_graph_snapshot(self, metadata_filters: Sequence[MetadataFilter] = ()) -> GraphSnapshot:
+        """Get complete graph snapshot, optionally restricted by metadata filters."""
+        nodes = self.list_nodes(metadata_filters)
         relationships = self.list_relationships()
         return GraphSnapshot(nodes=nodes, relationships=relationships)
 
-    def list_nodes(self) -> Iterable[Node]:
-        """List all nodes."""
-        models = self._db.query(NodeModel).all()
-        return [self._model_to_node(model) for model in models]
+    def list_nodes(self, metadata_filters: Sequence[MetadataFilter] = ()) -> Iterable[Node]:
+        """List all nodes (column-projected, no ORM hydration)."""
+        query = select(*_NODE_COLUMNS)
+        for metadata_filter in metadata_filters:
+            query = query.where(self._metadata_clause(metadata_filter))
+        rows = self._db.execute(query).all()
+        with stage("convert"):
+            return [self._row_to_node(row) for row in rows]
+
+    def list_node_ids(self, node_type: Optional[str] = None) -> List[str]:
+        """IDs of all nodes, optionally of one type (no row hydration at all)."""
+        query = select(_NODES.c.id).order_by(_NODES.c.id)
+        if node_type is not None:
+            query = query.where(_NODES.c.type == node_type)
+        return list(self._db.execute(query).scalars())
 
     def list_relationships(self) -> Iterable[Relationship]:
-        """List all relationships."""
-        models = self._db.query(RelationshipModel).all()
-        return [self._model_to_relationship(model) for model in models]
+        """List all relationships (column-projected, no ORM hydration)."""
+        rows = self._db.execute(select(*_RELATIONSHIP_COLUMNS)).all()
+        with stage("convert"):
+            return [self._row_to_relationship(row) for row in rows]
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID."""
         model = self._db.query(NodeModel).filter(NodeModel.id == node_id).first()
         if not model:
             return None
-        return self._model_to_node(model)
+        with stage("convert"):
+            return self._model_to_node(model)
+
+    def get_existing_node_ids(self, node_ids: Iterable[str]) -> set[str]:
+        """The subset of `node_ids` that already exist (one IN query per chunk)."""
+        unique_ids = list(dict.fromkeys(node_ids))
+        existing: set[str] = set()
+        for start in range(0, len(unique_ids), _BULK_CHUNK_SIZE):
+            chunk = unique_ids[start:start + _BULK_CHUNK_SIZE]
+            existing.update(self._db.scalars(select(_NODES.c.id).where(_NODES.c.id.in_(chunk))))
+        return existing
 
     def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
         """Get a relationship by ID."""
-        model = self._db.query(RelationshipModel).filter(RelationshipModel.id == relationship_id).first()
+        model = self._get_relationship_model(relationship_id)
         if not model:
             return None
         return self._model_to_relationship(model)
@@ -72,7 +168,7 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         # 动态更新字段，基于 node_schema 定义
         for field_name, value in updates.items():
             if field_name == "metadata":
-                model.metadata_json = json.dumps(value)
+                model.metadata_json = dict(value)
             elif hasattr(model, field_name):
                 setattr(model, field_name, value)
 
@@ -82,24 +178,85 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
 
     def delete_node(self, node_id: str) -> bool:
         """Delete a node and its relationships."""
-        model = self._db.query(NodeModel).filter(NodeModel.id == node_id).first()
-        if not model:
-            return False
-        self._db.delete(model)
-        self._db.commit()
-        return True
+        return bool(self.delete_nodes([node_id]))
 
-    def create_relationship(self, relationship: Relationship) -> Relationship:
-        """Create a new relationship."""
-        model = self._relationship_to_model(relationship)
-        self._db.add(model)
+    def delete_nodes(self, node_ids: Iterable[str]) -> List[str]:
+        """
+        Delete many nodes in set-based statements and return the IDs actually deleted.
+
+        Edges are removed by the database via ON DELETE CASCADE on relationships,
+        so no node or relationship rows are loaded into the session.
+        """
+        unique_ids = list(dict.fromkeys(node_ids))
+        deleted: List[str] = []
+        for start in range(0, len(unique_ids), _BULK_CHUNK_SIZE):
+            chunk = unique_ids[start:start + _BULK_CHUNK_SIZE]
+            result = self._db.execute(
+                delete(_NODES).where(_NODES.c.id.in_(chunk)).returning(_NODES.c.id)
+            )
+            deleted.extend(row[0] for row in result)
         self._db.commit()
-        self._db.refresh(model)
-        return self._model_to_relationship(model)
+        return deleted
+
+    def create_relationship(self, relationship: Relationship) -> Optional[Relationship]:
+        """
+        Create a new relationship in a single INSERT ... ON CONFLICT DO NOTHING.
+
+        `relationship.id` is ignored; the database assigns the surrogate key.
+        Returns None if an edge with the same (source_id, target_id, type) exists.
+        Raises NodeNotFoundError when the source or target node is missing
+        (detected by the foreign keys, not by pre-flight lookups).
+        """
+        dialect_insert = postgresql.insert if self._dialect_name == "postgresql" else sqlite.insert
+        statement = (
+            dialect_insert(_RELATIONSHIPS)
+            .values(
+                source_id=relationship.source_id,
+                target_id=relationship.target_id,
+                type=relationship.type or 'works_with',
+                strength=relationship.strength,
+                created_datetime=relationship.created_datetime,
+            )
+            .on_conflict_do_nothing(index_elements=list(_RELATIONSHIP_IDENTITY))
+            .returning(*_RELATIONSHIP_COLUMNS)
+        )
+        try:
+            row = self._db.execute(statement).first()
+            self._db.commit()
+        except IntegrityError as e:
+            self._db.rollback()
+            if _is_foreign_key_violation(e):
+                raise self._missing_endpoint_error(relationship) from e
+            raise
+        if row is None:
+            return None
+        return self._row_to_relationship(row)
+
+    def _missing_endpoint_error(self, relationship: Relationship) -> NodeNotFoundError:
+        """Work out which endpoint violated the FK (error path only)."""
+        if self._db.get(NodeModel, relationship.source_id) is None:
+            return NodeNotFoundError(relationship.source_id, "Source")
+        return NodeNotFoundError(relationship.target_id, "Target")
+
+    def _get_relationship_model(self, relationship_id: str) -> Optional[RelationshipModel]:
+        key = _parse_relationship_id(relationship_id)
+        if key is None:
+            return None
+        return self._db.get(RelationshipModel, key)
+
+    @property
+    def _dialect_name(self) -> str:
+        return self._db.get_bind().dialect.name
 
     def update_relationship(self, relationship_id: str, **updates) -> Optional[Relationship]:
-        """Update an existing relationship."""
-        model = self._db.query(RelationshipModel).filter(RelationshipModel.id == relationship_id).first()
+        """
+        Update an existing relationship (None if it does not exist).
+
+        Raises NodeNotFoundError when a new source/target node is missing and
+        RelationshipExistsError when another edge already has the resulting
+        (source_id, target_id, type); the transaction is rolled back either way.
+        """
+        model = self._get_relationship_model(relationship_id)
         if not model:
             return None
 
@@ -114,13 +271,22 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         if "created_datetime" in updates:
             model.created_datetime = updates["created_datetime"]
 
-        self._db.commit()
+        updated = self._model_to_relationship(model)
+        try:
+            self._db.commit()
+        except IntegrityError as e:
+            self._db.rollback()
+            if _is_foreign_key_violation(e):
+                raise self._missing_endpoint_error(updated) from e
+            if _is_unique_violation(e):
+                raise RelationshipExistsError(updated.source_id, updated.target_id, updated.type) from e
+            raise
         self._db.refresh(model)
         return self._model_to_relationship(model)
 
     def delete_relationship(self, relationship_id: str) -> bool:
         """Delete a relationship."""
-        model = self._db.query(RelationshipModel).filter(RelationshipModel.id == relationship_id).first()
+        model = self._get_relationship_model(relationship_id)
         if not model:
             return False
         self._db.delete(model)
@@ -134,7 +300,7 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         ⚠️ 字段映射应该与 node_schema.py 中的 NODE_FIELDS 保持一致！
         添加新字段时，请确保在这里添加对应的映射。
         """
-        metadata = json.loads(model.metadata_json) if model.metadata_json else {}
+        metadata = dict(model.metadata_json or {})
         # Position is not stored in database - it's generated dynamically during graph layout
         
         # 动态构建字段字典，基于 node_schema 定义
@@ -154,6 +320,48 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         
         return Node(**node_data)
 
+    def _row_to_node(self, row: Row) -> Node:
+        """
+        Convert a projected row (NODE_FIELDS columns + metadata_json) to domain Node.
+
+        Same mapping as _model_to_node, but driven by the precomputed column order
+        instead of per-field getattr on an ORM instance.
+        """
+        *values, metadata_json = row
+        node_data = dict(zip(_NODE_FIELD_NAMES, values))
+        if node_data.get("type") is None:
+            node_data["type"] = "company"  # Default for backward compatibility
+        node_data["metadata"] = metadata_json or {}
+        return Node(**node_data)
+
+    def _metadata_clause(self, metadata_filter: MetadataFilter):
+        """
+        Translate a MetadataFilter into a SQL predicate on nodes.metadata_json.
+
+        Equality on PostgreSQL uses JSONB containment (@>) so the GIN index applies;
+        everything else compares the extracted value as float or text. Numeric
+        filters only match JSON numbers on every backend (as MetadataFilter.matches):
+        other values become NULL instead of failing the cast (PostgreSQL) or
+        comparing as text (SQLite).
+        """
+        column = _NODES.c.metadata_json
+        if metadata_filter.op == "eq" and self._dialect_name == "postgresql":
+            return type_coerce(column, JSONB).contains({metadata_filter.key: metadata_filter.value})
+        element = column[metadata_filter.key]
+        if metadata_filter.is_numeric:
+            # CASE (unlike AND) guarantees the cast only runs on numbers
+            extracted = case((self._is_json_number(metadata_filter.key), element.as_float()))
+        else:
+            extracted = element.as_string()
+        return _METADATA_OPERATORS[metadata_filter.op](extracted, metadata_filter.value)
+
+    def _is_json_number(self, key: str):
+        column = _NODES.c.metadata_json
+        if self._dialect_name == "postgresql":
+            return func.jsonb_typeof(column[key]) == "number"
+        # Path form as SQLAlchemy's SQLite JSON index; json_type reports booleans as 'true'/'false'
+        return func.json_type(column, f'$."{key}"').in_(("integer", "real"))
+
     def _node_to_model(self, node: Node) -> NodeModel:
         """
         Convert domain Node to database model.
@@ -166,7 +374,7 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         # 动态构建模型字段，基于 node_schema 定义
         model_data = {
             "id": node.id,
-            "metadata_json": json.dumps(node.metadata),
+            "metadata_json": dict(node.metadata),
         }
         
         # 从 schema 中获取所有字段并映射（排除 id 和 metadata）
@@ -182,7 +390,7 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         # Handle backward compatibility: if type is missing (old data), default to 'works_with'
         relationship_type = getattr(model, 'type', None) or 'works_with'
         return Relationship(
-            id=model.id,
+            id=str(model.id),
             source_id=model.source_id,
             target_id=model.target_id,
             type=relationship_type,
@@ -190,15 +398,16 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
             created_datetime=getattr(model, 'created_datetime', None),
         )
 
-    def _relationship_to_model(self, relationship: Relationship) -> RelationshipModel:
-        """Convert domain Relationship to database model."""
-        return RelationshipModel(
-            id=relationship.id,
-            source_id=relationship.source_id,
-            target_id=relationship.target_id,
-            type=relationship.type,
-            strength=relationship.strength,
-            created_datetime=relationship.created_datetime,
+    def _row_to_relationship(self, row: Row) -> Relationship:
+        """Convert a projected relationship row to domain Relationship."""
+        relationship_id, source_id, target_id, relationship_type, strength, created_datetime = row
+        return Relationship(
+            id=str(relationship_id),
+            source_id=source_id,
+            target_id=target_id,
+            type=relationship_type or 'works_with',
+            strength=strength,
+            created_datetime=created_datetime,
         )
 
     # NodeRequest CRUD methods
@@ -210,6 +419,24 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         self._db.refresh(model)
         return self._model_to_node_request(model)
 
+    def create_node_requests(self, node_requests: Sequence[NodeRequest], nodes: Sequence[Node] = ()) -> List[NodeRequest]:
+        """
+        Insert decided (or pending) requests together with the nodes they approve
+        in a single transaction; nothing is written if any insert fails.
+        """
+        request_models = [self._node_request_to_model(node_request) for node_request in node_requests]
+        try:
+            self._db.add_all([self._node_to_model(node) for node in nodes])
+            self._db.add_all(request_models)
+            self._db.flush()
+            # Convert before commit expires the models (avoids a refresh query per row)
+            created = [self._model_to_node_request(model) for model in request_models]
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return created
+
     def get_node_request(self, request_id: int) -> Optional[NodeRequest]:
         """Get a node request by ID."""
         model = self._db.query(NodeRequestModel).filter(NodeRequestModel.id == request_id).first()
@@ -223,8 +450,13 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         status: str,
         approver_id: Optional[str] = None,
         rejection_reason: Optional[str] = None,
+        node: Optional[Node] = None,
     ) -> Optional[NodeRequest]:
-        """Update node request status."""
+        """
+        Update node request status. An approving decision passes the `node` it
+        creates, which is inserted in the same transaction (a crash can never
+        leave the node without its approved request).
+        """
         model = self._db.query(NodeRequestModel).filter(NodeRequestModel.id == request_id).first()
         if not model:
             return None
@@ -235,12 +467,77 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
         if rejection_reason:
             model.rejection_reason = rejection_reason
         if status == "approved":
-            from datetime import datetime, timezone
             model.approved_at = datetime.now(timezone.utc)
 
+        try:
+            if node is not None:
+                self._db.add(self._node_to_model(node))
+            self._db.flush()
+            # Convert before commit expires the model (avoids a refresh query)
+            updated = self._model_to_node_request(model)
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return updated
+
+    def claim_pending_node_requests(self, limit: int) -> List[NodeRequest]:
+        """
+        Atomically move up to `limit` of the oldest pending requests to 'processing'
+        and return them. Concurrent workers never claim the same request: rows
+        already claimed elsewhere are skipped (SKIP LOCKED on PostgreSQL) or fail
+        the status check. Deferred requests wait until their retry_at.
+        """
+        now = datetime.now(timezone.utc)
+        oldest_pending = (
+            select(NodeRequestModel.id)
+            .where(
+                NodeRequestModel.status == "pending",
+                or_(NodeRequestModel.retry_at.is_(None), NodeRequestModel.retry_at <= now),
+            )
+            .order_by(NodeRequestModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(NodeRequestModel)
+            .where(NodeRequestModel.id.in_(oldest_pending), NodeRequestModel.status == "pending")
+            .values(status="processing", updated_at=now)
+            .returning(NodeRequestModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = self._db.scalars(statement).all()
+        # Convert before commit expires the models (avoids a refresh query per row)
+        claimed = sorted((self._model_to_node_request(model) for model in models), key=lambda request: request.id)
+        self._db.commit()
+        return claimed
+
+    def defer_node_request(self, request_id: int, retry_at: datetime) -> None:
+        """Return a claimed request to the pending queue, not to be claimed again before `retry_at`."""
+        self._db.execute(
+            update(NodeRequestModel)
+            .where(NodeRequestModel.id == request_id)
+            .values(
+                status="pending",
+                retry_count=NodeRequestModel.retry_count + 1,
+                retry_at=retry_at,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self._db.commit()
+
+    def requeue_stale_node_requests(self, claimed_before: datetime) -> int:
+        """Return requests stuck in 'processing' (e.g. the worker died) to the pending queue."""
+        result = self._db.execute(
+            update(NodeRequestModel)
+            .where(NodeRequestModel.status == "processing", NodeRequestModel.updated_at < claimed_before)
+            .values(status="pending", updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
         self._db.commit()
-        self._db.refresh(model)
-        return self._model_to_node_request(model)
+        return result.rowcount
 
     def _model_to_node_request(self, model: NodeRequestModel) -> NodeRequest:
         """Convert database model to domain NodeRequest."""
@@ -261,6 +558,8 @@ class DatabaseGraphRepository(GraphRepositoryProtocol):
             rejection_reason=model.rejection_reason,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            retry_count=model.retry_count or 0,
+            retry_at=model.retry_at,
         )
 
     def _node_request_to_model(self, node_request: NodeRequest) -> NodeRequestModel:
@@ -5,7 +5,7 @@ import random
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Sequence
 
-from backend.domain import Node, GraphSnapshot, Relationship
+from backend.domain import MetadataFilter, Node, GraphSnapshot, Relationship
 from backend.repositories.base import GraphRepositoryProtocol
 
 
@@ -104,12 +104,18 @@ class MockGraphRepository(GraphRepositoryProtocol):
             node_index=node_index,
         )
 
-    def get_graph_snapshot(self) -> GraphSnapshot:
+    def get_graph_snapshot(self, metadata_filters: Sequence[MetadataFilter] = ()) -> GraphSnapshot:
         cache = self._ensure_cache()
-        return GraphSnapshot(nodes=cache.nodes, relationships=cache.relationships)
-
-    def list_nodes(self) -> Iterable[Node]:
-        return self._ensure_cache().nodes
+        return GraphSnapshot(nodes=self.list_nodes(metadata_filters), relationships=cache.relationships)
+
+    def list_nodes(self, metadata_filters: Sequence[MetadataFilter] = ()) -> Iterable[Node]:
+        nodes = self._ensure_cache().nodes
+        if not metadata_filters:
+            return nodes
+        return tuple(
+            node for node in nodes
+            if all(metadata_filter.matches(node.metadata) for metadata_filter in metadata_filters)
+        )
 
     def list_relationships(self) -> Iterable[Relationship]:
         return self._ensure_cache().relationships
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.database.models import PriceBarModel
+from backend.domain import PriceBar
+
+_PRICE_BARS = PriceBarModel.__table__
+_BAR_COLUMNS = (
+    _PRICE_BARS.c.symbol,
+    _PRICE_BARS.c.date,
+    _PRICE_BARS.c.close,
+    _PRICE_BARS.c.open,
+    _PRICE_BARS.c.high,
+    _PRICE_BARS.c.low,
+    _PRICE_BARS.c.volume,
+)
+
+
+class PriceHistoryRepository:
+    """Local store of daily OHLC bars per symbol (table `price_bars`)."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def get_bars(self, symbol: str, start: Optional[date] = None, end: Optional[date] = None) -> List[PriceBar]:
+        """Bars for a symbol in ascending date order, optionally limited to [start, end]."""
+        query = select(*_BAR_COLUMNS).where(_PRICE_BARS.c.symbol == symbol)
+        if start is not None:
+            query = query.where(_PRICE_BARS.c.date >= start)
+        if end is not None:
+            query = query.where(_PRICE_BARS.c.date <= end)
+        rows = self._db.execute(query.order_by(_PRICE_BARS.c.date)).all()
+        return [PriceBar(*row) for row in rows]
+
+    def get_bars_for_symbols(self, symbols: Iterable[str], start: Optional[date] = None) -> Dict[str, List[PriceBar]]:
+        """Bars for many symbols in one query, grouped by symbol in ascending date order."""
+        symbol_list = list(symbols)
+        grouped: Dict[str, List[PriceBar]] = {symbol: [] for symbol in symbol_list}
+        if not symbol_list:
+            return grouped
+        query = select(*_BAR_COLUMNS).where(_PRICE_BARS.c.symbol.in_(symbol_list))
+        if start is not None:
+            query = query.where(_PRICE_BARS.c.date >= start)
+        for row in self._db.execute(query.order_by(_PRICE_BARS.c.symbol, _PRICE_BARS.c.date)):
+            grouped[row.symbol].append(PriceBar(*row))
+        return grouped
+
+    def get_price_ranges(
+        self, symbols: Iterable[str], start: date
+    ) -> Dict[str, Tuple[date, float, float]]:
+        """(first bar date, lowest low, highest high) since `start` per symbol, in one grouped query."""
+        symbol_list = list(symbols)
+        if not symbol_list:
+            return {}
+        query = (
+            select(
+                _PRICE_BARS.c.symbol,
+                func.min(_PRICE_BARS.c.date),
+                func.min(func.coalesce(_PRICE_BARS.c.low, _PRICE_BARS.c.close)),
+                func.max(func.coalesce(_PRICE_BARS.c.high, _PRICE_BARS.c.close)),
+            )
+            .where(_PRICE_BARS.c.symbol.in_(symbol_list), _PRICE_BARS.c.date >= start)
+            .group_by(_PRICE_BARS.c.symbol)
+        )
+        return {symbol: (first, low, high) for symbol, first, low, high in self._db.execute(query)}
+
+    def get_last_bar_dates(self, symbols: Iterable[str]) -> Dict[str, date]:
+        """Date of the latest stored bar per symbol (symbols without bars are omitted)."""
+        symbol_list = list(symbols)
+        if not symbol_list:
+            return {}
+        query = (
+            select(_PRICE_BARS.c.symbol, func.max(_PRICE_BARS.c.date))
+            .where(_PRICE_BARS.c.symbol.in_(symbol_list))
+            .group_by(_PRICE_BARS.c.symbol)
+        )
+        return {symbol: last for symbol, last in self._db.execute(query)}
+
+    def get_series_state(self, symbol: str) -> Tuple[Optional[date], Optional[date], Optional[datetime]]:
+        """(first bar date, last bar date, when the last bar was written) for a symbol."""
+        first, last = self._db.execute(
+            select(func.min(_PRICE_BARS.c.date), func.max(_PRICE_BARS.c.date)).where(
+                _PRICE_BARS.c.symbol == symbol
+            )
+        ).one()
+        if last is None:
+            return None, None, None
+        last_updated = self._db.execute(
+            select(_PRICE_BARS.c.updated_at).where(
+                _PRICE_BARS.c.symbol == symbol, _PRICE_BARS.c.date == last
+            )
+        ).scalar()
+        return first, last, last_updated
+
+    def upsert_bars(self, bars: Iterable[PriceBar]) -> int:
+        """Insert or overwrite bars (the latest bar may be provisional intraday)."""
+        # Application-side UTC like the other timestamp columns (not the DB session's time zone)
+        now = datetime.now(timezone.utc)
+        values = [
+            {
+                "symbol": bar.symbol,
+                "date": bar.date,
+                "open": bar.open,
+                "high": bar.high,
+                "low": bar.low,
+                "close": bar.close,
+                "volume": bar.volume,
+                "updated_at": now,
+            }
+            for bar in bars
+        ]
+        if not values:
+            return 0
+        dialect_insert = postgresql.insert if self._db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(_PRICE_BARS)
+        statement = statement.on_conflict_do_update(
+            index_elements=[_PRICE_BARS.c.symbol, _PRICE_BARS.c.date],
+            set_={
+                "open": statement.excluded.open,
+                "high": statement.excluded.high,
+                "low": statement.excluded.low,
+                "close": statement.excluded.close,
+                "volume": statement.excluded.volume,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        self._db.execute(statement, values)
+        self._db.commit()
+        return len(values)
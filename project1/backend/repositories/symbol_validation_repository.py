@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.database.models import SymbolValidationModel
+
+_VALIDATIONS = SymbolValidationModel.__table__
+
+
+class SymbolValidationRepository:
+    """Persistent ticker validation results (table `symbol_validations`); times are naive UTC."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def get(self, symbol: str, now: datetime) -> Optional[Tuple[bool, Optional[str], datetime]]:
+        """(is_valid, detail, expires_at) if an unexpired result is stored."""
+        row = self._db.execute(
+            select(_VALIDATIONS.c.is_valid, _VALIDATIONS.c.detail, _VALIDATIONS.c.expires_at).where(
+                _VALIDATIONS.c.symbol == symbol, _VALIDATIONS.c.expires_at > now
+            )
+        ).first()
+        return tuple(row) if row is not None else None
+
+    def put(self, symbol: str, is_valid: bool, detail: Optional[str], expires_at: datetime) -> None:
+        dialect_insert = postgresql.insert if self._db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(_VALIDATIONS).values(
+            symbol=symbol, is_valid=is_valid, detail=detail, expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[_VALIDATIONS.c.symbol],
+            set_={
+                "is_valid": statement.excluded.is_valid,
+                "detail": statement.excluded.detail,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        self._db.execute(statement)
+        self._db.commit()
+
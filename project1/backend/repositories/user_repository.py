@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from backend.database.models import UserModel
@@ -69,6 +70,33 @@ class UserRepository:
         )
         return self.create_user(new_user)
 
+    def ensure_user(self, user_id: str, email: str) -> bool:
+        """
+        Create the user with default balance/role unless it already exists, in one
+        idempotent INSERT ... ON CONFLICT DO NOTHING. The conflict covers both
+        unique columns, so an email still held by another user ID (e.g. a
+        re-created auth account) is logged instead of failing every request.
+        Returns True if a row was inserted.
+        """
+        now = datetime.now(timezone.utc)
+        dialect_insert = postgresql.insert if self._db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = (
+            dialect_insert(UserModel.__table__)
+            .values(id=user_id, email=email, balance=1000.0, role="user", created_at=now, updated_at=now)
+            .on_conflict_do_nothing()
+        )
+        try:
+            result = self._db.execute(statement)
+            self._db.commit()
+        except Exception as e:
+            logger.error(f"Failed to ensure user: {str(e)}", exc_info=True)
+            self._db.rollback()
+            raise
+        inserted = result.rowcount > 0
+        if not inserted and self._db.get(UserModel, user_id) is None:
+            logger.warning(f"User {user_id} not created: email {email} belongs to another user")
+        return inserted
+
     def _model_to_user(self, model: UserModel) -> User:
         """Convert database model to domain User."""
         return User(
@@ -0,0 +1,50 @@
+"""
+Record live market data into a fixture file for the offline fixture provider.
+
+Usage:
+    python scripts/record_market_fixture.py fixture.json AAPL MSFT NVDA [--days 400] [--intraday 5m 30m]
+
+Serve it with MARKET_DATA_PROVIDER=fixture MARKET_DATA_FIXTURE_PATH=fixture.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add the parent directory (project1/) to Python path so Python can find the 'backend' package
+script_dir = Path(__file__).parent    # scripts/
+backend_dir = script_dir.parent        # backend/
+project_root = backend_dir.parent      # project1/
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.market_data import FixtureProvider
+from backend.market_data.yfinance_provider import YFinanceProvider
+
+
+def record_fixture(path: str, symbols: list[str], days: int, intraday_intervals: list[str]) -> None:
+    """Record quotes, symbol info, `days` of daily bars and a week of intraday bars for `symbols` into `path`."""
+    symbols = [symbol.strip().upper() for symbol in symbols if symbol.strip()]
+    print(f"Recording {len(symbols)} symbols ({days} days of history)...")
+    fixture = FixtureProvider.record(
+        YFinanceProvider(),
+        symbols,
+        start=date.today() - timedelta(days=days),
+        intraday_start=date.today() - timedelta(days=7),
+        intraday_intervals=intraday_intervals,
+    )
+    fixture.save(path)
+    print(f"Saved {len(fixture.symbols)} symbols to {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Fixture file to write (JSON)")
+    parser.add_argument("symbols", nargs="+", help="Symbols to record")
+    parser.add_argument("--days", type=int, default=400, help="Days of daily history to record")
+    parser.add_argument("--intraday", nargs="*", default=[], help="Intraday intervals to record (last 7 days)")
+    args = parser.parse_args()
+    record_fixture(args.path, args.symbols, args.days, args.intraday)
@@ -0,0 +1,51 @@
+"""
+Rebuild the offline NASDAQ symbol directory used to validate node requests.
+
+Usage:
+    python scripts/refresh_symbol_directory.py [--output data/symbol_directory.json]
+    python scripts/refresh_symbol_directory.py --nasdaq-listed nasdaqlisted.txt --other-listed otherlisted.txt
+
+Downloads the Nasdaq Trader listing files (or reads local copies) and replaces
+the directory file atomically; running servers pick it up within a minute.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory (project1/) to Python path so Python can find the 'backend' package
+script_dir = Path(__file__).parent    # scripts/
+backend_dir = script_dir.parent        # backend/
+project_root = backend_dir.parent      # project1/
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.market_data import SymbolDirectory
+from backend.market_data.symbol_directory import SYMBOL_DIRECTORY_PATH
+
+
+def refresh_directory(output: str, nasdaq_listed: str | None, other_listed: str | None) -> None:
+    if nasdaq_listed:
+        print(f"Reading listing files {nasdaq_listed}, {other_listed or '-'}...")
+        directory = SymbolDirectory.from_listing_files(
+            Path(nasdaq_listed).read_text(encoding="utf-8"),
+            Path(other_listed).read_text(encoding="utf-8") if other_listed else "",
+        )
+    else:
+        print("Downloading Nasdaq Trader listing files...")
+        directory = SymbolDirectory.download()
+    if not len(directory):
+        sys.exit("No listings parsed; keeping the existing directory")
+    directory.save(output)
+    print(f"Saved {len(directory)} listings to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=SYMBOL_DIRECTORY_PATH, help="Directory file to write (JSON)")
+    parser.add_argument("--nasdaq-listed", help="Local copy of nasdaqlisted.txt (skips the download)")
+    parser.add_argument("--other-listed", help="Local copy of otherlisted.txt")
+    args = parser.parse_args()
+    refresh_directory(args.output, args.nasdaq_listed, args.other_listed)
@@ -45,8 +45,11 @@ def _seed_data_from_mock(db_repo: DatabaseGraphRepository) -> None:
     # Insert relationships
     for relationship in relationships:
         try:
-            db_repo.create_relationship(relationship)
-            print(f"  Created relationship: {relationship.id}")
+            created = db_repo.create_relationship(relationship)
+            if created is None:
+                print(f"  Skipped relationship {relationship.id}: already exists")
+                continue
+            print(f"  Created relationship: {created.id} ({relationship.source_id} -> {relationship.target_id})")
         except Exception as e:
             print(f"  Skipped relationship {relationship.id}: {e}")
 
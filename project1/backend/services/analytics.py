@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import warnings
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.database.config import SessionLocal
+from backend.domain import PriceBar
+from backend.repositories import DatabaseGraphRepository
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services.market_hours import last_session_date
+from backend.services.price_history import LEADING_GAP_TOLERANCE, load_daily_history
+from backend.services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+ANALYTICS_LOOKBACK_DAYS = int(os.getenv("ANALYTICS_LOOKBACK_DAYS", "365"))
+# Market proxy for beta; NASDAQ-100 tracker by default. Falls back to the equal-weighted
+# average of all companies when its history is unavailable.
+ANALYTICS_BENCHMARK_SYMBOL = os.getenv("ANALYTICS_BENCHMARK_SYMBOL", "QQQ").strip().upper()
+# Upper bound for a cold computation that back-fills history (GET /api/analytics)
+ANALYTICS_TIMEOUT_SECONDS = 60.0
+# Pairs/series with fewer overlapping daily returns than this get no statistics
+MIN_OBSERVATIONS = 20
+
+
+@dataclass(frozen=True)
+class MarketAnalytics:
+    """Return statistics across company nodes for one trading day."""
+
+    as_of: date
+    benchmark: str
+    symbols: List[str]
+    volatility: np.ndarray  # annualized, per symbol (NaN if too little data)
+    beta: np.ndarray  # against `benchmark`, per symbol
+    observations: np.ndarray  # daily returns available per symbol
+    correlation: np.ndarray  # N x N, pairwise-complete (NaN if too little overlap)
+    _positions: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._positions.update({symbol: i for i, symbol in enumerate(self.symbols)})
+
+    def correlation_between(self, a: str, b: str) -> Optional[float]:
+        i, j = self._positions.get(a), self._positions.get(b)
+        if i is None or j is None:
+            return None
+        return _finite(self.correlation[i, j])
+
+    def metrics(self) -> Dict[str, Dict[str, Optional[float]]]:
+        return {
+            symbol: {
+                "volatility": _finite(self.volatility[i]),
+                "beta": _finite(self.beta[i]),
+                "observations": int(self.observations[i]),
+            }
+            for i, symbol in enumerate(self.symbols)
+        }
+
+    def correlation_rows(self) -> List[List[Optional[float]]]:
+        """Correlation matrix as nested lists with None for missing values (JSON friendly)."""
+        rounded = np.round(self.correlation, 4)
+        return [[_finite(value) for value in row] for row in rounded.tolist()]
+
+
+def _finite(value: float) -> Optional[float]:
+    return None if value is None or math.isnan(value) else float(value)
+
+
+def daily_returns(bars_by_symbol: Mapping[str, Sequence[PriceBar]], symbols: Sequence[str]) -> np.ndarray:
+    """
+    Simple daily returns as a (days x symbols) matrix aligned on the union of
+    trading dates; NaN where a symbol has no bar on a day or the day before.
+    """
+    frames = {
+        symbol: pd.Series([bar.close for bar in bars], index=[bar.date for bar in bars], dtype=float)
+        for symbol, bars in bars_by_symbol.items()
+        if bars
+    }
+    closes = pd.DataFrame(frames).sort_index().reindex(columns=list(symbols))
+    return closes.pct_change(fill_method=None).to_numpy(dtype=float)[1:]
+
+
+def pairwise_statistics(
+    returns: np.ndarray, min_observations: int = MIN_OBSERVATIONS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete statistics of the columns of `returns`: (cov, corr, var).
+
+    Missing values (NaN) are masked, so each pair uses exactly the days both
+    columns have data; `var[i, j]` is the variance of column i over the days
+    shared with column j. All pairs come out of a handful of matrix products
+    instead of a Python loop over N^2 pairs. Pairs with fewer than
+    `min_observations` shared days are NaN.
+    """
+    valid = ~np.isnan(returns)
+    mask = valid.astype(float)
+    x = np.where(valid, returns, 0.0)
+
+    n = mask.T @ mask  # shared observations per pair
+    sum_x = x.T @ mask  # [i, j]: sum of x_i over the days j is present (x_i is 0 where missing)
+    sum_xx = (x * x).T @ mask
+    sum_xy = x.T @ x
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = (sum_xy - sum_x * sum_x.T / n) / (n - 1)
+        var = (sum_xx - sum_x * sum_x / n) / (n - 1)
+        corr = cov / np.sqrt(var * var.T)
+    insufficient = n < min_observations
+    for matrix in (cov, var, corr):
+        matrix[insufficient] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    return cov, corr, var
+
+
+def compute_market_analytics(
+    bars_by_symbol: Mapping[str, Sequence[PriceBar]],
+    symbols: Sequence[str],
+    benchmark: str,
+    as_of: date,
+) -> MarketAnalytics:
+    """Volatility, beta and the correlation matrix for `symbols` (benchmark bars optional)."""
+    symbol_list = list(symbols)
+    returns = daily_returns(bars_by_symbol, [*symbol_list, benchmark])
+    company_returns, benchmark_returns = returns[:, :-1], returns[:, -1]
+    if np.count_nonzero(~np.isnan(benchmark_returns)) < MIN_OBSERVATIONS:
+        benchmark = "EQUAL_WEIGHT"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # days where no company traded
+            benchmark_returns = np.nanmean(company_returns, axis=1)
+
+    cov, corr, var = pairwise_statistics(np.column_stack([company_returns, benchmark_returns]))
+    with np.errstate(invalid="ignore"):
+        volatility = np.sqrt(np.diag(var)[:-1] * TRADING_DAYS_PER_YEAR)
+        # Benchmark variance over the same days as each company's covariance with it
+        beta = cov[:-1, -1] / var[-1, :-1]
+    return MarketAnalytics(
+        as_of=as_of,
+        benchmark=benchmark,
+        symbols=symbol_list,
+        volatility=volatility,
+        beta=beta,
+        observations=np.count_nonzero(~np.isnan(company_returns), axis=0),
+        correlation=corr[:-1, :-1],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cached analytics for the company nodes (recomputed once per trading day)
+# ---------------------------------------------------------------------------
+
+_cache_lock = threading.Lock()
+_cached: Optional[Tuple[Tuple[date, Tuple[str, ...]], MarketAnalytics]] = None
+_flight: SingleFlight[MarketAnalytics] = SingleFlight()
+
+
+def get_market_analytics() -> MarketAnalytics:
+    """
+    Analytics across all company nodes, computed at most once per trading day
+    (and again when the set of companies changes). Blocking: DB reads and,
+    for symbols without a year of stored history, provider downloads.
+    """
+    global _cached
+    with SessionLocal() as db:
+        symbols = tuple(DatabaseGraphRepository(db).list_node_ids(node_type="company"))
+    key = (last_session_date(), symbols)
+    with _cache_lock:
+        if _cached is not None and _cached[0] == key:
+            return _cached[1]
+
+    def compute() -> MarketAnalytics:
+        global _cached
+        analytics = _compute_for_symbols(list(symbols), as_of=key[0])
+        with _cache_lock:
+            _cached = (key, analytics)
+        return analytics
+
+    return _flight.do(f"{key[0].isoformat()}:{hash(symbols)}", compute)
+
+
+def _compute_for_symbols(node_ids: List[str], as_of: date) -> MarketAnalytics:
+    """Analytics keyed by node ID; price data is looked up by the upper-cased symbol."""
+    start = date.today() - timedelta(days=ANALYTICS_LOOKBACK_DAYS)
+    symbol_of = {node_id: node_id.strip().upper() for node_id in node_ids}
+    wanted = list(dict.fromkeys([*symbol_of.values(), ANALYTICS_BENCHMARK_SYMBOL]))
+    with SessionLocal() as db:
+        ranges = PriceHistoryRepository(db).get_price_ranges(wanted, start)
+    # Back-fill symbols whose stored history does not cover the window yet (one-off per symbol)
+    for symbol in wanted:
+        stored = ranges.get(symbol)
+        if stored is None or stored[0] > start + LEADING_GAP_TOLERANCE:
+            try:
+                load_daily_history(symbol, start)
+            except Exception as e:
+                logger.warning(f"Analytics: no history for '{symbol}': {e}")
+    with SessionLocal() as db:
+        bars_by_symbol = PriceHistoryRepository(db).get_bars_for_symbols(wanted, start)
+    bars_by_node = {node_id: bars_by_symbol.get(symbol, []) for node_id, symbol in symbol_of.items()}
+    bars_by_node[ANALYTICS_BENCHMARK_SYMBOL] = bars_by_symbol.get(ANALYTICS_BENCHMARK_SYMBOL, [])
+    analytics = compute_market_analytics(bars_by_node, node_ids, ANALYTICS_BENCHMARK_SYMBOL, as_of)
+    logger.info(f"Analytics computed for {len(node_ids)} companies as of {as_of} (benchmark {analytics.benchmark})")
+    return analytics
@@ -1,98 +1,214 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Tuple
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
-import yfinance as yf
-
-from backend.domain import Node, NodeRequest
+from backend.domain import Node, NodeRequest, SymbolInfo
+from backend.market_data import get_market_data_provider, get_symbol_directory
 from backend.repositories import DatabaseGraphRepository
+from backend.services.market_executor import MarketDataUnavailableError, call_market_data
+from backend.services.single_flight import SingleFlight
+from backend.services.validation_cache import symbol_validation_cache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Symbols per batched provider lookup (each costs about two upstream requests)
+PROVIDER_VALIDATION_BATCH_SIZE = 10
+# A batched lookup makes its upstream requests one after another, so it gets longer than a single call
+PROVIDER_VALIDATION_TIMEOUT_SECONDS = 60.0
+
+_validation_flight: SingleFlight[Tuple[bool, Optional[str]]] = SingleFlight()
+
+
+class _TransientValidationError(Exception):
+    """The provider could not decide (rate limit, upstream error); such results are never cached."""
+
+
+EMPTY_SYMBOL_ERROR = "Stock symbol must be a non-empty string"
+
 
 def is_valid_nasdaq_stock(symbol: str) -> Tuple[bool, Optional[str]]:
     """
-    Validate if a symbol is a valid NASDAQ stock using yfinance.
-    
-    Uses `fast_info` to avoid '429 Too Many Requests' rate limiting.
+    Validate if a symbol is a valid NASDAQ stock: offline symbol directory first,
+    then cached results, then the market-data provider.
     """
-    if not symbol or not isinstance(symbol, str):
-        return False, "Stock symbol must be a non-empty string"
+    try:
+        return _check_nasdaq_stock(symbol)
+    except MarketDataUnavailableError as e:
+        logger.warning(f"Market data unavailable while validating '{symbol}': {e}")
+        return False, str(e)
+    except _TransientValidationError as e:
+        return False, str(e)
+
+
+def check_nasdaq_stock(symbol: str) -> Optional[Tuple[bool, Optional[str]]]:
+    """
+    is_valid_nasdaq_stock for callers that can retry later: None instead of a
+    rejection when the provider could not decide (rate limit, upstream error).
+    """
+    try:
+        return _check_nasdaq_stock(symbol)
+    except (MarketDataUnavailableError, _TransientValidationError) as e:
+        logger.warning(f"Could not validate '{symbol}' now: {e}")
+        return None
+
+
+def _check_nasdaq_stock(symbol: str) -> Tuple[bool, Optional[str]]:
+    if not isinstance(symbol, str) or not symbol.strip():
+        return False, EMPTY_SYMBOL_ERROR
     
     symbol = symbol.strip().upper()
     
+    local = _validate_locally(symbol)
+    if local is not None:
+        return local
+
+    # Concurrent submissions of the same symbol share one upstream lookup, which runs
+    # on the bounded market-data pool with a timeout
+    return _validation_flight.do(symbol, lambda: _validate_and_cache(symbol))
+
+
+def validate_nasdaq_stocks(symbols: Iterable[str]) -> Dict[str, Optional[Tuple[bool, Optional[str]]]]:
+    """
+    Validate many symbols at once, keyed by normalized symbol.
+
+    Same rules and lookup order as is_valid_nasdaq_stock, but all symbols the
+    directory and cache do not know go to the provider together, in batched
+    calls of up to PROVIDER_VALIDATION_BATCH_SIZE symbols. Symbols the
+    provider could not decide map to None (see check_nasdaq_stock); once it
+    throttles or fails, the remaining batches are not sent, as they would
+    only drain the shared request budget.
+    """
+    results: Dict[str, Optional[Tuple[bool, Optional[str]]]] = {}
+    unknown: List[str] = []
+    for symbol in dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()):
+        local = _validate_locally(symbol)
+        if local is not None:
+            results[symbol] = local
+        else:
+            unknown.append(symbol)
+
+    for offset in range(0, len(unknown), PROVIDER_VALIDATION_BATCH_SIZE):
+        chunk = unknown[offset:offset + PROVIDER_VALIDATION_BATCH_SIZE]
+        try:
+            results.update(
+                call_market_data(_validate_batch_with_provider, chunk, timeout=PROVIDER_VALIDATION_TIMEOUT_SECONDS)
+            )
+        except (MarketDataUnavailableError, _TransientValidationError) as e:
+            undecided = unknown[offset:]
+            logger.warning(f"Could not validate {len(undecided)} symbol(s) now: {e}")
+            results.update(dict.fromkeys(undecided))
+            break
+    return results
+
+
+def _validate_locally(symbol: str) -> Optional[Tuple[bool, Optional[str]]]:
+    """Format check, offline directory and validation cache; None if the provider must decide."""
     # Basic format check: 1-5 uppercase letters
     if not symbol.isalpha() or len(symbol) < 1 or len(symbol) > 5:
         return False, f"Stock symbol '{symbol}' must be 1-5 uppercase letters"
     
-    try:
-        ticker = yf.Ticker(symbol)
-        
-        exchange = ticker.fast_info.get('exchange', '').upper()
-        quote_type = ticker.fast_info.get('quoteType', '').upper()
-        
-        # 调试打印：看看 Yahoo 到底返回了啥
-        print(f"Ticker: {symbol} | Exchange: {exchange} | Type: {quote_type}")
-
-        # 如果连 exchange 都没有，说明代码根本不存在
-        if not exchange:
-             return False, f"Stock symbol '{symbol}' not found"
-
-        # NASDAQ 交易所代码列表 (Yahoo Finance 内部代码)
-        nasdaq_exchanges = [
-            'NMS',      # Nasdaq National Market System (大盘股如 TSLA, AAPL)
-            'NGM',      # Nasdaq Global Market
-            'NCM',      # Nasdaq Capital Market
-            'NASDAQ',   # 标准代码
-        ]
-        
-        # 3. 校验逻辑
-        if exchange in nasdaq_exchanges:
-            # 严格模式：只允许普通股票 (EQUITY)，拒绝 ETF (如 QQQ)
-            if quote_type and quote_type != 'EQUITY':
-                # 如果你需要允许 ETF，请注释掉下面这行
-                return False, f"Symbol '{symbol}' is {quote_type}, not a common stock"
-            
-            # Return company name from yfinance if valid
-            long_name = ticker.info.get('longName')
-            short_name = ticker.info.get('shortName')
-            company_name = long_name or short_name
-            return True, company_name
-            
-        # 代码存在，但不在 NASDAQ (比如在 NYSE)
-        if exchange:
-            return False, f"Stock symbol '{symbol}' is listed on {exchange}, not NASDAQ"
-            
-        return False, f"Stock symbol '{symbol}' has unknown exchange data"
+    # Listed symbols are answered from the offline directory; only unknown ones go further
+    directory = get_symbol_directory()
+    listing = directory.lookup(symbol) if directory is not None else None
+    if listing is not None:
+        return _apply_listing_rules(symbol, listing)
 
-    except KeyError as e:
-        # yfinance internal error when data is missing (e.g. 'currentTradingPeriod')
-        # treat this as symbol not found
-        logger.warning(f"yfinance data missing for '{symbol}': {e}")
-        return False, f"Stock symbol '{symbol}' not found"
+    # Retries and duplicate submissions are answered from the validation cache
+    return symbol_validation_cache.get(symbol)
+
+
+def _validate_and_cache(symbol: str) -> Tuple[bool, Optional[str]]:
+    result = call_market_data(_validate_with_provider, symbol)
+    symbol_validation_cache.put(symbol, result)
+    return result
+
+
+def _validate_with_provider(symbol: str) -> Tuple[bool, Optional[str]]:
+    """Look the (normalized) symbol up with the market-data provider and apply the NASDAQ/EQUITY rules."""
+    info = _provider_lookup(f"'{symbol}'", lambda: get_market_data_provider().get_symbol_info(symbol))
+    return _apply_listing_rules(symbol, info)
+
+
+def _validate_batch_with_provider(symbols: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """One provider call for `symbols`; definitive results are cached."""
+    infos = _provider_lookup(
+        f"{len(symbols)} symbols", lambda: get_market_data_provider().get_batch_symbol_info(symbols)
+    )
+    results = {symbol: _apply_listing_rules(symbol, infos.get(symbol)) for symbol in symbols}
+    for symbol, result in results.items():
+        symbol_validation_cache.put(symbol, result)
+    return results
 
+
+def _provider_lookup(description: str, fn: Callable[[], T]) -> T:
+    """Run a provider lookup, turning rate limits and upstream errors into _TransientValidationError."""
+    try:
+        return fn()
+    except MarketDataUnavailableError:
+        raise
     except Exception as e:
-        # ✅ 修复：加上 "as e" 确保能打印出具体错误
         error_str = str(e)
         
         # 虽然 fast_info 很少触发 429，但还是防一手
         if '429' in error_str or 'Too Many Requests' in error_str:
-            logger.warning(f"Rate limit hit while validating '{symbol}'.")
-            return False, "System busy (Rate Limit), please try again later."
+            logger.warning(f"Rate limit hit while validating {description}.")
+            raise _TransientValidationError("System busy (Rate Limit), please try again later.") from e
             
-        logger.error(f"Error validating stock symbol '{symbol}': {error_str}")
+        logger.error(f"Error validating {description}: {error_str}")
         # 返回具体的错误信息方便调试
-        return False, f"System error validating '{symbol}': {error_str}"
+        raise _TransientValidationError(f"System error validating {description}: {error_str}") from e
+
+
+def _apply_listing_rules(symbol: str, info: Optional[SymbolInfo]) -> Tuple[bool, Optional[str]]:
+    """NASDAQ/EQUITY rules for a listing from the provider or the offline symbol directory."""
+    # 如果连 exchange 都没有，说明代码根本不存在
+    if info is None or not info.exchange:
+        return False, f"Stock symbol '{symbol}' not found"
+
+    exchange = info.exchange.upper()
+    quote_type = (info.quote_type or '').upper()
+    logger.debug(f"Ticker: {symbol} | Exchange: {exchange} | Type: {quote_type}")
+
+    # NASDAQ 交易所代码列表 (Yahoo Finance 内部代码)
+    nasdaq_exchanges = [
+        'NMS',      # Nasdaq National Market System (大盘股如 TSLA, AAPL)
+        'NGM',      # Nasdaq Global Market
+        'NCM',      # Nasdaq Capital Market
+        'NASDAQ',   # 标准代码 (also used by the offline symbol directory)
+    ]
+    
+    # 3. 校验逻辑
+    if exchange in nasdaq_exchanges:
+        # 严格模式：只允许普通股票 (EQUITY)，拒绝 ETF (如 QQQ)
+        if quote_type and quote_type != 'EQUITY':
+            # 如果你需要允许 ETF，请注释掉下面这行
+            return False, f"Symbol '{symbol}' is {quote_type}, not a common stock"
+        
+        # Return company name from the provider if valid
+        return True, info.name
+        
+    # 代码存在，但不在 NASDAQ (比如在 NYSE)
+    return False, f"Stock symbol '{symbol}' is listed on {exchange}, not NASDAQ"
 
 
 def approve_node_request(
     node_request: NodeRequest,
     user: Optional[dict],
     repository: DatabaseGraphRepository,
+    validate: Callable[[str], Tuple[bool, Optional[str]]] = is_valid_nasdaq_stock,
 ) -> Tuple[str, Optional[str], Optional[Node]]:
     """
     Automatically approve or reject a node request based on business rules.
+
+    Returns (status, rejection reason, node to create). Nothing is written:
+    the caller stores the decision and the node together with
+    repository.update_node_request_status. `validate` checks the symbol
+    (e.g. against results the caller already has).
     """
     # 1. Check if node_id already exists (Pre-check to save API calls)
     existing_node = repository.get_node(node_request.node_id)
@@ -116,19 +232,25 @@ def approve_node_request(
         )
     
     # 4. Check if node_id is a valid NASDAQ stock symbol
-    is_valid, company_name_or_error = is_valid_nasdaq_stock(node_request.node_id)
+    is_valid, company_name_or_error = validate(node_request.node_id)
     
     if not is_valid:
         # 使用返回的具体错误信息，而不是笼统的 invalid
         return ("rejected", company_name_or_error, None)
     
-    # 5. All checks passed - create the node
-    # Use company name from yfinance if available and user didn't provide a label (or to overwrite it)
-    # Current logic: If yfinance found a name, use it to overwrite the user provided label or fill it if empty.
+    # 5. All checks passed - build the node
+    # Use company name from the provider if available and user didn't provide a label (or to overwrite it)
+    # Current logic: If the provider found a name, use it to overwrite the user provided label or fill it if empty.
     # Since user input might be generic, using official name is better.
-    final_label = company_name_or_error if company_name_or_error else node_request.label
+    node = build_approved_node(node_request, company_name_or_error)
+    
+    return ("approved", None, node)
 
-    node = Node(
+
+def build_approved_node(node_request: NodeRequest, company_name: Optional[str]) -> Node:
+    """The node an approved request creates, labelled with the official company name when known."""
+    final_label = company_name if company_name else node_request.label
+    return Node(
         id=node_request.node_id,
         type=node_request.node_type,
         label=final_label,
@@ -138,8 +260,65 @@ def approve_node_request(
         metadata=node_request.metadata,
         position=None,  # Position calculated dynamically, not stored
     )
-    
-    # Assume create_node handles the DB insertion
-    created_node = repository.create_node(node)
-    
-    return ("approved", None, created_node)
\ No newline at end of file
+
+
+def approve_node_requests_batch(
+    node_requests: Sequence[NodeRequest],
+    user: dict,
+    repository: DatabaseGraphRepository,
+) -> Tuple[List[NodeRequest], List[str]]:
+    """
+    Decide many node requests at once: (stored requests, duplicate node IDs).
+
+    Node IDs are normalized to upper-case symbols and deduplicated (the first
+    request wins). Existing nodes are found with one IN query, all remaining
+    symbols are validated together, and the decided requests plus the nodes
+    they approve are written in a single transaction. Requests whose symbol
+    the provider could not decide are stored as 'pending' for the approval
+    queue instead of being rejected.
+    """
+    unique: Dict[str, NodeRequest] = {}
+    duplicates: List[str] = []
+    for node_request in node_requests:
+        node_id = node_request.node_id.strip().upper()
+        if node_id in unique:
+            duplicates.append(node_id)
+        else:
+            unique[node_id] = replace(node_request, node_id=node_id)
+
+    existing = repository.get_existing_node_ids(unique)
+    to_validate = [
+        node_id for node_id, node_request in unique.items()
+        if node_id and node_id not in existing and node_request.node_type == "company"
+    ]
+    validations = validate_nasdaq_stocks(to_validate)
+
+    now = datetime.now(timezone.utc)
+    decided: List[NodeRequest] = []
+    nodes: List[Node] = []
+    for node_id, node_request in unique.items():
+        if node_id in existing:
+            reason: Optional[str] = f"Node with ID '{node_id}' already exists"
+        elif node_request.node_type != "company":
+            reason = f"Only 'company' type nodes are allowed. Requested type: '{node_request.node_type}'"
+        elif not node_id:
+            reason = EMPTY_SYMBOL_ERROR
+        elif validations[node_id] is None:
+            # Left to the approval queue, which retries with backoff
+            decided.append(replace(node_request, status="pending"))
+            continue
+        else:
+            is_valid, company_name_or_error = validations[node_id]
+            reason = None if is_valid else company_name_or_error
+            if is_valid:
+                nodes.append(build_approved_node(node_request, company_name_or_error))
+        decided.append(
+            replace(
+                node_request,
+                status="rejected" if reason else "approved",
+                approver_id=user.get("id"),
+                approved_at=None if reason else now,
+                rejection_reason=reason,
+            )
+        )
+    return repository.create_node_requests(decided, nodes), duplicates
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.config import SessionLocal
+from backend.domain import NodeRequest
+from backend.repositories import DatabaseGraphRepository
+from backend.services.approval import approve_node_request, check_nasdaq_stock
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_WORKERS = int(os.getenv("APPROVAL_WORKERS", "2"))
+APPROVAL_BATCH_SIZE = int(os.getenv("APPROVAL_BATCH_SIZE", "20"))
+# Fallback polling for requests queued by other processes; local submissions wake a worker at once
+APPROVAL_POLL_SECONDS = float(os.getenv("APPROVAL_POLL_SECONDS", "2"))
+# Requests left in 'processing' this long (worker crashed mid-batch) are queued again
+APPROVAL_STALE_SECONDS = 300.0
+# Requests the provider could not validate (rate limit, upstream error) are retried with exponential backoff
+APPROVAL_RETRY_SECONDS = float(os.getenv("APPROVAL_RETRY_SECONDS", "30"))
+APPROVAL_RETRY_MAX_SECONDS = 900.0
+
+ANONYMOUS_REQUESTOR = "anonymous"
+
+
+def requestor_user(node_request: NodeRequest) -> Optional[dict]:
+    """The user the request was submitted as (None for anonymous submissions)."""
+    if node_request.requestor_id == ANONYMOUS_REQUESTOR:
+        return None
+    return {"id": node_request.requestor_id}
+
+
+class ApprovalWorkerPool:
+    """
+    Drains pending `node_requests` in the background.
+
+    Each worker claims a batch of pending requests, validates the distinct
+    company symbols in it concurrently (offline directory, validation cache,
+    then the bounded market-data pool), and then applies the decisions one
+    request at a time so duplicates within a batch resolve deterministically.
+    Requests whose symbol the provider could not decide go back to the queue
+    with a backoff instead of being rejected. Claims are atomic, so several
+    workers (or processes) can share the queue.
+    """
+
+    def __init__(
+        self,
+        workers: int = APPROVAL_WORKERS,
+        batch_size: int = APPROVAL_BATCH_SIZE,
+        poll_seconds: float = APPROVAL_POLL_SECONDS,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._session_factory = session_factory
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._run(), name=f"approval-worker-{i}") for i in range(self.workers)]
+        logger.info(f"Approval workers started ({self.workers} x batches of {self.batch_size})")
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def notify(self) -> None:
+        """Wake a worker for a newly queued request."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        try:
+            await asyncio.to_thread(self._requeue_stale)
+        except Exception as e:
+            logger.error(f"Re-queueing stale node requests failed: {e}")
+        while True:
+            self._wakeup.clear()
+            try:
+                processed = await self.process_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Approval batch failed: {e}")
+                processed = 0
+            if processed:
+                continue  # Keep draining while there is a backlog
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_once(self) -> int:
+        """Claim and decide one batch; returns the number of requests processed."""
+        batch = await asyncio.to_thread(self._claim)
+        if not batch:
+            return 0
+        # Validate the batch's distinct symbols in parallel; the decisions reuse these results
+        symbols = list({
+            request.node_id.strip().upper()
+            for request in batch
+            if request.node_type == "company" and requestor_user(request) is not None
+        })
+        results = await asyncio.gather(*(asyncio.to_thread(check_nasdaq_stock, symbol) for symbol in symbols))
+        await asyncio.to_thread(self._decide, batch, dict(zip(symbols, results)))
+        return len(batch)
+
+    def _claim(self) -> List[NodeRequest]:
+        with self._session_factory() as db:
+            return DatabaseGraphRepository(db).claim_pending_node_requests(self.batch_size)
+
+    def _requeue_stale(self) -> None:
+        claimed_before = datetime.now(timezone.utc) - timedelta(seconds=APPROVAL_STALE_SECONDS)
+        with self._session_factory() as db:
+            requeued = DatabaseGraphRepository(db).requeue_stale_node_requests(claimed_before)
+        if requeued:
+            logger.warning(f"Re-queued {requeued} node request(s) left in processing")
+
+    def _decide(self, batch: List[NodeRequest], validations: Dict[str, Optional[Tuple[bool, Optional[str]]]]) -> None:
+        """Apply the decisions; `validations` maps symbols to their result (None: provider undecided)."""
+        with self._session_factory() as db:
+            repository = DatabaseGraphRepository(db)
+            for node_request in batch:
+                symbol = node_request.node_id.strip().upper()
+                if symbol in validations and validations[symbol] is None:
+                    self._defer(repository, node_request)
+                    continue
+                user = requestor_user(node_request)
+                approver_id = user.get("id") if user else None
+                try:
+                    status, rejection_reason, node = approve_node_request(
+                        node_request, user, repository, validate=lambda node_id: validations[node_id.strip().upper()]
+                    )
+                    # The node and the decision commit together, so a crash cannot orphan either
+                    repository.update_node_request_status(
+                        node_request.id, status, approver_id=approver_id, rejection_reason=rejection_reason, node=node
+                    )
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Approval of node request {node_request.id} failed: {e}")
+                    status, rejection_reason = "rejected", f"Node creation failed: {e}"
+                    repository.update_node_request_status(
+                        node_request.id, status, approver_id=approver_id, rejection_reason=rejection_reason
+                    )
+                logger.info(f"Node request {node_request.id} ('{node_request.node_id}') {status}")
+
+    def _defer(self, repository: DatabaseGraphRepository, node_request: NodeRequest) -> None:
+        delay = min(APPROVAL_RETRY_SECONDS * 2 ** node_request.retry_count, APPROVAL_RETRY_MAX_SECONDS)
+        repository.defer_node_request(node_request.id, datetime.now(timezone.utc) + timedelta(seconds=delay))
+        logger.info(f"Node request {node_request.id} ('{node_request.node_id}') deferred for {delay:.0f}s")
@@ -1,21 +1,23 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Protocol, Sequence
+from typing import Callable, Iterable, Optional, Protocol, Sequence
 
-from backend.domain import Node, NodeDetail, GraphSnapshot
+from backend.domain import MetadataFilter, Node, NodeDetail, GraphSnapshot
 from backend.repositories import GraphRepositoryProtocol
 
 
 class GraphServiceProtocol(Protocol):
     """High-level operations available to the API layer."""
 
-    def get_graph_snapshot(self) -> GraphSnapshot:
+    def get_graph_snapshot(self, metadata_filters: Sequence[MetadataFilter] = ()) -> GraphSnapshot:
         ...
 
     def get_node_detail(self, node_id: str) -> Optional[NodeDetail]:
         ...
 
-    def search_nodes(self, query: str, limit: int = 5) -> Sequence[Node]:
+    def search_nodes(
+        self, query: str, limit: int = 5, metadata_filters: Sequence[MetadataFilter] = ()
+    ) -> Sequence[Node]:
         ...
 
 
@@ -26,18 +28,33 @@ class GraphService(GraphServiceProtocol):
     ⚠️ NOTE: Currently filters to 'company' type nodes only.
     This is a temporary restriction to support single-type graphs.
     Future enhancements may support multiple types (overlapped or separate graphs).
+
+    `release` (e.g. the session's close) runs after every read, so the
+    connection goes back to the pool before the endpoint awaits anything else.
+    Results are plain domain objects and stay usable afterwards.
     """
 
-    def __init__(self, repository: GraphRepositoryProtocol) -> None:
+    def __init__(self, repository: GraphRepositoryProtocol, release: Optional[Callable[[], None]] = None) -> None:
         self._repository = repository
+        self._release = release
+
+    def _done(self) -> None:
+        if self._release is not None:
+            self._release()
 
-    def get_graph_snapshot(self) -> GraphSnapshot:
+    def get_graph_snapshot(self, metadata_filters: Sequence[MetadataFilter] = ()) -> GraphSnapshot:
         """
         Get graph snapshot, currently filtered to only include 'company' type nodes.
         
+        Metadata filters are pushed down to the repository; edges are kept only
+        when both endpoints survive the filtering.
+
         TODO: In the future, this may accept a type parameter or support multiple types.
         """
-        snapshot = self._repository.get_graph_snapshot()
+        try:
+            snapshot = self._repository.get_graph_snapshot(metadata_filters)
+        finally:
+            self._done()
         # Filter to only company nodes for the current graph
         company_nodes = [node for node in snapshot.nodes if node.type == "company"]
         company_node_ids = {node.id for node in company_nodes}
@@ -49,14 +66,21 @@ class GraphService(GraphServiceProtocol):
         return GraphSnapshot(nodes=company_nodes, relationships=company_relationships)
 
     def get_node_detail(self, node_id: str) -> Optional[NodeDetail]:
-        node = self._repository.get_node(node_id)
+        try:
+            node = self._repository.get_node(node_id)
+        finally:
+            self._done()
         if not node:
             return None
         return node.to_detail()
 
-    def search_nodes(self, query: str, limit: int = 5) -> Sequence[Node]:
+    def search_nodes(
+        self, query: str, limit: int = 5, metadata_filters: Sequence[MetadataFilter] = ()
+    ) -> Sequence[Node]:
         """
         Search nodes, currently filtered to only search 'company' type nodes.
+
+        Metadata filters are applied by the repository before text matching.
         
         TODO: In the future, this may accept a type parameter or search across all types.
         """
@@ -64,9 +88,14 @@ class GraphService(GraphServiceProtocol):
         if not normalized:
             return ()
 
+        try:
+            nodes = list(self._repository.list_nodes(metadata_filters))
+        finally:
+            self._done()
+
         matches: list[Node] = []
         # Only search company nodes for the current graph
-        for node in self._repository.list_nodes():
+        for node in nodes:
             # Filter to company type only
             if node.type != "company":
                 continue
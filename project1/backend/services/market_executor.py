@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, TypeVar
+
+from backend.market_data.config import (
+    MARKET_DATA_MAX_PENDING,
+    MARKET_DATA_MAX_WORKERS,
+    MARKET_DATA_TIMEOUT_SECONDS,
+)
+from backend.market_data.errors import (  # noqa: F401 - re-exported for callers
+    MarketDataBusyError,
+    MarketDataTimeoutError,
+    MarketDataUnavailableError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_worker_state = threading.local()
+
+
+def _mark_worker_thread() -> None:
+    _worker_state.is_market_worker = True
+
+
+# Upstream market-data calls are synchronous and network-bound; they run on this
+# dedicated pool so a slow provider response never blocks the event loop.
+_executor = ThreadPoolExecutor(
+    max_workers=MARKET_DATA_MAX_WORKERS,
+    thread_name_prefix="market-data",
+    initializer=_mark_worker_thread,
+)
+_pending = threading.BoundedSemaphore(MARKET_DATA_MAX_PENDING)
+
+
+def _submit(fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+    if not _pending.acquire(blocking=False):
+        raise MarketDataBusyError("Market data service is busy, please try again later.")
+    try:
+        future = _executor.submit(fn, *args, **kwargs)
+    except BaseException:
+        _pending.release()
+        raise
+    future.add_done_callback(lambda _: _pending.release())
+    return future
+
+
+def call_market_data(fn: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs) -> T:
+    """
+    Run a blocking market-data call on the bounded pool and wait for it (sync callers).
+
+    Called from a market-data worker itself, `fn` runs inline to avoid
+    deadlocking the pool on nested calls.
+    """
+    if getattr(_worker_state, "is_market_worker", False):
+        return fn(*args, **kwargs)
+    future = _submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout if timeout is not None else MARKET_DATA_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        logger.warning(f"Market data call {getattr(fn, '__name__', fn)} timed out")
+        raise MarketDataTimeoutError("Market data request timed out, please try again later.")
+
+
+async def run_market_data(fn: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs) -> T:
+    """Async variant of call_market_data for use from `async def` endpoints."""
+    future = asyncio.wrap_future(_submit(functools.partial(fn, *args, **kwargs)))
+    try:
+        return await asyncio.wait_for(
+            future, timeout=timeout if timeout is not None else MARKET_DATA_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Market data call {getattr(fn, '__name__', fn)} timed out")
+        raise MarketDataTimeoutError("Market data request timed out, please try again later.")
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+# US equity regular session (NASDAQ/NYSE). Exchange holidays are not modelled;
+# on a holiday the market is treated as open, which only shortens cache TTLs.
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+
+def _market_now(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(MARKET_TZ)
+    if now.tzinfo is None:
+        raise ValueError("now must be timezone-aware")
+    return now.astimezone(MARKET_TZ)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """True during the regular weekday trading session."""
+    local = _market_now(now)
+    return local.weekday() < 5 and MARKET_OPEN <= local.time() < MARKET_CLOSE
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """The next session open strictly after `now` (timezone-aware, market time)."""
+    local = _market_now(now)
+    candidate = local.replace(hour=MARKET_OPEN.hour, minute=MARKET_OPEN.minute, second=0, microsecond=0)
+    if candidate <= local:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def seconds_until_close(now: Optional[datetime] = None) -> float:
+    """Seconds until today's close (0 if the session is not running)."""
+    local = _market_now(now)
+    if not is_market_open(local):
+        return 0.0
+    close = local.replace(hour=MARKET_CLOSE.hour, minute=MARKET_CLOSE.minute, second=0, microsecond=0)
+    return (close - local).total_seconds()
+
+
+def market_ttl(intraday_seconds: float) -> Callable[[], float]:
+    """
+    Build a TTL function: `intraday_seconds` while the market is open (never past
+    the close), otherwise until the next open.
+    """
+
+    def ttl() -> float:
+        local = _market_now(None)
+        if is_market_open(local):
+            # +1s so an entry refreshed just before the close covers the closing print
+            return min(intraday_seconds, seconds_until_close(local) + 1)
+        return (next_market_open(local) - local).total_seconds()
+
+    return ttl
+
+
+def last_session_date(now: Optional[datetime] = None) -> date:
+    """Market date of the most recent session that has opened (today once 09:30 has passed)."""
+    local = _market_now(now)
+    day = local.date()
+    if local.weekday() < 5 and local.time() >= MARKET_OPEN:
+        return day
+    day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def session_close(day: date) -> datetime:
+    """Close of the regular session on `day` (timezone-aware, market time)."""
+    return datetime.combine(day, MARKET_CLOSE, tzinfo=MARKET_TZ)
+
+
+def session_window_start(sessions: int, now: Optional[datetime] = None) -> date:
+    """First date of a window covering the last `sessions` weekday sessions."""
+    day = last_session_date(now)
+    for _ in range(max(sessions, 1) - 1):
+        day -= timedelta(days=1)
+        while day.weekday() >= 5:
+            day -= timedelta(days=1)
+    return day
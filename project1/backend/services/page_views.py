@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+class PageViewTracker:
+    """
+    Exponentially decayed view counts per key (e.g. company symbol).
+
+    A view counts 1.0 now and half as much after `half_life_seconds`, so the
+    ranking follows what people are looking at recently. In-memory and per
+    process; entries whose score decays below `min_score` are pruned.
+    """
+
+    def __init__(
+        self,
+        half_life_seconds: float = 3600.0,
+        max_entries: int = 10_000,
+        min_score: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._decay = math.log(2) / half_life_seconds
+        self._max_entries = max_entries
+        self._min_score = min_score
+        self._clock = clock
+        # key -> (score, as of)
+        self._scores: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, score: float, as_of: float, now: float) -> float:
+        return score * math.exp(-self._decay * (now - as_of))
+
+    def record(self, key: str) -> None:
+        now = self._clock()
+        with self._lock:
+            score, as_of = self._scores.get(key, (0.0, now))
+            self._scores[key] = (self._decayed(score, as_of, now) + 1.0, now)
+            if len(self._scores) > self._max_entries:
+                self._prune(now)
+
+    def score(self, key: str) -> float:
+        now = self._clock()
+        with self._lock:
+            entry = self._scores.get(key)
+        return self._decayed(*entry, now) if entry else 0.0
+
+    def rank(self, keys: Iterable[str]) -> List[str]:
+        """`keys` ordered by recent views (most viewed first); ties keep their input order."""
+        now = self._clock()
+        with self._lock:
+            scores = dict(self._scores)
+        key_list = list(keys)
+        return sorted(
+            key_list,
+            key=lambda key: -self._decayed(*scores[key], now) if key in scores else 0.0,
+        )
+
+    def _prune(self, now: float) -> None:
+        current = {key: self._decayed(score, as_of, now) for key, (score, as_of) in self._scores.items()}
+        kept = sorted((key for key, score in current.items() if score >= self._min_score), key=current.get, reverse=True)
+        self._scores = {key: (current[key], now) for key in kept[: self._max_entries // 2]}
+
+
+# Company page views (GET /api/nodes/{id}/stock), used to prioritise background refreshes
+company_page_views = PageViewTracker()
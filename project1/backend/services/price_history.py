@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+import pandas as pd
+
+from backend.database.config import SessionLocal
+from backend.domain import PriceBar
+from backend.market_data import get_market_data_provider
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services.market_hours import is_market_open, last_session_date, session_close
+
+logger = logging.getLogger(__name__)
+
+# A stored series starting later than this after the requested start is treated
+# as a leading gap (weekends and holidays alone never exceed it)
+LEADING_GAP_TOLERANCE = timedelta(days=7)
+
+
+def missing_range_start(
+    first: Optional[date],
+    last: Optional[date],
+    last_updated: Optional[datetime],
+    start: date,
+    now: Optional[datetime] = None,
+) -> Optional[date]:
+    """
+    Decide where an incremental download has to start, or None if the store is current.
+
+    Only the trailing days after the last stored bar are fetched. The last bar is
+    re-fetched while its session is running, or if it was written before that
+    session closed (it was a provisional intraday bar).
+    """
+    if last is None or first is None or first > start + LEADING_GAP_TOLERANCE:
+        return start
+    last_session = last_session_date(now)
+    if last < last_session:
+        return last
+    if last == last_session:
+        if is_market_open(now):
+            return last
+        if last_updated is None:
+            return last
+        written_at = last_updated if last_updated.tzinfo else last_updated.replace(tzinfo=timezone.utc)
+        if written_at < session_close(last):
+            return last
+    return None
+
+
+def load_daily_history(symbol: str, start: date) -> List[PriceBar]:
+    """
+    Daily bars for `symbol` from `start` to the latest session, served from the
+    local store and topped up from the provider only for missing trailing days.
+
+    If the provider fails, whatever is stored locally is returned.
+    """
+    with SessionLocal() as db:
+        repository = PriceHistoryRepository(db)
+        first, last, last_updated = repository.get_series_state(symbol)
+        fetch_start = missing_range_start(first, last, last_updated, start)
+        if fetch_start is not None:
+            try:
+                repository.upsert_bars(get_market_data_provider().get_history(symbol, fetch_start))
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Error updating price history for '{symbol}' from {fetch_start}: {e}")
+        return repository.get_bars(symbol, start)
+
+
+def bars_to_frame(bars: List[PriceBar]) -> pd.DataFrame:
+    """Convert stored bars to an OHLCV DataFrame (DatetimeIndex, OHLCV columns)."""
+    return pd.DataFrame(
+        {
+            "Open": [bar.open for bar in bars],
+            "High": [bar.high for bar in bars],
+            "Low": [bar.low for bar in bars],
+            "Close": [bar.close for bar in bars],
+            "Volume": [bar.volume for bar in bars],
+        },
+        index=pd.DatetimeIndex([bar.date for bar in bars], name="Date"),
+    )
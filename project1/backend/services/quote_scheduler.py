@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from backend.database.config import SessionLocal
+from backend.market_data import MarketDataUnavailableError
+from backend.repositories import DatabaseGraphRepository
+from backend.services.market_executor import run_market_data
+from backend.services.market_hours import MARKET_TZ, is_market_open, next_market_open
+from backend.services.page_views import PageViewTracker, company_page_views
+from backend.services.sparklines import refresh_sparklines
+from backend.services.stock_data import MAX_BATCH_SYMBOLS, QUOTE_TTL_SECONDS, prefetch_chart, refresh_quotes
+
+logger = logging.getLogger(__name__)
+
+QUOTE_REFRESH_ENABLED = os.getenv("QUOTE_REFRESH_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+# Refresh cadence while the market is open (defaults to the quote TTL, so page loads stay warm)
+QUOTE_REFRESH_INTERVAL_SECONDS = float(os.getenv("QUOTE_REFRESH_INTERVAL_SECONDS", str(QUOTE_TTL_SECONDS)))
+# The most viewed companies also get their default chart pre-loaded
+QUOTE_REFRESH_PREFETCH_CHARTS = int(os.getenv("QUOTE_REFRESH_PREFETCH_CHARTS", "20"))
+# A multi-ticker download of a full batch takes longer than a single-symbol call
+QUOTE_REFRESH_BATCH_TIMEOUT_SECONDS = 60.0
+
+
+def list_company_symbols() -> List[str]:
+    with SessionLocal() as db:
+        return DatabaseGraphRepository(db).list_node_ids(node_type="company")
+
+
+class QuoteRefreshScheduler:
+    """
+    Periodically batch-refreshes quotes for all company nodes so page loads hit warm caches.
+
+    Symbols are refreshed most-viewed first, one multi-symbol provider call per
+    batch. If the provider throttles (rate budget exhausted / circuit open), the
+    cycle stops and the less viewed remainder waits for the next one. While the
+    market is closed, one refresh picks up the closing prints and the scheduler
+    then sleeps until the next open.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = QUOTE_REFRESH_INTERVAL_SECONDS,
+        batch_size: int = MAX_BATCH_SYMBOLS,
+        prefetch_charts: int = QUOTE_REFRESH_PREFETCH_CHARTS,
+        page_views: PageViewTracker = company_page_views,
+        list_symbols: Callable[[], List[str]] = list_company_symbols,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.prefetch_charts = prefetch_charts
+        self._page_views = page_views
+        self._list_symbols = list_symbols
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="quote-refresh")
+            logger.info(f"Quote refresh scheduler started (every {self.interval_seconds:.0f}s while the market is open)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Quote refresh cycle failed: {e}")
+            await asyncio.sleep(self._next_delay())
+
+    def _next_delay(self, now: Optional[datetime] = None) -> float:
+        now = now or datetime.now(MARKET_TZ)
+        if is_market_open(now):
+            return self.interval_seconds
+        return max((next_market_open(now) - now).total_seconds(), self.interval_seconds)
+
+    async def refresh_once(self) -> int:
+        """Run one refresh cycle; returns the number of page quotes refreshed."""
+        symbols = self._page_views.rank(await asyncio.to_thread(self._list_symbols))
+        refreshed = 0
+        for offset in range(0, len(symbols), self.batch_size):
+            batch = symbols[offset:offset + self.batch_size]
+            try:
+                refreshed += len(
+                    await run_market_data(refresh_quotes, batch, timeout=QUOTE_REFRESH_BATCH_TIMEOUT_SECONDS)
+                )
+            except MarketDataUnavailableError as e:
+                logger.warning(f"Quote refresh stopped after {offset} of {len(symbols)} symbols: {e}")
+                return refreshed
+
+        viewed = [symbol for symbol in symbols[: self.prefetch_charts] if self._page_views.score(symbol) > 0]
+        for symbol in viewed:
+            try:
+                await run_market_data(prefetch_chart, symbol)
+            except MarketDataUnavailableError as e:
+                logger.warning(f"Chart prefetch stopped at '{symbol}': {e}")
+                break
+        # Refreshed bars are in the history store now; compute the session's sparklines off the request path
+        try:
+            await asyncio.to_thread(refresh_sparklines, symbols)
+        except Exception as e:
+            logger.warning(f"Sparkline precompute failed: {e}")
+        logger.info(f"Quote refresh: {refreshed} of {len(symbols)} company quotes warmed, {len(viewed)} charts checked")
+        return refreshed
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Set
+
+from backend.market_data import MarketDataUnavailableError
+from backend.services.market_executor import run_market_data
+from backend.services.market_hours import is_market_open
+from backend.services.stock_data import MAX_BATCH_SYMBOLS, poll_quotes
+
+logger = logging.getLogger(__name__)
+
+# Upstream poll cadence for streamed symbols while the market is open / closed
+QUOTE_STREAM_POLL_SECONDS = float(os.getenv("QUOTE_STREAM_POLL_SECONDS", "15"))
+QUOTE_STREAM_CLOSED_POLL_SECONDS = float(os.getenv("QUOTE_STREAM_CLOSED_POLL_SECONDS", "300"))
+# Ticks buffered per subscriber; a slow client loses the oldest ticks, never blocks the poller
+_SUBSCRIBER_QUEUE_SIZE = 16
+
+# Fields compared to decide whether a poll produced a new tick
+_TICK_FIELDS = ("price", "volume", "as_of")
+
+
+class QuoteStreamHub:
+    """
+    Fan-out of live quotes to stream subscribers.
+
+    One poller serves every subscribed symbol: each round polls all of them
+    with a single batch provider call, however many clients watch each one,
+    and pushes a tick to a symbol's subscribers only when its quote changed.
+    The poller starts with the first subscription and stops after the last one.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[Sequence[str]], Dict[str, Optional[Dict]]] = poll_quotes,
+        interval: Callable[[], float] = lambda: (
+            QUOTE_STREAM_POLL_SECONDS if is_market_open() else QUOTE_STREAM_CLOSED_POLL_SECONDS
+        ),
+    ) -> None:
+        self._poll = poll
+        self._interval = interval
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last_ticks: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def symbols(self) -> List[str]:
+        return sorted(self._subscribers)
+
+    def subscriber_count(self, symbol: str) -> int:
+        return len(self._subscribers.get(symbol, ()))
+
+    @asynccontextmanager
+    async def subscribe(self, symbol: str) -> AsyncIterator[asyncio.Queue]:
+        """Queue of tick dicts for `symbol`, primed with the last known tick."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        is_new_symbol = symbol not in self._subscribers
+        self._subscribers.setdefault(symbol, set()).add(queue)
+        if symbol in self._last_ticks:
+            queue.put_nowait(self._last_ticks[symbol])
+        self._ensure_running()
+        if is_new_symbol:
+            # Poll the new symbol right away instead of waiting for the next round
+            self._wakeup.set()
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[symbol]
+                    self._last_ticks.pop(symbol, None)
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            # Created per poller run so the hub survives event loop restarts (tests, reloads)
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run(self._wakeup), name="quote-stream")
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while self._subscribers:
+            wakeup.clear()
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Quote stream poll failed: {e}")
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self._interval())
+            except asyncio.TimeoutError:
+                pass
+
+    async def poll_once(self) -> None:
+        symbols = self.symbols
+        for offset in range(0, len(symbols), MAX_BATCH_SYMBOLS):
+            batch = symbols[offset:offset + MAX_BATCH_SYMBOLS]
+            try:
+                quotes = await run_market_data(self._poll, batch)
+            except MarketDataUnavailableError as e:
+                # Throttled: keep subscribers on their last tick and retry next round
+                logger.warning(f"Quote stream poll skipped: {e}")
+                return
+            for symbol, quote in quotes.items():
+                if quote is not None:
+                    self._publish(symbol, quote)
+
+    def _publish(self, symbol: str, quote: Dict) -> None:
+        previous = self._last_ticks.get(symbol)
+        if previous is not None and all(previous.get(field) == quote.get(field) for field in _TICK_FIELDS):
+            return
+        subscribers = self._subscribers.get(symbol)
+        if not subscribers:
+            return
+        tick = {key: value for key, value in quote.items() if key != 'history'}
+        self._last_ticks[symbol] = tick
+        for queue in subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(tick)
+
+
+quote_stream_hub = QuoteStreamHub()
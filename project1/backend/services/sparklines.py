@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.database.config import SessionLocal
+from backend.domain import PriceBar
+from backend.repositories import DatabaseGraphRepository
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services.downsampling import lttb_indices
+from backend.services.market_hours import last_session_date
+
+logger = logging.getLogger(__name__)
+
+# Calendar days of daily closes behind each sparkline
+SPARKLINE_DAYS = int(os.getenv("SPARKLINE_DAYS", "90"))
+SPARKLINE_POINTS = 30
+# Packed format: little-endian float32 closes, base64-encoded
+SPARKLINE_DTYPE = np.dtype("<f4")
+
+
+def pack_sparkline(values: np.ndarray) -> str:
+    return base64.b64encode(np.asarray(values, dtype=SPARKLINE_DTYPE).tobytes()).decode("ascii")
+
+
+def unpack_sparkline(packed: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(packed), dtype=SPARKLINE_DTYPE)
+
+
+def build_sparkline(bars: Sequence[PriceBar], points: int = SPARKLINE_POINTS) -> Optional[str]:
+    """Downsample daily closes (LTTB) to at most `points` values; None with fewer than two bars."""
+    if len(bars) < 2:
+        return None
+    x = np.fromiter((bar.date.toordinal() for bar in bars), dtype=np.float64, count=len(bars))
+    y = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=len(bars))
+    return pack_sparkline(y[lttb_indices(x, y, points)])
+
+
+def compute_sparklines(node_ids: Sequence[str], start: date) -> Dict[str, str]:
+    """Sparklines keyed by node ID, from the local price history store only (no provider calls)."""
+    symbol_of = {node_id: node_id.strip().upper() for node_id in node_ids}
+    with SessionLocal() as db:
+        bars_by_symbol = PriceHistoryRepository(db).get_bars_for_symbols(set(symbol_of.values()), start)
+    sparklines: Dict[str, str] = {}
+    for node_id, symbol in symbol_of.items():
+        packed = build_sparkline(bars_by_symbol.get(symbol, []))
+        if packed is not None:
+            sparklines[node_id] = packed
+    return sparklines
+
+
+_cache_lock = threading.Lock()
+# ((trading session, company node IDs or None for an on-demand snapshot), sparklines)
+_cached: Optional[Tuple[Tuple[date, Optional[Tuple[str, ...]]], Dict[str, str]]] = None
+
+
+def refresh_sparklines(node_ids: Sequence[str]) -> bool:
+    """
+    Recompute the sparkline snapshot unless it is already current for this
+    trading session and company list (quote refresh scheduler, after the
+    session's bars are stored). Returns whether it was recomputed.
+    """
+    global _cached
+    key = (last_session_date(), tuple(sorted(node_ids)))
+    with _cache_lock:
+        if _cached is not None and _cached[0] == key:
+            return False
+    sparklines = compute_sparklines(key[1], date.today() - timedelta(days=SPARKLINE_DAYS))
+    with _cache_lock:
+        _cached = (key, sparklines)
+    logger.info(f"Sparklines computed for {len(sparklines)} of {len(node_ids)} companies for the {key[0]} session")
+    return True
+
+
+def get_sparklines() -> Dict[str, str]:
+    """
+    Packed sparklines for all company nodes from the in-memory snapshot (no
+    DB reads). Only a missing or previous-session snapshot is computed on
+    demand (before the scheduler's first cycle, or with it disabled); the
+    scheduler replaces such a snapshot on its next cycle.
+    """
+    global _cached
+    session = last_session_date()
+    with _cache_lock:
+        if _cached is not None and _cached[0][0] == session:
+            return _cached[1]
+    with SessionLocal() as db:
+        node_ids = DatabaseGraphRepository(db).list_node_ids(node_type="company")
+    sparklines = compute_sparklines(node_ids, date.today() - timedelta(days=SPARKLINE_DAYS))
+    with _cache_lock:
+        _cached = ((session, None), sparklines)
+    return sparklines
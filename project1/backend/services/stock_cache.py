@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Shared pool for background revalidation of stale entries
+_revalidation_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stock-revalidate")
+
+
+def submit_revalidation(fn: Callable[..., object], *args: object) -> None:
+    """Run a (batch) refresh on the shared revalidation pool."""
+    _revalidation_executor.submit(fn, *args)
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    fresh_until: float
+    stale_until: float
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    In-memory keyed cache with stale-while-revalidate semantics.
+
+    - fresh entry: returned directly
+    - stale entry (past TTL, within `max_stale_seconds`): returned directly and
+      refreshed in the background, at most one refresh per key at a time
+    - missing/expired entry: loaded synchronously
+
+    Loaders return None for "no data"; None is never cached, and a failed
+    background refresh keeps the stale value.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Callable[[], float],
+        max_stale_seconds: float,
+        max_entries: int = 1024,
+    ) -> None:
+        self.name = name
+        self._ttl = ttl
+        self._max_stale_seconds = max_stale_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry[T]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, loader: Callable[[], Optional[T]]) -> Optional[T]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and now < entry.fresh_until:
+            return entry.value
+        if entry is not None and now < entry.stale_until:
+            self._schedule_refresh(key, loader)
+            return entry.value
+        return self._load(key, loader)
+
+    def lookup(self, key: str) -> Tuple[Optional[T], bool]:
+        """(value, is_fresh) without loading; (None, False) if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is None or now >= entry.stale_until:
+            return None, False
+        return entry.value, now < entry.fresh_until
+
+    def peek(self, key: str) -> Optional[T]:
+        """Return the cached value (fresh or stale) without loading."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.stale_until:
+            return None
+        return entry.value
+
+    def set(self, key: str, value: T) -> None:
+        now = time.monotonic()
+        ttl = max(self._ttl(), 0.0)
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + self._max_stale_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str, loader: Callable[[], Optional[T]]) -> Optional[T]:
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], Optional[T]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        _revalidation_executor.submit(self._refresh, key, loader)
+
+    def claim_refresh(self, keys: Iterable[str]) -> List[str]:
+        """Mark keys as refreshing; returns those not already being refreshed (for batch loaders)."""
+        with self._lock:
+            claimed = [key for key in keys if key not in self._refreshing]
+            self._refreshing.update(claimed)
+        return claimed
+
+    def release_refresh(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._refreshing.difference_update(keys)
+
+    def _refresh(self, key: str, loader: Callable[[], Optional[T]]) -> None:
+        try:
+            self._load(key, loader)
+        except Exception as e:
+            logger.warning(f"Background refresh of {self.name} cache failed for '{key}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
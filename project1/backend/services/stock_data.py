@@ -1,17 +1,117 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import os
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
+
+from backend.database.config import SessionLocal
+from backend.domain import PriceBar
+from backend.market_data import MarketDataUnavailableError, get_market_data_provider
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services.downsampling import lttb_indices
+from backend.services.market_hours import MARKET_TZ, market_ttl, session_window_start
+from backend.services.price_history import LEADING_GAP_TOLERANCE, bars_to_frame, load_daily_history
+from backend.services.single_flight import SingleFlight
+from backend.services.stock_cache import StaleWhileRevalidateCache, submit_revalidation
 
 logger = logging.getLogger(__name__)
 
+# Freshness while the market is open; after the close entries stay fresh until the next open
+QUOTE_TTL_SECONDS = float(os.getenv("STOCK_QUOTE_TTL_SECONDS", "60"))
+HISTORY_TTL_SECONDS = float(os.getenv("STOCK_HISTORY_TTL_SECONDS", "900"))
+
+# Stale entries are served (and refreshed in the background) for this long past their TTL
+_quote_cache: StaleWhileRevalidateCache[Dict] = StaleWhileRevalidateCache(
+    "quote", market_ttl(QUOTE_TTL_SECONDS), max_stale_seconds=24 * 3600
+)
+_history_cache: StaleWhileRevalidateCache[pd.DataFrame] = StaleWhileRevalidateCache(
+    "history", market_ttl(HISTORY_TTL_SECONDS), max_stale_seconds=7 * 24 * 3600
+)
+
+# Intraday charts follow the quote TTL; they are not kept in the local store
+_intraday_cache: StaleWhileRevalidateCache[pd.DataFrame] = StaleWhileRevalidateCache(
+    "intraday", market_ttl(QUOTE_TTL_SECONDS), max_stale_seconds=24 * 3600, max_entries=512
+)
+
+# Concurrent cache misses for the same key share one upstream fetch
+_quote_flight: SingleFlight[Optional[Dict]] = SingleFlight()
+_history_flight: SingleFlight[Optional[pd.DataFrame]] = SingleFlight()
+
+# Chart ranges -> calendar days of history ("1D"/"5D" count trading sessions instead)
+CHART_RANGES: Dict[str, int] = {
+    "1D": 1,
+    "5D": 5,
+    "1M": 31,
+    "3M": 92,
+    "6M": 183,
+    "1Y": 366,
+    "2Y": 731,
+    "5Y": 1827,
+}
+_SESSION_RANGES = {"1D", "5D"}
+DEFAULT_CHART_RANGE = "3M"
+_DEFAULT_INTERVALS = {"1D": "5m", "5D": "30m"}  # every other range defaults to "1d"
+
+# Intraday intervals -> the longest window (calendar days) Yahoo serves them for
+INTRADAY_INTERVALS: Dict[str, int] = {"1m": 7, "5m": 60, "15m": 60, "30m": 60, "1h": 730}
+# Daily-based intervals -> pandas resample rule (None: daily bars as stored)
+DAILY_INTERVALS: Dict[str, Optional[str]] = {"1d": None, "1wk": "W-MON", "1mo": "MS"}
+
+# Charts longer than the point budget are downsampled with LTTB
+DEFAULT_CHART_POINTS = 500
+MAX_CHART_POINTS = 5000
+
+_LABEL_FORMATS = {"1d": "%b %d", "1wk": "%b %d", "1mo": "%b %Y"}
+_INTRADAY_LABEL_FORMAT = "%b %d %H:%M"
+
+
+def resolve_chart_params(chart_range: Optional[str], interval: Optional[str]) -> Tuple[str, str]:
+    """
+    Normalize and validate a chart range/interval pair.
+
+    Raises ValueError for unknown ranges or intervals, and for intraday
+    intervals over ranges longer than the upstream supports.
+    """
+    chart_range = (chart_range or DEFAULT_CHART_RANGE).strip().upper()
+    if chart_range not in CHART_RANGES:
+        raise ValueError(f"Unknown range '{chart_range}'. Expected one of: {', '.join(CHART_RANGES)}")
+    interval = (interval or _DEFAULT_INTERVALS.get(chart_range, "1d")).strip().lower()
+    if interval in INTRADAY_INTERVALS:
+        if CHART_RANGES[chart_range] > INTRADAY_INTERVALS[interval]:
+            raise ValueError(
+                f"Interval '{interval}' is only available for ranges up to {INTRADAY_INTERVALS[interval]} days"
+            )
+    elif interval not in DAILY_INTERVALS:
+        raise ValueError(
+            f"Unknown interval '{interval}'. Expected one of: {', '.join([*INTRADAY_INTERVALS, *DAILY_INTERVALS])}"
+        )
+    return chart_range, interval
+
+
+def _range_start(chart_range: str) -> date:
+    if chart_range in _SESSION_RANGES:
+        return session_window_start(CHART_RANGES[chart_range])
+    return date.today() - timedelta(days=CHART_RANGES[chart_range])
 
-def get_stock_data(symbol: str) -> Optional[Dict]:
+
+def get_stock_data(
+    symbol: str,
+    chart_range: str = DEFAULT_CHART_RANGE,
+    interval: Optional[str] = None,
+    max_points: Optional[int] = DEFAULT_CHART_POINTS,
+) -> Optional[Dict]:
     """
-    Fetch real stock data using yfinance.
+    Fetch real stock data from the market-data provider, served from the quote/history caches.
+
+    `chart_range`/`interval` select the chart window (see CHART_RANGES,
+    INTRADAY_INTERVALS, DAILY_INTERVALS); charts with more than `max_points`
+    points are downsampled with LTTB. Raises ValueError for invalid chart
+    parameters, and MarketDataUnavailableError when the provider is throttled
+    or the circuit is open and no cached quote is available.
     
     Returns:
         Dict with keys:
@@ -23,6 +123,8 @@ def get_stock_data(symbol: str) -> Optional[Dict]:
         - week_52_low: float
         - volume: int
         - series: List[Dict] with dateLabel and price
+        - chart_data: List[Dict] with time ('YYYY-MM-DD', or UNIX seconds for intraday) and value
+        - range, interval: str
         - open: float
         - high: float
         - low: float
@@ -31,109 +133,398 @@ def get_stock_data(symbol: str) -> Optional[Dict]:
         return None
     
     symbol = symbol.strip().upper()
+    chart_range, interval = resolve_chart_params(chart_range, interval)
+
+    quote = _quote_cache.get(symbol, lambda: _quote_flight.do(symbol, lambda: _fetch_quote(symbol)))
+    if quote is None:
+        return None
+
+    start = _range_start(chart_range)
+    key = f"{symbol}:{chart_range}:{interval}"
+    if interval in INTRADAY_INTERVALS:
+        hist = _intraday_cache.get(
+            key, lambda: _history_flight.do(key, lambda: _fetch_intraday(symbol, start, interval))
+        )
+    else:
+        hist = _history_cache.get(
+            key, lambda: _history_flight.do(key, lambda: _fetch_history(symbol, start, interval))
+        )
+    return {
+        **_build_stock_payload(quote, hist, interval, max_points),
+        'range': chart_range,
+        'interval': interval,
+    }
+
+
+def _handle_fetch_error(symbol: str, what: str, e: Exception) -> None:
+    error_str = str(e)
+    logger.error(f"Error fetching {what} for '{symbol}': {error_str}")
     
+    # Handle rate limiting
+    if '429' in error_str or 'Too Many Requests' in error_str:
+        logger.warning(f"Rate limit hit while fetching {what} for '{symbol}'.")
+
+
+def _fetch_quote(symbol: str) -> Optional[Dict]:
+    """Fetch the intraday quote (price, change, day OHLC, 52-week range) from the provider."""
     try:
-        ticker = yf.Ticker(symbol)
-        
-        # Get current price and previous close
-        fast_info = ticker.fast_info
-        current_price = fast_info.get('lastPrice') or fast_info.get('regularMarketPrice')
-        previous_close = fast_info.get('previousClose')
-        
-        if current_price is None:
+        quote = get_market_data_provider().get_quote(symbol)
+        if quote is None:
             logger.warning(f"No price data available for {symbol}")
             return None
-        
+
+        current_price = quote.current_price
+        previous_close = quote.previous_close
         # Calculate day change
         if previous_close:
             day_change = current_price - previous_close
-            day_change_percent = (day_change / previous_close) * 100 if previous_close != 0 else 0
+            day_change_percent = (day_change / previous_close) * 100
         else:
             day_change = 0
             day_change_percent = 0
-        
-        # Get 52-week range
-        info = ticker.info
-        week_52_high = info.get('fiftyTwoWeekHigh') or info.get('52WeekHigh')
-        week_52_low = info.get('fiftyTwoWeekLow') or info.get('52WeekLow')
-        
-        # Get today's OHLC data
-        today_data = ticker.history(period='1d', interval='1d')
-        if not today_data.empty:
-            open_price = float(today_data['Open'].iloc[-1])
-            high_price = float(today_data['High'].iloc[-1])
-            low_price = float(today_data['Low'].iloc[-1])
-            volume = int(today_data['Volume'].iloc[-1])
-        else:
-            # Fallback to fast_info if history is not available
-            open_price = fast_info.get('open') or current_price
-            high_price = fast_info.get('dayHigh') or current_price
-            low_price = fast_info.get('dayLow') or current_price
-            volume = fast_info.get('volume') or 0
-        
-        # Get historical data for chart (3 months)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=100)  # Get ~100 days to ensure we have ~60-65 trading days (3 months)
-        hist = ticker.history(start=start_date, end=end_date, interval='1d')
-        
-        series: List[Dict[str, any]] = []  # type: ignore
-        chart_data: List[Dict[str, any]] = []  # type: ignore
-        if not hist.empty:
-            # Use all available data points (should be around 60-65 trading days for 3 months)
-            hist_slice = hist
-            for date, row in hist_slice.iterrows():
-                date_obj = date if isinstance(date, datetime) else datetime.fromisoformat(str(date))
-                date_label = date_obj.strftime('%b %d')
-                date_iso = date_obj.strftime('%Y-%m-%d')  # Format for lightweight-charts
-                
-                # For sparkline (backward compatibility)
-                series.append({
-                    'dateLabel': date_label,
-                    'price': float(row['Close'])
-                })
-                
-                # For lightweight-charts (time, value format)
-                chart_data.append({
-                    'time': date_iso,
-                    'value': float(row['Close'])
-                })
-        else:
-            # Fallback: create a simple series with current price
-            for i in range(16):
-                date = end_date - timedelta(days=15 - i)
-                date_iso = date.strftime('%Y-%m-%d')
-                series.append({
-                    'dateLabel': date.strftime('%b %d'),
-                    'price': float(current_price)
-                })
-                chart_data.append({
-                    'time': date_iso,
-                    'value': float(current_price)
-                })
-        
+
         return {
             'current_price': float(current_price),
-            'previous_close': float(previous_close) if previous_close else None,
+            'previous_close': previous_close,
             'day_change': float(day_change),
             'day_change_percent': float(day_change_percent),
-            'week_52_high': float(week_52_high) if week_52_high else None,
-            'week_52_low': float(week_52_low) if week_52_low else None,
-            'volume': volume,
-            'open': float(open_price),
-            'high': float(high_price),
-            'low': float(low_price),
-            'series': series,  # For backward compatibility
-            'chart_data': chart_data,  # For lightweight-charts
+            'week_52_high': quote.week_52_high,
+            'week_52_low': quote.week_52_low,
+            'volume': quote.volume or 0,
+            'open': quote.open if quote.open is not None else current_price,
+            'high': quote.high if quote.high is not None else current_price,
+            'low': quote.low if quote.low is not None else current_price,
         }
-        
+    except MarketDataUnavailableError:
+        # Throttled / circuit open: let callers serve stale data or fail fast, not "not found"
+        raise
     except Exception as e:
-        error_str = str(e)
-        logger.error(f"Error fetching stock data for '{symbol}': {error_str}")
-        
-        # Handle rate limiting
-        if '429' in error_str or 'Too Many Requests' in error_str:
-            logger.warning(f"Rate limit hit while fetching data for '{symbol}'.")
+        _handle_fetch_error(symbol, "quote", e)
+        return None
+
+
+def _fetch_history(symbol: str, start: date, interval: str) -> Optional[pd.DataFrame]:
+    """
+    Daily bars since `start` (resampled to weekly/monthly bars if asked) for the chart; None if unavailable.
+
+    Read from the local price history store; only missing trailing days are
+    downloaded, so a cold restart does not re-download the whole window.
+    """
+    try:
+        bars = load_daily_history(symbol, start)
+        if not bars:
+            return None
+        frame = bars_to_frame(bars)
+        rule = DAILY_INTERVALS[interval]
+        if rule is not None:
+            frame = (
+                frame.resample(rule, label="left", closed="left")
+                .agg({"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"})
+                .dropna(subset=["Close"])
+            )
+        return frame
+    except Exception as e:
+        _handle_fetch_error(symbol, "history", e)
+        return None
+
+
+def _fetch_intraday(symbol: str, start: date, interval: str) -> Optional[pd.DataFrame]:
+    """Intraday bars since the `start` session straight from the provider; None if unavailable."""
+    try:
+        bars = get_market_data_provider().get_intraday_history(symbol, start, interval)
+        if not bars:
             return None
-        
+        return pd.DataFrame(
+            {"Close": [bar.close for bar in bars]},
+            index=pd.to_datetime([bar.timestamp for bar in bars], utc=True).tz_convert(MARKET_TZ).rename("Datetime"),
+        )
+    except Exception as e:
+        _handle_fetch_error(symbol, "intraday history", e)
         return None
 
+
+def _build_stock_payload(
+    quote: Dict,
+    hist: Optional[pd.DataFrame],
+    interval: str = "1d",
+    max_points: Optional[int] = None,
+) -> Dict:
+    """Combine a cached quote and cached history into the API payload (no per-row pandas access)."""
+    intraday = interval in INTRADAY_INTERVALS
+    if hist is not None and not hist.empty:
+        index = hist.index
+        closes = hist['Close'].to_numpy(dtype=float)
+        if max_points and len(closes) > max_points:
+            keep = lttb_indices(index.as_unit('s').asi8, closes, max_points)
+            index, closes = index[keep], closes[keep]
+    else:
+        # Fallback: create a simple series with current price
+        intraday = False
+        index = pd.date_range(end=pd.Timestamp.now().normalize(), periods=16, freq='D')
+        closes = np.full(len(index), float(quote['current_price']))
+
+    labels = index.strftime(_INTRADAY_LABEL_FORMAT if intraday else _LABEL_FORMATS.get(interval, "%b %d"))
+    # lightweight-charts takes 'YYYY-MM-DD' business days, or UNIX seconds for intraday bars
+    times = index.as_unit('s').asi8.tolist() if intraday else index.strftime('%Y-%m-%d')
+    prices = closes.tolist()
+
+    return {
+        **quote,
+        'series': [{'dateLabel': label, 'price': price} for label, price in zip(labels, prices)],  # For backward compatibility
+        'chart_data': [{'time': time, 'value': price} for time, price in zip(times, prices)],  # For lightweight-charts
+    }
+
+
+# ---------------------------------------------------------------------------
+# Batch quotes: one multi-symbol download instead of N x 4 per-symbol calls
+# ---------------------------------------------------------------------------
+
+MAX_BATCH_SYMBOLS = 200
+# Calendar days of daily bars per batch refresh: the last two sessions even across a long weekend
+_BATCH_LOOKBACK_DAYS = 7
+
+_compact_quote_cache: StaleWhileRevalidateCache[Dict] = StaleWhileRevalidateCache(
+    "compact-quote", market_ttl(QUOTE_TTL_SECONDS), max_stale_seconds=24 * 3600, max_entries=4096
+)
+
+
+def normalize_symbols(symbols: Iterable[str]) -> List[str]:
+    """Strip, upper-case and dedupe symbols, preserving order."""
+    normalized = (symbol.strip().upper() for symbol in symbols if symbol and symbol.strip())
+    return list(dict.fromkeys(normalized))
+
+
+def get_batch_quotes(
+    symbols: Iterable[str],
+    include_history: bool = False,
+    history_days: int = 30,
+) -> Dict[str, Optional[Dict]]:
+    """
+    Compact quotes for many symbols, keyed by symbol (None when unavailable).
+
+    Cached symbols are served from the compact quote cache (stale ones are
+    refreshed in one background batch); all misses are fetched with a single
+    multi-symbol provider call. Downloaded daily bars are also written to
+    the local price history store, which is where optional history comes from.
+    """
+    symbol_list = normalize_symbols(symbols)[:MAX_BATCH_SYMBOLS]
+    quotes: Dict[str, Optional[Dict]] = {}
+    missing: List[str] = []
+    stale: List[str] = []
+    for symbol in symbol_list:
+        quote, is_fresh = _compact_quote_cache.lookup(symbol)
+        if quote is None:
+            missing.append(symbol)
+            continue
+        quotes[symbol] = quote
+        if not is_fresh:
+            stale.append(symbol)
+
+    if missing:
+        try:
+            quotes.update(_refresh_compact_quotes(missing))
+        except MarketDataUnavailableError:
+            # Serve what the cache has; fail only if there is nothing to serve
+            if not quotes:
+                raise
+    stale = _compact_quote_cache.claim_refresh(stale)
+    if stale:
+        submit_revalidation(_refresh_compact_quotes_in_background, stale)
+
+    if include_history:
+        start = date.today() - timedelta(days=history_days)
+        with SessionLocal() as db:
+            bars_by_symbol = PriceHistoryRepository(db).get_bars_for_symbols(
+                [symbol for symbol, quote in quotes.items() if quote is not None], start
+            )
+        quotes = {
+            symbol: (
+                {**quote, 'history': [{'time': bar.date.isoformat(), 'value': bar.close} for bar in bars_by_symbol.get(symbol, [])]}
+                if quote is not None else None
+            )
+            for symbol, quote in quotes.items()
+        }
+
+    return {symbol: quotes.get(symbol) for symbol in symbol_list}
+
+
+def _refresh_compact_quotes(symbols: List[str]) -> Dict[str, Optional[Dict]]:
+    return _refresh_batch(symbols)[0]
+
+
+def _refresh_batch(
+    symbols: List[str], persist: bool = True
+) -> Tuple[Dict[str, Optional[Dict]], Dict[str, List[PriceBar]]]:
+    """
+    Fetch recent daily bars for all symbols in one call, update the compact
+    quote cache and (with `persist`) the history store; returns (compact
+    quotes, bars by symbol).
+    """
+    window_start = date.today() - timedelta(days=_BATCH_LOOKBACK_DAYS)
+    try:
+        bars_by_symbol = get_market_data_provider().get_batch_history(symbols, start=window_start)
+    except MarketDataUnavailableError:
+        raise
+    except Exception as e:
+        _handle_fetch_error(",".join(symbols), "batch quotes", e)
+        return {symbol: None for symbol in symbols}, {}
+
+    results: Dict[str, Optional[Dict]] = {}
+    for symbol in symbols:
+        symbol_bars = bars_by_symbol.get(symbol)
+        if not symbol_bars:
+            results[symbol] = None
+            continue
+        quote = _compact_quote(symbol, symbol_bars)
+        _compact_quote_cache.set(symbol, quote)
+        results[symbol] = quote
+
+    if persist and bars_by_symbol:
+        _store_batch_bars(bars_by_symbol, window_start)
+    return results, bars_by_symbol
+
+
+def _store_batch_bars(bars_by_symbol: Dict[str, List[PriceBar]], window_start: date) -> None:
+    """
+    Upsert a batch download into the history store.
+
+    A symbol whose stored series ends before the window would be left with a
+    hole (missing_range_start does not notice it), so those symbols are
+    back-filled from their own last stored bar in a separate download instead
+    of widening the shared window for the whole batch.
+    """
+    try:
+        with SessionLocal() as db:
+            last_dates = PriceHistoryRepository(db).get_last_bar_dates(list(bars_by_symbol))
+    except Exception as e:
+        logger.error(f"Error reading stored price history state: {e}")
+        return
+
+    lagging = {symbol: last for symbol, last in last_dates.items() if last < window_start}
+    bars = [bar for symbol, symbol_bars in bars_by_symbol.items() if symbol not in lagging for bar in symbol_bars]
+    if lagging:
+        try:
+            backfill = get_market_data_provider().get_batch_history(list(lagging), start=min(lagging.values()))
+            bars.extend(bar for symbol_bars in backfill.values() for bar in symbol_bars)
+        except Exception as e:
+            # Their window bars are not stored either; the next refresh retries the back-fill
+            logger.warning(f"Price history back-fill skipped for {','.join(lagging)}: {e}")
+
+    if bars:
+        try:
+            with SessionLocal() as db:
+                PriceHistoryRepository(db).upsert_bars(bars)
+        except Exception as e:
+            logger.error(f"Error storing batch price history: {e}")
+
+
+def refresh_quotes(symbols: Iterable[str]) -> List[str]:
+    """
+    Warm the caches for many symbols with one provider call (background refresh).
+
+    Besides the compact quotes and the history store (see get_batch_quotes),
+    the page quote cache used by get_stock_data is filled with quotes derived
+    from the downloaded bars. The 52-week range comes from the local store, or
+    from the previous page quote while the store covers less than a year;
+    symbols with neither are left to the lazy per-symbol fetch. Returns the
+    symbols whose page quote was refreshed.
+    """
+    symbol_list = normalize_symbols(symbols)
+    _, bars_by_symbol = _refresh_batch(symbol_list)
+    if not bars_by_symbol:
+        return []
+
+    year_start = date.today() - timedelta(days=365)
+    try:
+        with SessionLocal() as db:
+            ranges = PriceHistoryRepository(db).get_price_ranges(bars_by_symbol, year_start)
+    except Exception as e:
+        logger.error(f"Error reading 52-week ranges: {e}")
+        ranges = {}
+
+    refreshed: List[str] = []
+    for symbol, bars in bars_by_symbol.items():
+        week_52 = None
+        stored = ranges.get(symbol)
+        if stored is not None and stored[0] <= year_start + LEADING_GAP_TOLERANCE:
+            week_52 = (stored[1], stored[2])
+        else:
+            previous = _quote_cache.peek(symbol)
+            if previous is not None and previous.get('week_52_low') is not None:
+                week_52 = (previous['week_52_low'], previous['week_52_high'])
+        if week_52 is None:
+            continue
+        _quote_cache.set(symbol, _page_quote_from_bars(bars, *week_52))
+        refreshed.append(symbol)
+    return refreshed
+
+
+def _page_quote_from_bars(bars: List[PriceBar], week_52_low: float, week_52_high: float) -> Dict:
+    """Build the get_stock_data quote dict from daily bars (latest bar = current session)."""
+    last = bars[-1]
+    previous_close = bars[-2].close if len(bars) > 1 else None
+    day_change = last.close - previous_close if previous_close else 0.0
+    return {
+        'current_price': last.close,
+        'previous_close': previous_close,
+        'day_change': day_change,
+        'day_change_percent': (day_change / previous_close) * 100 if previous_close else 0.0,
+        'week_52_high': max(week_52_high, last.high if last.high is not None else last.close),
+        'week_52_low': min(week_52_low, last.low if last.low is not None else last.close),
+        'volume': last.volume or 0,
+        'open': last.open if last.open is not None else last.close,
+        'high': last.high if last.high is not None else last.close,
+        'low': last.low if last.low is not None else last.close,
+    }
+
+
+def _refresh_compact_quotes_in_background(symbols: List[str]) -> None:
+    try:
+        _refresh_compact_quotes(symbols)
+    except MarketDataUnavailableError as e:
+        logger.warning(f"Background batch quote refresh skipped: {e}")
+    finally:
+        _compact_quote_cache.release_refresh(symbols)
+
+
+def _compact_quote(symbol: str, bars: List[PriceBar]) -> Dict:
+    last = bars[-1]
+    previous_close = bars[-2].close if len(bars) > 1 else None
+    change = last.close - previous_close if previous_close else 0.0
+    return {
+        'symbol': symbol,
+        'price': last.close,
+        'previous_close': previous_close,
+        'change': change,
+        'change_percent': (change / previous_close) * 100 if previous_close else 0.0,
+        'volume': last.volume,
+        'as_of': last.date.isoformat(),
+    }
+
+
+def prefetch_chart(symbol: str, chart_range: str = DEFAULT_CHART_RANGE) -> None:
+    """Load a daily chart into the history cache unless a fresh one is cached (background warm-up)."""
+    symbol = symbol.strip().upper()
+    chart_range, interval = resolve_chart_params(chart_range, None)
+    if interval in INTRADAY_INTERVALS:
+        return
+    key = f"{symbol}:{chart_range}:{interval}"
+    _, is_fresh = _history_cache.lookup(key)
+    if is_fresh:
+        return
+    start = _range_start(chart_range)
+    hist = _history_flight.do(key, lambda: _fetch_history(symbol, start, interval))
+    if hist is not None:
+        _history_cache.set(key, hist)
+
+
+def poll_quotes(symbols: Sequence[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Fresh compact quotes for `symbols` with one provider call, bypassing the cache (live streams).
+
+    Memory only: streams poll every few seconds, so nothing is read from or
+    written to the history store here; the refresh scheduler persists the
+    bars once per interval. The latest daily bar is the current session's,
+    so its close is the last traded price.
+    """
+    return _refresh_batch(normalize_symbols(symbols), persist=False)[0]
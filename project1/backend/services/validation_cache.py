@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.config import SessionLocal
+from backend.repositories.symbol_validation_repository import SymbolValidationRepository
+
+logger = logging.getLogger(__name__)
+
+# Listings rarely change: keep positive results for a week, let rejected tickers be retried sooner
+VALIDATION_CACHE_VALID_SECONDS = float(os.getenv("VALIDATION_CACHE_VALID_SECONDS", str(7 * 24 * 3600)))
+VALIDATION_CACHE_INVALID_SECONDS = float(os.getenv("VALIDATION_CACHE_INVALID_SECONDS", str(3600)))
+
+ValidationResult = Tuple[bool, Optional[str]]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class SymbolValidationCache:
+    """
+    Two-level cache of definitive ticker validation results.
+
+    An in-process LRU answers repeated lookups without I/O; the `symbol_validations`
+    table shares results across workers and restarts. Store errors are logged and
+    treated as misses, so the cache never blocks validation.
+    """
+
+    def __init__(
+        self,
+        valid_seconds: float = VALIDATION_CACHE_VALID_SECONDS,
+        invalid_seconds: float = VALIDATION_CACHE_INVALID_SECONDS,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_entries: int = 4096,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.valid_seconds = valid_seconds
+        self.invalid_seconds = invalid_seconds
+        self._session_factory = session_factory
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[ValidationResult, datetime]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> Optional[ValidationResult]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(symbol)
+                    return entry[0]
+                del self._entries[symbol]
+        try:
+            with self._session_factory() as db:
+                stored = SymbolValidationRepository(db).get(symbol, now)
+        except Exception as e:
+            logger.warning(f"Validation cache read failed for '{symbol}': {e}")
+            return None
+        if stored is None:
+            return None
+        is_valid, detail, expires_at = stored
+        self._remember(symbol, (is_valid, detail), expires_at)
+        return is_valid, detail
+
+    def put(self, symbol: str, result: ValidationResult) -> None:
+        ttl = self.valid_seconds if result[0] else self.invalid_seconds
+        expires_at = self._clock() + timedelta(seconds=ttl)
+        self._remember(symbol, result, expires_at)
+        try:
+            with self._session_factory() as db:
+                SymbolValidationRepository(db).put(symbol, result[0], result[1], expires_at)
+        except Exception as e:
+            logger.warning(f"Validation cache write failed for '{symbol}': {e}")
+
+    def clear(self) -> None:
+        """Drop the in-process entries (the table is left as is)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, symbol: str, result: ValidationResult, expires_at: datetime) -> None:
+        with self._lock:
+            self._entries[symbol] = (result, expires_at)
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+symbol_validation_cache = SymbolValidationCache()
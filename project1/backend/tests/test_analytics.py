@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.domain import PriceBar
+from backend.services.analytics import compute_market_analytics, pairwise_statistics
+
+DAYS = [date(2025, 1, 1) + timedelta(days=i) for i in range(301)]
+
+
+def _bars(symbol, returns, skip=()):
+    closes = 100 * np.cumprod(np.r_[1.0, 1.0 + returns])
+    return [PriceBar(symbol, day, close=float(close)) for i, (day, close) in enumerate(zip(DAYS, closes)) if i not in skip]
+
+
+@pytest.fixture()
+def market():
+    rng = np.random.default_rng(7)
+    benchmark = rng.normal(0, 0.01, 300)
+    return {
+        "AAA": _bars("AAA", 1.5 * benchmark + rng.normal(0, 0.004, 300), skip=range(40, 70)),
+        "BBB": _bars("BBB", -0.5 * benchmark + rng.normal(0, 0.01, 300)),
+        "CCC": _bars("CCC", rng.normal(0, 0.02, 300)),
+        "IDX": _bars("IDX", benchmark),
+    }
+
+
+def test_pairwise_statistics_match_pandas_with_gaps():
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0, 0.01, (200, 4))
+    returns[rng.random((200, 4)) < 0.2] = np.nan
+    _, corr, _ = pairwise_statistics(returns, min_observations=5)
+    expected = pd.DataFrame(returns).corr(min_periods=5).to_numpy()
+    np.testing.assert_allclose(corr, expected, atol=1e-10)
+
+
+def test_analytics_against_benchmark(market):
+    analytics = compute_market_analytics(market, ["AAA", "BBB", "CCC", "NEW"], "IDX", date(2026, 10, 19))
+    metrics = analytics.metrics()
+
+    closes = pd.DataFrame(
+        {symbol: pd.Series([bar.close for bar in bars], index=[bar.date for bar in bars]) for symbol, bars in market.items()}
+    ).sort_index()
+    returns = closes.pct_change(fill_method=None)
+    aaa, idx = returns["AAA"], returns["IDX"]
+    assert metrics["AAA"]["beta"] == pytest.approx(aaa.cov(idx) / idx[aaa.notna()].var())
+    assert metrics["BBB"]["volatility"] == pytest.approx(returns["BBB"].std() * np.sqrt(252))
+    assert analytics.correlation_between("AAA", "BBB") == pytest.approx(aaa.corr(returns["BBB"]))
+    assert metrics["AAA"]["beta"] > 1.2 and metrics["BBB"]["beta"] < 0
+    # No data at all: no statistics, but the symbol keeps its slot
+    assert metrics["NEW"] == {"volatility": None, "beta": None, "observations": 0}
+    assert analytics.correlation_between("AAA", "NEW") is None
+    assert analytics.correlation_rows()[0][0] == 1.0
+
+
+def test_missing_benchmark_falls_back_to_equal_weight(market):
+    analytics = compute_market_analytics(market, ["AAA", "BBB"], "QQQ", date(2026, 10, 19))
+    assert analytics.benchmark == "EQUAL_WEIGHT"
+    assert analytics.metrics()["AAA"]["beta"] is not None
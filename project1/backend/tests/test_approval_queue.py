@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from backend.database.models import NodeRequestModel
+from backend.domain import NodeRequest, SymbolInfo
+from backend.market_data import SymbolDirectory, set_symbol_directory
+from backend.repositories import DatabaseGraphRepository
+from backend.services import approval
+from backend.services.approval_queue import ApprovalWorkerPool
+
+
+@pytest.fixture(autouse=True)
+def symbol_directory():
+    set_symbol_directory(
+        SymbolDirectory(
+            {
+                "AAPL": SymbolInfo("AAPL", "NASDAQ", "EQUITY", "Apple Inc."),
+                "QQQ": SymbolInfo("QQQ", "NASDAQ", "ETF", "Invesco QQQ Trust"),
+            }
+        )
+    )
+    try:
+        yield
+    finally:
+        set_symbol_directory(None)
+
+
+def _submit(session_factory, node_id: str, requestor_id: str = "user-1") -> int:
+    with session_factory() as db:
+        return DatabaseGraphRepository(db).create_node_request(
+            NodeRequest(0, requestor_id, "pending", node_id, "company", node_id, f"About {node_id}")
+        ).id
+
+
+def _status(session_factory, request_id: int):
+    with session_factory() as db:
+        request = DatabaseGraphRepository(db).get_node_request(request_id)
+    return request.status, request.rejection_reason
+
+
+def test_claims_are_exclusive_and_oldest_first(session_factory):
+    ids = [_submit(session_factory, symbol) for symbol in ("AAPL", "QQQ", "MSFT")]
+    with session_factory() as db:
+        first = DatabaseGraphRepository(db).claim_pending_node_requests(2)
+        second = DatabaseGraphRepository(db).claim_pending_node_requests(2)
+
+    assert [request.id for request in first] == ids[:2]
+    assert [request.id for request in second] == ids[2:]
+    assert all(request.status == "processing" for request in first + second)
+
+
+def test_claim_is_a_single_statement(engine, session_factory):
+    for symbol in ("AAPL", "QQQ", "MSFT"):
+        _submit(session_factory, symbol)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    with session_factory() as db:
+        claimed = DatabaseGraphRepository(db).claim_pending_node_requests(10)
+
+    assert len(claimed) == 3 and claimed[0].node_id == "AAPL"
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+
+
+def test_worker_decides_a_batch(session_factory):
+    approved = _submit(session_factory, "AAPL")
+    duplicate = _submit(session_factory, "AAPL", requestor_id="user-2")
+    etf = _submit(session_factory, "QQQ")
+
+    pool = ApprovalWorkerPool(batch_size=10, session_factory=session_factory)
+    assert asyncio.run(pool.process_once()) == 3
+    assert asyncio.run(pool.process_once()) == 0
+
+    assert _status(session_factory, approved) == ("approved", None)
+    assert _status(session_factory, duplicate) == ("rejected", "Node with ID 'AAPL' already exists")
+    assert _status(session_factory, etf) == ("rejected", "Symbol 'QQQ' is ETF, not a common stock")
+    with session_factory() as db:
+        assert DatabaseGraphRepository(db).get_node("AAPL").label == "Apple Inc."
+
+
+def test_node_and_decision_are_written_together(engine, session_factory):
+    request_id = _submit(session_factory, "AAPL")
+    failures = []
+
+    def fail_first_decision(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE node_requests") and "approved_at=" in statement and not failures:
+            failures.append(statement)
+            raise RuntimeError("connection lost")
+
+    event.listen(engine, "before_cursor_execute", fail_first_decision)
+    pool = ApprovalWorkerPool(batch_size=10, session_factory=session_factory)
+    assert asyncio.run(pool.process_once()) == 1
+
+    # The failed decision took the node insert down with it
+    assert _status(session_factory, request_id) == ("rejected", "Node creation failed: connection lost")
+    with session_factory() as db:
+        assert DatabaseGraphRepository(db).get_node("AAPL") is None
+
+
+def test_undecided_symbols_are_retried_later(session_factory, monkeypatch):
+    request_id = _submit(session_factory, "ZQXW")
+    lookups = []
+
+    def busy(symbol):
+        lookups.append(symbol)
+        raise approval._TransientValidationError("System busy (Rate Limit), please try again later.")
+
+    monkeypatch.setattr(approval, "_validate_and_cache", busy)
+    pool = ApprovalWorkerPool(batch_size=10, session_factory=session_factory)
+    assert asyncio.run(pool.process_once()) == 1
+
+    # One lookup per batch; the request waits out its backoff instead of being rejected
+    assert lookups == ["ZQXW"]
+    assert _status(session_factory, request_id) == ("pending", None)
+    assert asyncio.run(pool.process_once()) == 0
+    with session_factory() as db:
+        request = db.get(NodeRequestModel, request_id)
+        assert request.retry_count == 1 and request.retry_at is not None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+from sqlalchemy import event
+
+from backend.auth import supabase_auth
+from backend.auth.known_users import known_users
+from backend.auth.token_cache import VerifiedTokenCache, verified_tokens
+
+SECRET = "test-secret"
+
+
+def _token(sub: str = "user-1", exp_in: float = 3600) -> str:
+    return jwt.encode({"sub": sub, "email": f"{sub}@example.com", "exp": int(time.time() + exp_in)}, SECRET, algorithm="HS256")
+
+
+@pytest.fixture()
+def auth_env(monkeypatch, session_factory):
+    monkeypatch.setattr(supabase_auth, "SUPABASE_JWT_SECRET", SECRET)
+    decodes = []
+    real_decode = supabase_auth.jwt.decode
+    monkeypatch.setattr(supabase_auth.jwt, "decode", lambda *args, **kwargs: decodes.append(1) or real_decode(*args, **kwargs))
+    verified_tokens.clear()
+    known_users.clear()
+    try:
+        yield session_factory, decodes
+    finally:
+        verified_tokens.clear()
+        known_users.clear()
+
+
+def _authenticate(session_factory, token: str) -> dict:
+    return supabase_auth.get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token), session_factory)
+
+
+def test_repeat_requests_skip_signature_verification(auth_env):
+    session_factory, decodes = auth_env
+    token = _token()
+    for _ in range(3):
+        assert _authenticate(session_factory, token)["id"] == "user-1"
+    assert len(decodes) == 1
+
+    # A tampered token hashes differently and is fully verified (and rejected)
+    with pytest.raises(supabase_auth.HTTPException) as error:
+        _authenticate(session_factory, token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+    assert error.value.status_code == 401
+    assert len(decodes) == 2
+
+
+def test_known_users_skip_the_users_table(auth_env, engine):
+    session_factory, _ = auth_env
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    token = _token("user-2")
+    for _ in range(3):
+        _authenticate(session_factory, token)
+    assert [statement.split()[0] for statement in statements if "users" in statement] == ["INSERT"]
+
+    # First login on another worker: the row exists already and the insert is a no-op
+    known_users.clear()
+    with session_factory() as db:
+        assert supabase_auth.UserRepository(db).get_user("user-2").balance == 1000.0
+        assert supabase_auth.UserRepository(db).ensure_user("user-2", "user-2@example.com") is False
+        # A new ID with an email that is already taken does not fail authentication
+        assert supabase_auth.UserRepository(db).ensure_user("user-3", "user-2@example.com") is False
+
+
+def test_sessions_are_opened_only_for_unknown_users(auth_env):
+    session_factory, _ = auth_env
+    opened = []
+
+    def counting_factory():
+        opened.append(1)
+        return session_factory()
+
+    assert supabase_auth.get_optional_user(None, counting_factory) is None
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=_token("user-3"))
+    for _ in range(3):
+        assert supabase_auth.get_optional_user(credentials, counting_factory)["id"] == "user-3"
+    assert len(opened) == 1
+
+
+def test_entries_expire_at_the_token_exp():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_entries=2, clock=lambda: now[0])
+    cache.put("a", {"sub": "a", "exp": 1060})
+    cache.put("no-exp", {"sub": "x"})
+    assert cache.get("a") == {"sub": "a", "exp": 1060}
+    assert cache.get("no-exp") is None
+
+    now[0] = 1060.0
+    assert cache.get("a") is None
+
+    # Bounded: least recently used tokens are evicted
+    for name in ("b", "c", "d"):
+        cache.put(name, {"sub": name, "exp": 2000})
+    assert cache.get("b") is None and cache.get("d") is not None
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from backend.domain import Node, Relationship, parse_metadata_filter
+from backend.repositories import DatabaseGraphRepository, NodeNotFoundError, RelationshipExistsError
+from backend.services import GraphService
+
+
+@pytest.fixture()
+def repository(db_session):
+    return DatabaseGraphRepository(db_session)
+
+
+def _node(node_id: str, **overrides) -> Node:
+    data = {
+        "id": node_id,
+        "type": "company",
+        "label": f"Label {node_id}",
+        "description": f"Description {node_id}",
+        "sector": "AI",
+        "color": "#667eea",
+        "metadata": {"marketCap": 500.0, "score": 0.5},
+    }
+    data.update(overrides)
+    return Node(**data)
+
+
+def test_list_nodes_projects_columns_into_domain_nodes(repository):
+    repository.create_node(_node("AAA"))
+    repository.create_node(_node("BBB", sector=None, color=None, metadata={}))
+
+    nodes = {node.id: node for node in repository.list_nodes()}
+
+    assert nodes["AAA"] == repository.get_node("AAA")
+    assert nodes["AAA"].metadata == {"marketCap": 500.0, "score": 0.5}
+    assert nodes["BBB"].sector is None
+    assert nodes["BBB"].metadata == {}
+
+
+def test_graph_service_releases_the_session_after_each_read(repository):
+    repository.create_node(_node("AAA"))
+    session = repository._db
+    service = GraphService(repository, release=session.close)
+
+    assert service.get_node_detail("AAA").id == "AAA"
+    assert not session.in_transaction()  # connection is back in the pool
+    assert [node.id for node in service.search_nodes("label")] == ["AAA"]
+    assert len(service.get_graph_snapshot().nodes) == 1
+    assert not session.in_transaction()
+
+
+def test_list_relationships_projects_columns(repository):
+    repository.create_node(_node("AAA"))
+    repository.create_node(_node("BBB"))
+    repository.create_relationship(
+        Relationship(id="", source_id="AAA", target_id="BBB", type="owns", strength=0.4)
+    )
+
+    (relationship,) = repository.list_relationships()
+
+    assert relationship.source_id == "AAA"
+    assert relationship.target_id == "BBB"
+    assert relationship.type == "owns"
+    assert relationship.strength == 0.4
+
+
+def test_list_nodes_applies_metadata_filters_in_sql(repository):
+    repository.create_node(_node("AAA", metadata={"marketCap": 900.0, "category": "Tier 1"}))
+    repository.create_node(_node("BBB", metadata={"marketCap": 200.0, "category": "Tier 2"}))
+    repository.create_node(_node("CCC", metadata={"category": "Tier 1"}))
+
+    big = repository.list_nodes([parse_metadata_filter("marketCap:gt:500")])
+    tier_one = repository.list_nodes([parse_metadata_filter("category:eq:Tier 1")])
+
+    assert [node.id for node in big] == ["AAA"]
+    assert sorted(node.id for node in tier_one) == ["AAA", "CCC"]
+
+
+def test_numeric_metadata_filters_skip_non_numeric_values(repository):
+    repository.create_node(_node("AAA", metadata={"marketCap": 900.0}))
+    repository.create_node(_node("BBB", metadata={"marketCap": "n/a"}))
+    repository.create_node(_node("CCC", metadata={"marketCap": "950"}))
+    repository.create_node(_node("DDD", metadata={"marketCap": True}))
+    nodes = {node.id: node for node in repository.list_nodes()}
+
+    for expression in ("marketCap:gt:500", "marketCap:ne:100", "marketCap:eq:900"):
+        metadata_filter = parse_metadata_filter(expression)
+        in_sql = [node.id for node in repository.list_nodes([metadata_filter])]
+        in_memory = [node_id for node_id, node in nodes.items() if metadata_filter.matches(node.metadata)]
+        assert in_sql == in_memory == ["AAA"], expression
+
+
+def test_parse_metadata_filter_rejects_malformed_expressions():
+    with pytest.raises(ValueError):
+        parse_metadata_filter("marketCap>500")
+    with pytest.raises(ValueError):
+        parse_metadata_filter("category:gt:Tier 1")
+
+
+def test_delete_nodes_cascades_to_relationships(repository):
+    for node_id in ("AAA", "BBB", "CCC"):
+        repository.create_node(_node(node_id))
+    repository.create_relationship(
+        Relationship(id="", source_id="AAA", target_id="BBB", type="owns")
+    )
+    repository.create_relationship(
+        Relationship(id="", source_id="CCC", target_id="BBB", type="owns")
+    )
+
+    deleted = repository.delete_nodes(["AAA", "BBB", "missing", "AAA"])
+
+    assert sorted(deleted) == ["AAA", "BBB"]
+    assert [node.id for node in repository.list_nodes()] == ["CCC"]
+    assert list(repository.list_relationships()) == []
+    assert repository.delete_node("AAA") is False
+
+
+def test_create_relationship_is_idempotent_per_identity(repository):
+    repository.create_node(_node("AAA"))
+    repository.create_node(_node("BBB"))
+    edge = Relationship(id="", source_id="AAA", target_id="BBB", type="owns")
+
+    created = repository.create_relationship(edge)
+    duplicate = repository.create_relationship(edge)
+    other_type = repository.create_relationship(
+        Relationship(id="", source_id="AAA", target_id="BBB", type="competes_with")
+    )
+
+    assert created is not None and created.id.isdigit()
+    assert duplicate is None
+    assert other_type is not None and other_type.id != created.id
+    assert repository.get_relationship(created.id) == created
+    assert repository.get_relationship("not-a-number") is None
+
+
+def test_create_relationship_reports_missing_endpoint(repository):
+    repository.create_node(_node("AAA"))
+
+    with pytest.raises(NodeNotFoundError) as excinfo:
+        repository.create_relationship(Relationship(id="", source_id="AAA", target_id="ZZZ", type="owns"))
+
+    assert excinfo.value.node_id == "ZZZ"
+    assert excinfo.value.role == "Target"
+
+
+def test_create_relationship_reraises_other_integrity_errors(repository):
+    repository.create_node(_node("AAA"))
+    repository.create_node(_node("BBB"))
+
+    # NOT NULL violation (e.g. a source_id the request validation let through)
+    with pytest.raises(IntegrityError):
+        repository.create_relationship(Relationship(id="", source_id=None, target_id="BBB", type="owns"))
+    assert repository.create_relationship(Relationship(id="", source_id="AAA", target_id="BBB", type="owns")) is not None
+
+
+def test_update_relationship_reports_duplicates_and_missing_endpoints(repository):
+    repository.create_node(_node("AAA"))
+    repository.create_node(_node("BBB"))
+    owns = repository.create_relationship(Relationship(id="", source_id="AAA", target_id="BBB", type="owns"))
+    competes = repository.create_relationship(Relationship(id="", source_id="AAA", target_id="BBB", type="competes_with"))
+
+    with pytest.raises(RelationshipExistsError):
+        repository.update_relationship(competes.id, type="owns")
+    with pytest.raises(NodeNotFoundError) as excinfo:
+        repository.update_relationship(competes.id, target_id="ZZZ")
+    assert excinfo.value.node_id == "ZZZ"
+
+    # Both failures were rolled back and the session is still usable
+    assert repository.get_relationship(competes.id) == competes
+    assert repository.update_relationship(owns.id, strength=0.9).strength == 0.9
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.domain import PriceBar, Quote, SymbolInfo
+from backend.market_data import FixtureProvider, set_market_data_provider
+from backend.services import approval, stock_data
+
+
+@pytest.fixture()
+def fixture_provider():
+    provider = FixtureProvider(
+        quotes={"AAPL": Quote("AAPL", current_price=110.0, previous_close=100.0, volume=5)},
+        infos={
+            "AAPL": SymbolInfo("AAPL", exchange="NMS", quote_type="EQUITY", name="Apple Inc."),
+            "QQQ": SymbolInfo("QQQ", exchange="NGM", quote_type="ETF", name="Invesco QQQ"),
+            "IBM": SymbolInfo("IBM", exchange="NYQ", quote_type="EQUITY", name="IBM"),
+        },
+        bars={
+            "AAPL": [
+                PriceBar("AAPL", date(2026, 10, 16), close=100.0, volume=3),
+                PriceBar("AAPL", date(2026, 10, 14), close=98.0),
+                PriceBar("AAPL", date(2026, 10, 15), close=99.0),
+            ]
+        },
+    )
+    set_market_data_provider(provider)
+    try:
+        yield provider
+    finally:
+        set_market_data_provider(None)
+
+
+def test_history_is_sorted_and_sliced(fixture_provider):
+    bars = fixture_provider.get_history("AAPL", date(2026, 10, 15))
+    assert [bar.date for bar in bars] == [date(2026, 10, 15), date(2026, 10, 16)]
+    assert fixture_provider.get_history("AAPL", date(2026, 10, 14), end=date(2026, 10, 14))[0].close == 98.0
+    assert fixture_provider.get_history("MSFT", date(2026, 10, 1)) == []
+    assert fixture_provider.get_batch_history(["AAPL", "MSFT"], date(2026, 10, 16)).keys() == {"AAPL"}
+
+
+def test_round_trips_through_json(fixture_provider, tmp_path):
+    path = tmp_path / "fixture.json"
+    fixture_provider.save(path)
+    replayed = FixtureProvider.from_file(path)
+
+    assert replayed.symbols == ["AAPL", "IBM", "QQQ"]
+    assert replayed.get_quote("AAPL") == fixture_provider.get_quote("AAPL")
+    assert replayed.get_symbol_info("QQQ") == fixture_provider.get_symbol_info("QQQ")
+    assert replayed.get_history("AAPL", date(2026, 1, 1)) == fixture_provider.get_history("AAPL", date(2026, 1, 1))
+
+
+def test_record_captures_source(fixture_provider):
+    recorded = FixtureProvider.record(fixture_provider, ["AAPL", "MSFT"], start=date(2026, 10, 15))
+    assert recorded.symbols == ["AAPL"]
+    assert len(recorded.get_history("AAPL", date(2026, 1, 1))) == 2
+
+
+def test_validation_uses_provider(fixture_provider):
+    assert approval._validate_with_provider("AAPL") == (True, "Apple Inc.")
+    assert approval._validate_with_provider("QQQ") == (False, "Symbol 'QQQ' is ETF, not a common stock")
+    assert approval._validate_with_provider("IBM") == (False, "Stock symbol 'IBM' is listed on NYQ, not NASDAQ")
+    assert approval._validate_with_provider("ZZZZ") == (False, "Stock symbol 'ZZZZ' not found")
+
+
+def test_quote_uses_provider(fixture_provider):
+    quote = stock_data._fetch_quote("AAPL")
+    assert quote["day_change"] == pytest.approx(10.0)
+    assert quote["day_change_percent"] == pytest.approx(10.0)
+    assert quote["open"] == quote["high"] == quote["low"] == 110.0
+    assert stock_data._fetch_quote("MSFT") is None
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.services import market_executor
+from backend.services.market_executor import (
+    MarketDataBusyError,
+    MarketDataTimeoutError,
+    call_market_data,
+    run_market_data,
+)
+
+
+def test_call_runs_on_pool_and_returns_result():
+    assert call_market_data(lambda a, b=0: a + b, 1, b=2) == 3
+
+
+def test_call_times_out():
+    release = threading.Event()
+    try:
+        with pytest.raises(MarketDataTimeoutError):
+            call_market_data(release.wait, 5, timeout=0.05)
+    finally:
+        release.set()
+
+
+def test_async_call_times_out_without_blocking_loop():
+    release = threading.Event()
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        try:
+            with pytest.raises(MarketDataTimeoutError):
+                await run_market_data(release.wait, 5, timeout=0.1)
+        finally:
+            task.cancel()
+        return ticks
+
+    try:
+        assert asyncio.run(main()) > 1
+    finally:
+        release.set()
+
+
+def test_rejects_calls_beyond_pending_limit(monkeypatch):
+    monkeypatch.setattr(market_executor, "_pending", threading.BoundedSemaphore(1))
+    release = threading.Event()
+    try:
+        first = market_executor._submit(release.wait, 5)
+        with pytest.raises(MarketDataBusyError):
+            call_market_data(lambda: None)
+    finally:
+        release.set()
+    assert first.result(timeout=5) is True
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.domain import Quote
+from backend.market_data import (
+    CircuitBreaker,
+    FixtureProvider,
+    GuardedProvider,
+    MarketDataCircuitOpenError,
+    MarketDataRateLimitedError,
+    MarketDataTimeoutError,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FlakyProvider(FixtureProvider):
+    """Fixture provider whose quote calls fail with the queued errors first."""
+
+    def __init__(self, errors) -> None:
+        super().__init__(quotes={"AAPL": Quote("AAPL", current_price=1.0)})
+        self.errors = list(errors)
+        self.calls = 0
+
+    def get_quote(self, symbol):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return super().get_quote(symbol)
+
+
+def test_token_bucket_bursts_then_waits_then_refuses():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() and bucket.acquire()
+    assert clock.now == 0.0
+    assert bucket.acquire(max_wait=1.0)  # waits for the next token
+    assert clock.now == pytest.approx(0.5)
+    assert not bucket.acquire(max_wait=0.1)
+    clock.now += 1.0
+    assert bucket.acquire(tokens=2)
+
+
+def test_circuit_opens_on_throttling_and_recovers_through_probe():
+    clock = FakeClock()
+    provider = FlakyProvider([RuntimeError("429 Too Many Requests")] * 2 + [TimeoutError("read timed out")])
+    guarded = GuardedProvider(
+        provider,
+        TokenBucket(rate=100, capacity=100, clock=clock, sleep=clock.sleep),
+        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+    )
+
+    for _ in range(2):
+        with pytest.raises(MarketDataRateLimitedError):
+            guarded.get_quote("AAPL")
+    assert guarded.breaker.state == CircuitBreaker.OPEN
+
+    # Open: fail fast without touching upstream
+    with pytest.raises(MarketDataCircuitOpenError) as excinfo:
+        guarded.get_quote("AAPL")
+    assert excinfo.value.retry_after == pytest.approx(30)
+    assert provider.calls == 2
+
+    # Half-open probe times out: open again
+    clock.now += 30
+    assert guarded.breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(MarketDataTimeoutError):
+        guarded.get_quote("AAPL")
+    assert guarded.breaker.state == CircuitBreaker.OPEN
+
+    # Next probe succeeds: closed
+    clock.now += 30
+    assert guarded.get_quote("AAPL").current_price == 1.0
+    assert guarded.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_admits_a_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+
+
+def test_non_throttling_errors_do_not_open_circuit():
+    clock = FakeClock()
+    provider = FlakyProvider([KeyError("currentTradingPeriod")] * 3)
+    guarded = GuardedProvider(
+        provider,
+        TokenBucket(rate=100, capacity=100, clock=clock, sleep=clock.sleep),
+        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+    )
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            guarded.get_quote("AAPL")
+    assert guarded.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_exhausted_budget_fails_fast():
+    clock = FakeClock()
+    guarded = GuardedProvider(
+        FixtureProvider(),
+        TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep),
+        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+        max_wait=0.0,
+    )
+    assert guarded.get_history("AAPL", date(2026, 1, 1)) == []
+    with pytest.raises(MarketDataRateLimitedError):
+        guarded.get_history("AAPL", date(2026, 1, 1))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+from backend.domain import Node, NodeRequest, SymbolInfo
+from backend.market_data import FixtureProvider, SymbolDirectory, set_market_data_provider, set_symbol_directory
+from backend.market_data.errors import MarketDataRateLimitedError
+from backend.repositories import DatabaseGraphRepository
+from backend.services import approval
+from backend.services.approval import approve_node_requests_batch
+from backend.services.validation_cache import SymbolValidationCache
+
+
+class _BatchCountingProvider(FixtureProvider):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def get_symbol_info(self, symbol):
+        raise AssertionError("single-symbol lookup in a batch submission")
+
+    def get_batch_symbol_info(self, symbols):
+        self.batches.append(list(symbols))
+        return super().get_batch_symbol_info(symbols)
+
+
+@pytest.fixture()
+def repository(monkeypatch, session_factory, db_session):
+    monkeypatch.setattr(approval, "symbol_validation_cache", SymbolValidationCache(session_factory=session_factory))
+    set_symbol_directory(SymbolDirectory({"AAPL": SymbolInfo("AAPL", "NASDAQ", "EQUITY", "Apple Inc.")}))
+    try:
+        yield DatabaseGraphRepository(db_session)
+    finally:
+        set_symbol_directory(None)
+        set_market_data_provider(None)
+
+
+def _request(node_id: str, node_type: str = "company") -> NodeRequest:
+    return NodeRequest(0, "user-1", "pending", node_id, node_type, node_id, f"About {node_id}")
+
+
+def test_batch_dedupes_and_validates_unknown_symbols_together(repository):
+    provider = _BatchCountingProvider(
+        infos={
+            "MSFT": SymbolInfo("MSFT", "NMS", "EQUITY", "Microsoft Corporation"),
+            "IBM": SymbolInfo("IBM", "NYQ", "EQUITY", "IBM"),
+        }
+    )
+    set_market_data_provider(provider)
+    repository.create_node(Node("NVDA", "company", "NVIDIA", "GPUs"))
+
+    decided, duplicates = approve_node_requests_batch(
+        [_request(s) for s in ("aapl", "MSFT", "IBM", "NVDA", "ZZZZ", " AAPL")] + [_request("ACME", "person")],
+        {"id": "user-1"},
+        repository,
+    )
+
+    assert duplicates == ["AAPL"]
+    assert provider.batches == [["MSFT", "IBM", "ZZZZ"]]
+    outcome = {request.node_id: (request.status, request.rejection_reason) for request in decided}
+    assert outcome == {
+        "AAPL": ("approved", None),
+        "MSFT": ("approved", None),
+        "IBM": ("rejected", "Stock symbol 'IBM' is listed on NYQ, not NASDAQ"),
+        "NVDA": ("rejected", "Node with ID 'NVDA' already exists"),
+        "ZZZZ": ("rejected", "Stock symbol 'ZZZZ' not found"),
+        "ACME": ("rejected", "Only 'company' type nodes are allowed. Requested type: 'person'"),
+    }
+    assert all(request.id > 0 for request in decided)
+    assert repository.get_node("MSFT").label == "Microsoft Corporation"
+    assert repository.get_existing_node_ids(["AAPL", "IBM", "ZZZZ"]) == {"AAPL"}
+
+    # Definitive results were cached: resubmitting needs no provider call
+    approve_node_requests_batch([_request("IBM")], {"id": "user-1"}, repository)
+    assert len(provider.batches) == 1
+
+
+def test_blank_ids_are_rejected_without_validation(repository):
+    provider = _BatchCountingProvider()
+    set_market_data_provider(provider)
+
+    decided, duplicates = approve_node_requests_batch([_request(""), _request("  "), _request("AAPL")], {"id": "user-1"}, repository)
+
+    assert duplicates == [""]
+    outcome = {request.node_id: (request.status, request.rejection_reason) for request in decided}
+    assert outcome == {"": ("rejected", "Stock symbol must be a non-empty string"), "AAPL": ("approved", None)}
+    assert provider.batches == []
+
+
+class _ThrottledProvider(_BatchCountingProvider):
+    def get_batch_symbol_info(self, symbols):
+        if self.batches:
+            self.batches.append(list(symbols))
+            raise MarketDataRateLimitedError("Market data request budget exhausted, please try again later.")
+        return super().get_batch_symbol_info(symbols)
+
+
+def test_undecided_symbols_stay_pending(repository, monkeypatch):
+    monkeypatch.setattr(approval, "PROVIDER_VALIDATION_BATCH_SIZE", 2)
+    provider = _ThrottledProvider(infos={"MSFT": SymbolInfo("MSFT", "NMS", "EQUITY", "Microsoft Corporation")})
+    set_market_data_provider(provider)
+
+    decided, _ = approve_node_requests_batch([_request(s) for s in ("MSFT", "ZZZZ", "NVDA", "AMD", "INTC")], {"id": "user-1"}, repository)
+
+    # The first throttled batch stops the lookups; the rest are left to the approval queue
+    assert provider.batches == [["MSFT", "ZZZZ"], ["NVDA", "AMD"]]
+    outcome = {request.node_id: request.status for request in decided}
+    assert outcome == {"MSFT": "approved", "ZZZZ": "rejected", "NVDA": "pending", "AMD": "pending", "INTC": "pending"}
+    assert repository.get_node_request(decided[2].id).status == "pending"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from backend.domain import PriceBar
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services.price_history import missing_range_start
+
+NEW_YORK = ZoneInfo("America/New_York")
+# Monday 2026-10-19, 18:00 New York: market closed, last session is that Monday
+MONDAY_EVENING = datetime(2026, 10, 19, 18, 0, tzinfo=NEW_YORK)
+
+
+@pytest.fixture()
+def repository(db_session):
+    return PriceHistoryRepository(db_session)
+
+
+def test_upsert_bars_overwrites_provisional_bar(repository):
+    repository.upsert_bars([
+        PriceBar("AAPL", date(2026, 10, 16), close=10.0),
+        PriceBar("AAPL", date(2026, 10, 19), close=11.0),
+    ])
+    repository.upsert_bars([PriceBar("AAPL", date(2026, 10, 19), close=12.5, volume=100)])
+
+    bars = repository.get_bars("AAPL", start=date(2026, 10, 1))
+    first, last, last_updated = repository.get_series_state("AAPL")
+
+    assert [(bar.date, bar.close) for bar in bars] == [(date(2026, 10, 16), 10.0), (date(2026, 10, 19), 12.5)]
+    assert (first, last) == (date(2026, 10, 16), date(2026, 10, 19))
+    # Stored as naive UTC, like the other timestamp columns
+    assert abs(last_updated.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds() < 60
+    assert repository.get_series_state("MSFT") == (None, None, None)
+
+
+def test_missing_range_start_fetches_only_trailing_days():
+    start = date(2026, 7, 11)
+    settled = datetime(2026, 10, 19, 21, 0, tzinfo=timezone.utc)  # written after the 16:00 close
+
+    # Empty store: full window
+    assert missing_range_start(None, None, None, start, MONDAY_EVENING) == start
+    # Behind by a few sessions: resume from the last stored bar
+    assert missing_range_start(start, date(2026, 10, 14), settled, start, MONDAY_EVENING) == date(2026, 10, 14)
+    # Last bar written intraday: re-fetch it once the session has closed
+    intraday = datetime(2026, 10, 19, 15, 0, tzinfo=timezone.utc)
+    assert missing_range_start(start, date(2026, 10, 19), intraday, start, MONDAY_EVENING) == date(2026, 10, 19)
+    # Up to date: no network
+    assert missing_range_start(start, date(2026, 10, 19), settled, start, MONDAY_EVENING) is None
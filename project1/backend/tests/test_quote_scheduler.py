@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from backend.domain import PriceBar
+from backend.market_data import FixtureProvider, set_market_data_provider
+from backend.services import sparklines, stock_data
+from backend.services.page_views import PageViewTracker
+from backend.services.quote_scheduler import QuoteRefreshScheduler
+
+
+def _daily_bars(symbol: str, days: int, base: float):
+    today = date.today()
+    return [
+        PriceBar(symbol, today - timedelta(days=offset), close=base + offset % 7, high=base + 10, low=base - 10)
+        for offset in range(days)
+    ]
+
+
+@pytest.fixture()
+def warm_env(monkeypatch, session_factory):
+    monkeypatch.setattr(stock_data, "SessionLocal", session_factory)
+    monkeypatch.setattr(sparklines, "SessionLocal", session_factory)
+    monkeypatch.setattr(sparklines, "_cached", None)
+    provider = FixtureProvider(bars={"AAPL": _daily_bars("AAPL", 400, 100.0), "MSFT": _daily_bars("MSFT", 10, 50.0)})
+    set_market_data_provider(provider)
+    stock_data._quote_cache.clear()
+    stock_data._compact_quote_cache.clear()
+    try:
+        yield
+    finally:
+        set_market_data_provider(None)
+        stock_data._quote_cache.clear()
+        stock_data._compact_quote_cache.clear()
+
+
+def test_page_views_rank_recent_views_first():
+    clock = [0.0]
+    views = PageViewTracker(half_life_seconds=60, clock=lambda: clock[0])
+    for _ in range(3):
+        views.record("MSFT")
+    clock[0] = 120  # two half-lives later MSFT's 3 views are worth 0.75
+    views.record("AAPL")
+
+    assert views.rank(["NVDA", "MSFT", "AAPL"]) == ["AAPL", "MSFT", "NVDA"]
+    assert views.score("MSFT") == pytest.approx(0.75)
+
+
+def test_refresh_warms_quote_caches(warm_env):
+    # Seed a year of AAPL history so its 52-week range is known locally
+    with stock_data.SessionLocal() as db:
+        stock_data.PriceHistoryRepository(db).upsert_bars(_daily_bars("AAPL", 400, 100.0))
+
+    scheduler = QuoteRefreshScheduler(batch_size=1, prefetch_charts=0, list_symbols=lambda: ["MSFT", "AAPL"])
+    assert asyncio.run(scheduler.refresh_once()) == 1
+
+    quote = stock_data._quote_cache.peek("AAPL")
+    assert quote["current_price"] == 100.0
+    assert (quote["week_52_low"], quote["week_52_high"]) == (90.0, 110.0)
+    # MSFT has under a year of history and no previous page quote: left to the lazy fetch
+    assert stock_data._quote_cache.peek("MSFT") is None
+    assert stock_data._compact_quote_cache.peek("MSFT")["price"] == 50.0
+
+
+def test_batch_refresh_backfills_from_the_last_stored_bar(warm_env):
+    # AAPL was last stored two weeks ago, outside the batch lookback window
+    with stock_data.SessionLocal() as db:
+        stock_data.PriceHistoryRepository(db).upsert_bars(_daily_bars("AAPL", 400, 100.0)[14:])
+    provider = stock_data.get_market_data_provider()
+    downloads = []
+    get_batch_history = provider.get_batch_history
+
+    def recording_batch_history(symbols, start):
+        downloads.append((list(symbols), start))
+        return get_batch_history(symbols, start)
+
+    provider.get_batch_history = recording_batch_history
+
+    stock_data.refresh_quotes(["AAPL", "MSFT"])
+
+    # Only AAPL is downloaded back to its last stored bar; MSFT shares the short window
+    window_start = date.today() - timedelta(days=stock_data._BATCH_LOOKBACK_DAYS)
+    assert downloads == [(["AAPL", "MSFT"], window_start), (["AAPL"], date.today() - timedelta(days=14))]
+
+    with stock_data.SessionLocal() as db:
+        stored = {bar.date for bar in stock_data.PriceHistoryRepository(db).get_bars("AAPL", date.today() - timedelta(days=30))}
+    assert stored == {date.today() - timedelta(days=offset) for offset in range(31)}
+
+
+def test_stream_polls_stay_in_memory(warm_env, monkeypatch):
+    def no_database():
+        raise AssertionError("stream polls must not touch the history store")
+
+    monkeypatch.setattr(stock_data, "SessionLocal", no_database)
+
+    quotes = stock_data.poll_quotes(["aapl", "MSFT"])
+
+    assert quotes["AAPL"]["price"] == 100.0
+    assert stock_data._compact_quote_cache.peek("MSFT")["price"] == 50.0
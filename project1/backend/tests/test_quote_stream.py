@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+
+from backend.services.quote_stream import QuoteStreamHub
+
+
+def _quote(symbol: str, price: float) -> dict:
+    return {'symbol': symbol, 'price': price, 'volume': 1, 'as_of': '2026-10-19'}
+
+
+def test_one_poll_serves_all_subscribers_and_skips_unchanged_ticks():
+    prices = {'AAPL': 100.0, 'MSFT': 50.0}
+    polls = []
+
+    def poll(symbols):
+        polls.append(list(symbols))
+        return {symbol: _quote(symbol, prices[symbol]) for symbol in symbols}
+
+    hub = QuoteStreamHub(poll=poll, interval=lambda: 3600)
+
+    async def main():
+        async with hub.subscribe('AAPL') as first, hub.subscribe('AAPL') as second, hub.subscribe('MSFT') as third:
+            await hub.poll_once()
+            assert polls[-1] == ['AAPL', 'MSFT']
+            assert (await first.get())['price'] == 100.0
+            assert (await second.get())['price'] == 100.0
+            assert (await third.get())['price'] == 50.0
+
+            # Unchanged quotes are not re-broadcast
+            await hub.poll_once()
+            assert first.empty() and third.empty()
+
+            prices['AAPL'] = 101.0
+            await hub.poll_once()
+            assert (await first.get())['price'] == 101.0
+            assert (await second.get())['price'] == 101.0
+            assert third.empty()
+
+            # A late subscriber is primed with the last tick
+            async with hub.subscribe('AAPL') as late:
+                assert (await late.get())['price'] == 101.0
+            assert hub.subscriber_count('AAPL') == 2
+        assert hub.symbols == []
+
+    asyncio.run(main())
+
+
+def test_poller_starts_on_first_subscription():
+
+    def poll(symbols):
+        return {symbol: _quote(symbol, 1.0) for symbol in symbols}
+
+    hub = QuoteStreamHub(poll=poll, interval=lambda: 3600)
+
+    async def main():
+        async with hub.subscribe('NVDA') as queue:
+            tick = await asyncio.wait_for(queue.get(), timeout=5)
+            assert tick['symbol'] == 'NVDA'
+
+    asyncio.run(main())
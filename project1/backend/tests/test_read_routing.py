@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine
+
+from backend.database.routing import ReadRouter
+
+
+def test_reads_use_primary_without_replicas():
+    primary = create_engine("sqlite://")
+    router = ReadRouter(primary)
+
+    router.mark_write("client")
+
+    assert router.engine_for_read("client") is primary
+    assert router.engine_for_read(None) is primary
+
+
+def test_recent_writer_sticks_to_primary():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    router = ReadRouter(primary, [replica], sticky_seconds=60)
+
+    router.mark_write("writer")
+
+    assert router.engine_for_read("writer") is primary
+    assert router.engine_for_read("reader") is replica
+
+
+def test_stickiness_expires():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    router = ReadRouter(primary, [replica], sticky_seconds=0)
+
+    router.mark_write("writer")
+
+    assert router.engine_for_read("writer") is replica
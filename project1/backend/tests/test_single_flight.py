@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flight.do, "AAPL", fetch)
+        assert started.wait(timeout=5)
+        followers = [pool.submit(flight.do, "AAPL", fetch) for _ in range(7)]
+        time.sleep(0.2)  # let followers reach the in-flight call
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == [42] * 8
+    assert len(calls) == 1
+    assert not flight.in_flight("AAPL")
+
+
+def test_errors_propagate_and_are_not_remembered():
+    flight: SingleFlight[int] = SingleFlight()
+
+    def boom() -> int:
+        raise RuntimeError("429 Too Many Requests")
+
+    with pytest.raises(RuntimeError):
+        flight.do("AAPL", boom)
+    assert flight.do("AAPL", lambda: 7) == 7
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from backend.domain import Node, PriceBar
+from backend.repositories import DatabaseGraphRepository
+from backend.repositories.price_history_repository import PriceHistoryRepository
+from backend.services import sparklines
+from backend.services.sparklines import build_sparkline, compute_sparklines, unpack_sparkline
+
+
+def _bars(symbol: str, days: int):
+    start = date.today() - timedelta(days=days)
+    return [PriceBar(symbol, start + timedelta(days=i), close=100.0 + i) for i in range(days)]
+
+
+def test_sparkline_keeps_endpoints_and_packs_float32():
+    bars = _bars("AAPL", 90)
+    values = unpack_sparkline(build_sparkline(bars, points=30))
+
+    assert values.dtype == np.float32 and len(values) == 30
+    assert (values[0], values[-1]) == (100.0, 189.0)
+    assert np.all(np.diff(values) > 0)
+    # Short series are passed through; a single bar is not a trend
+    assert len(unpack_sparkline(build_sparkline(bars[:5]))) == 5
+    assert build_sparkline(bars[:1]) is None
+
+
+@pytest.fixture()
+def store(monkeypatch, session_factory):
+    monkeypatch.setattr(sparklines, "SessionLocal", session_factory)
+    monkeypatch.setattr(sparklines, "_cached", None)
+    return session_factory
+
+
+def test_compute_sparklines_reads_the_local_store_by_node_id(store):
+    with store() as db:
+        PriceHistoryRepository(db).upsert_bars(_bars("MSFT", 60))
+
+    result = compute_sparklines(["msft", "NOHISTORY"], date.today() - timedelta(days=90))
+
+    assert list(result) == ["msft"]
+    assert len(unpack_sparkline(result["msft"])) == 30
+
+
+def test_sparklines_are_served_from_the_session_snapshot(store, monkeypatch):
+    with store() as db:
+        DatabaseGraphRepository(db).create_node(Node("MSFT", "company", "Microsoft", "Software"))
+        PriceHistoryRepository(db).upsert_bars(_bars("MSFT", 60)[:-1])
+    # Before the scheduler's first cycle the snapshot is computed on demand
+    first = sparklines.get_sparklines()
+    assert len(unpack_sparkline(first["MSFT"])) == 30
+
+    # The scheduler replaces an on-demand snapshot once, then keeps it for the session
+    with store() as db:
+        PriceHistoryRepository(db).upsert_bars([PriceBar("MSFT", date.today(), close=500.0)])
+    assert sparklines.refresh_sparklines(["MSFT"]) is True
+    assert sparklines.refresh_sparklines(["MSFT"]) is False
+
+    def no_database():
+        raise AssertionError("a snapshot hit must not touch the database")
+
+    monkeypatch.setattr(sparklines, "SessionLocal", no_database)
+    assert unpack_sparkline(sparklines.get_sparklines()["MSFT"])[-1] == 500.0
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from backend.services.market_hours import is_market_open, next_market_open
+from backend.services.stock_cache import StaleWhileRevalidateCache
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def test_fresh_entries_skip_the_loader():
+    calls = []
+    cache = StaleWhileRevalidateCache("test", ttl=lambda: 60, max_stale_seconds=60)
+
+    def loader():
+        calls.append(1)
+        return {"price": 1.0}
+
+    assert cache.get("AAPL", loader) == {"price": 1.0}
+    assert cache.get("AAPL", loader) == {"price": 1.0}
+    assert len(calls) == 1
+
+
+def test_stale_entries_are_served_and_refreshed_in_background():
+    values = iter([1.0, 2.0])
+    cache = StaleWhileRevalidateCache("test", ttl=lambda: 0, max_stale_seconds=60)
+    loader = lambda: next(values)  # noqa: E731
+
+    assert cache.get("AAPL", loader) == 1.0
+    assert cache.get("AAPL", loader) == 1.0  # stale value, refresh scheduled
+
+    deadline = time.monotonic() + 2
+    while cache.peek("AAPL") != 2.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.peek("AAPL") == 2.0
+
+
+def test_none_results_are_not_cached():
+    calls = []
+    cache = StaleWhileRevalidateCache("test", ttl=lambda: 60, max_stale_seconds=60)
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cache.get("NOPE", loader) is None
+    assert cache.get("NOPE", loader) is None
+    assert len(calls) == 2
+
+
+def test_market_hours_after_friday_close_wait_until_monday_open():
+    friday_evening = datetime(2026, 10, 16, 17, 0, tzinfo=NEW_YORK)
+
+    assert not is_market_open(friday_evening)
+    assert next_market_open(friday_evening) == datetime(2026, 10, 19, 9, 30, tzinfo=NEW_YORK)
+    assert is_market_open(datetime(2026, 10, 19, 10, 0, tzinfo=NEW_YORK))
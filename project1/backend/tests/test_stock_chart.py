@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.downsampling import lttb_indices
+from backend.services.stock_data import _build_stock_payload, resolve_chart_params
+
+QUOTE = {'current_price': 10.0}
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[437] = 50.0  # a single spike must survive downsampling
+    keep = lttb_indices(x, y, 40)
+
+    assert len(keep) == 40
+    assert keep[0] == 0 and keep[-1] == 999
+    assert 437 in keep
+    assert np.all(np.diff(keep) > 0)
+    assert list(lttb_indices(x[:5], y[:5], 40)) == [0, 1, 2, 3, 4]
+
+
+def test_payload_from_daily_frame():
+    hist = pd.DataFrame({'Close': [1.0, 2.0]}, index=pd.DatetimeIndex(['2026-10-15', '2026-10-16']))
+    payload = _build_stock_payload(QUOTE, hist)
+
+    assert payload['series'] == [{'dateLabel': 'Oct 15', 'price': 1.0}, {'dateLabel': 'Oct 16', 'price': 2.0}]
+    assert payload['chart_data'] == [{'time': '2026-10-15', 'value': 1.0}, {'time': '2026-10-16', 'value': 2.0}]
+
+
+def test_payload_downsamples_long_and_intraday_series():
+    index = pd.date_range('2026-10-16 09:30', periods=390, freq='min', tz='America/New_York')
+    hist = pd.DataFrame({'Close': np.linspace(1.0, 2.0, 390)}, index=index)
+    payload = _build_stock_payload(QUOTE, hist, interval='1m', max_points=100)
+
+    assert len(payload['chart_data']) == 100
+    assert payload['chart_data'][0]['time'] == int(index[0].timestamp())
+    assert payload['series'][-1] == {'dateLabel': 'Oct 16 15:59', 'price': 2.0}
+
+
+def test_payload_without_history_is_flat():
+    payload = _build_stock_payload(QUOTE, None)
+    assert len(payload['chart_data']) == 16
+    assert {point['value'] for point in payload['chart_data']} == {10.0}
+
+
+def test_resolve_chart_params():
+    assert resolve_chart_params(None, None) == ('3M', '1d')
+    assert resolve_chart_params('1d', None) == ('1D', '5m')
+    assert resolve_chart_params('5y', '1WK') == ('5Y', '1wk')
+    with pytest.raises(ValueError):
+        resolve_chart_params('1Y', '1m')
+    with pytest.raises(ValueError):
+        resolve_chart_params('10Y', None)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.market_data import SymbolDirectory, set_market_data_provider, set_symbol_directory
+from backend.services import approval
+
+NASDAQ_LISTED = """Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares
+AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N
+QQQ|Invesco QQQ Trust, Series 1|G|N|N|100|Y|N
+AAPLW|Apple Acquisition Corp - Warrant|S|N|N|100|N|N
+AAPLU|Apple Acquisition Corp - Unit|S|N|N|100|N|N
+AAPLR|Apple Acquisition Corp - Rights|S|N|N|100|N|N
+AAPLP|Apple Capital Corp - 7.00% Series A Cumulative Preferred Stock|G|N|N|100|N|N
+ZAZZT|Tick Pilot Test Stock Class A Common Stock|G|Y|N|100|N|N
+File Creation Time: 1019202608:01|||||||
+"""
+OTHER_LISTED = """ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol
+IBM|International Business Machines Corporation Common Stock|N|IBM|N|100|N|IBM
+SPY|SPDR S&P 500 ETF Trust|P|SPY|Y|100|N|SPY
+File Creation Time: 1019202608:01|||||||
+"""
+
+
+@pytest.fixture()
+def directory():
+    directory = SymbolDirectory.from_listing_files(NASDAQ_LISTED, OTHER_LISTED)
+    set_symbol_directory(directory)
+    try:
+        yield directory
+    finally:
+        set_symbol_directory(None)
+
+
+def test_parses_listing_files(directory):
+    assert len(directory) == 8  # test issue skipped
+    assert directory.lookup("aapl").exchange == "NASDAQ"
+    assert directory.lookup("QQQ").quote_type == "ETF"
+    assert directory.lookup("IBM").exchange == "NYSE"
+    assert directory.lookup("ZAZZT") is None
+
+
+def test_security_class_sets_the_type_and_is_dropped_from_the_name(directory):
+    assert (directory.lookup("AAPL").quote_type, directory.lookup("AAPL").name) == ("EQUITY", "Apple Inc.")
+    assert [directory.lookup(symbol).quote_type for symbol in ("AAPLW", "AAPLU", "AAPLR", "AAPLP")] == [
+        "WARRANT", "UNIT", "RIGHT", "PREFERRED"
+    ]
+    assert directory.lookup("AAPLW").name == "Apple Acquisition Corp"
+    # otherlisted.txt names have no separator and are kept whole
+    assert directory.lookup("IBM").name == "International Business Machines Corporation Common Stock"
+    assert approval.is_valid_nasdaq_stock("AAPLW") == (False, "Symbol 'AAPLW' is WARRANT, not a common stock")
+
+
+def test_save_round_trips_and_replaces_atomically(directory, tmp_path):
+    path = tmp_path / "symbols.json"
+    path.write_text("stale")
+    directory.save(path)
+
+    assert SymbolDirectory.from_file(path).lookup("SPY") == directory.lookup("SPY")
+    assert [p.name for p in tmp_path.iterdir()] == ["symbols.json"]
+
+
+class _NoNetworkProvider:
+    def get_symbol_info(self, symbol):
+        raise AssertionError(f"unexpected provider lookup for {symbol}")
+
+
+def test_validation_checks_the_directory_before_the_network(directory):
+    set_market_data_provider(_NoNetworkProvider())
+    try:
+        assert approval.is_valid_nasdaq_stock("AAPL") == (True, "Apple Inc.")
+        assert approval.is_valid_nasdaq_stock("QQQ") == (False, "Symbol 'QQQ' is ETF, not a common stock")
+        assert approval.is_valid_nasdaq_stock("IBM") == (False, "Stock symbol 'IBM' is listed on NYSE, not NASDAQ")
+    finally:
+        set_market_data_provider(None)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from backend.timing import ServerTimingMiddleware, stage
+
+def _app(engine, **middleware_options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware, **middleware_options)
+
+    @app.get("/work")
+    def work():
+        with stage("service"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+        with stage("serialize"):
+            return {"ok": True}
+
+    return app
+
+
+def _metrics(header: str) -> dict:
+    return {metric.split(";")[0]: metric for metric in header.split(", ")}
+
+
+def test_header_reports_stages_and_query_count(engine):
+    response = TestClient(_app(engine, slow_request_ms=10_000)).get("/work")
+
+    metrics = _metrics(response.headers["server-timing"])
+    assert list(metrics) == ["db", "service", "serialize", "total"]
+    assert metrics["db"].endswith('desc="2 queries"')
+
+    # Outside a request, stages and queries are not recorded anywhere
+    with stage("service"), engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def test_slow_requests_are_logged_with_the_breakdown(engine, caplog):
+    client = TestClient(_app(engine, enabled=False, slow_request_ms=0))
+    with caplog.at_level(logging.WARNING, logger="backend.timing"):
+        response = client.get("/work")
+
+    assert "server-timing" not in response.headers
+    assert "Slow request GET /work -> 200" in caplog.text
+    assert "db=" in caplog.text and "(2 queries)" in caplog.text
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from backend.domain import SymbolInfo
+from backend.market_data import FixtureProvider, set_market_data_provider
+from backend.services import approval
+from backend.services.validation_cache import SymbolValidationCache
+
+
+def test_positive_and_negative_results_expire_separately(session_factory):
+    now = [datetime(2026, 10, 19, 12, 0)]
+    cache = SymbolValidationCache(
+        valid_seconds=3600, invalid_seconds=60, session_factory=session_factory, clock=lambda: now[0]
+    )
+    cache.put("AAPL", (True, "Apple Inc."))
+    cache.put("ZZZZ", (False, "Stock symbol 'ZZZZ' not found"))
+
+    now[0] += timedelta(minutes=5)
+    assert cache.get("AAPL") == (True, "Apple Inc.")
+    assert cache.get("ZZZZ") is None
+
+    # A fresh process (empty in-memory layer) still sees the stored result
+    restarted = SymbolValidationCache(session_factory=session_factory, clock=lambda: now[0])
+    assert restarted.get("AAPL") == (True, "Apple Inc.")
+    now[0] += timedelta(hours=1)
+    assert restarted.get("AAPL") is None
+
+
+class _CountingProvider(FixtureProvider):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.lookups = 0
+
+    def get_symbol_info(self, symbol):
+        self.lookups += 1
+        if symbol == "BUSY":
+            raise RuntimeError("429 Too Many Requests")
+        return super().get_symbol_info(symbol)
+
+
+def test_repeated_submissions_resolve_from_the_cache(session_factory, monkeypatch):
+    monkeypatch.setattr(approval, "symbol_validation_cache", SymbolValidationCache(session_factory=session_factory))
+    provider = _CountingProvider(infos={"AAPL": SymbolInfo("AAPL", exchange="NMS", quote_type="EQUITY", name="Apple Inc.")})
+    set_market_data_provider(provider)
+    try:
+        for _ in range(3):
+            assert approval.is_valid_nasdaq_stock("aapl") == (True, "Apple Inc.")
+            assert approval.is_valid_nasdaq_stock("ZZZZ") == (False, "Stock symbol 'ZZZZ' not found")
+        assert provider.lookups == 2
+
+        # Transient failures are not cached
+        assert approval.is_valid_nasdaq_stock("BUSY")[0] is False
+        assert approval.is_valid_nasdaq_stock("BUSY")[0] is False
+        assert provider.lookups == 4
+    finally:
+        set_market_data_provider(None)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Attach a Server-Timing header to responses (the breakdown is logged for slow requests either way)
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+DB_STAGE = "db"
+
+
+def _queries(count: int) -> str:
+    return f"{count} {'query' if count == 1 else 'queries'}"
+
+
+class RequestTimings:
+    """
+    Per-request stage durations. Stages may nest (e.g. `service` includes the
+    `db` and `convert` time of the repository calls it makes). Shared with the
+    worker threads a request hands work to, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        # stage -> (total seconds, count)
+        self._stages: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            total, count = self._stages.get(name, (0.0, 0))
+            self._stages[name] = (total + seconds, count + 1)
+
+    def stages(self) -> List[Tuple[str, float, int]]:
+        """(name, milliseconds, count) in the order stages first finished."""
+        with self._lock:
+            return [(name, total * 1000, count) for name, (total, count) in self._stages.items()]
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def header_value(self, total_ms: float) -> str:
+        metrics = []
+        for name, ms, count in self.stages():
+            metric = f"{name};dur={ms:.1f}"
+            if name == DB_STAGE:
+                metric += f';desc="{_queries(count)}"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+    def summary(self) -> str:
+        parts = []
+        for name, ms, count in self.stages():
+            parts.append(f"{name}={ms:.1f}ms" + (f" ({_queries(count)})" if name == DB_STAGE else ""))
+        return ", ".join(parts) or "no stages"
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block as `name` in the current request (a no-op outside requests)."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info["timing_query_start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timings = _current.get()
+    started = conn.info.pop("timing_query_start", None)
+    if timings is not None and started is not None:
+        timings.add(DB_STAGE, time.perf_counter() - started)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that times each HTTP request by stage.
+
+    Repository, service and serialization code mark their stages with
+    `stage()`; SQL statements are counted and timed through engine events.
+    The breakdown goes into the `Server-Timing` response header and is logged
+    for requests slower than SLOW_REQUEST_MS. Durations are measured up to
+    the start of the response (streamed bodies are not included).
+    """
+
+    def __init__(self, app, enabled: bool = SERVER_TIMING_ENABLED, slow_request_ms: float = SLOW_REQUEST_MS) -> None:
+        self.app = app
+        self.enabled = enabled
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = timings.elapsed_ms()
+                if self.enabled:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.header_value(total_ms).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                if total_ms >= self.slow_request_ms:
+                    logger.warning(
+                        f"Slow request {scope['method']} {scope['path']} -> {message['status']} "
+                        f"in {total_ms:.1f}ms: {timings.summary()}"
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
@@ -123,6 +123,22 @@ export interface CreateRelationshipRequest {
   // created_datetime is auto-generated by backend
 }
 
+interface NodeRequestAccepted {
+  request_id: number;
+  status: string;
+}
+
+interface NodeRequestStatus {
+  id: number;
+  status: 'pending' | 'processing' | 'approved' | 'rejected';
+  node_id: string;
+  rejection_reason?: string | null;
+}
+
+const NODE_REQUEST_POLL_MS = 500;
+const NODE_REQUEST_TIMEOUT_MS = 30000;
+
+// Node creation is approved asynchronously: POST returns 202 with a request ID to poll
 export const createNode = async (data: CreateNodeRequest): Promise<NodeDetail | null> => {
   // Default type to "company" if not provided for backward compatibility
   const requestData = {
@@ -130,7 +146,7 @@ export const createNode = async (data: CreateNodeRequest): Promise<NodeDetail |
     type: data.type || 'company',
   };
 
-  return fetchWithErrorHandling<NodeDetail>(
+  const accepted = await fetchWithErrorHandling<NodeRequestAccepted>(
     buildApiUrl(API_ROUTES.createNode),
     {
       method: 'POST',
@@ -141,6 +157,23 @@ export const createNode = async (data: CreateNodeRequest): Promise<NodeDetail |
     },
     'Failed to create node. Please check your connection and try again.'
   );
+
+  const deadline = Date.now() + NODE_REQUEST_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, NODE_REQUEST_POLL_MS));
+    const request = await fetchWithErrorHandling<NodeRequestStatus>(
+      buildApiUrl(API_ROUTES.nodeRequest(accepted.request_id)),
+      {},
+      'Failed to check node request status.'
+    );
+    if (request.status === 'approved') {
+      return fetchNodeDetail(request.node_id);
+    }
+    if (request.status === 'rejected') {
+      throw new Error(request.rejection_reason || 'Node creation request was rejected');
+    }
+  }
+  throw new Error('Node request is still being reviewed. Check back shortly.');
 };
 
 export const createRelationship = async (data: CreateRelationshipRequest): Promise<CreateRelationshipRequest | null> => {
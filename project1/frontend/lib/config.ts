@@ -7,6 +7,7 @@ export const API_ROUTES = {
   stockData: (nodeId: string) => `/api/nodes/${encodeURIComponent(nodeId)}/stock`,
   search: '/api/search',
   createNode: '/api/nodes',
+  nodeRequest: (requestId: number) => `/api/node-requests/${requestId}`,
   updateNode: (nodeId: string) => `/api/nodes/${encodeURIComponent(nodeId)}`,
   deleteNode: (nodeId: string) => `/api/nodes/${encodeURIComponent(nodeId)}`,
   createRelationship: '/api/relationships',